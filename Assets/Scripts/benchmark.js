@@ -4,13 +4,78 @@
   let currentOs = 'windows';
   let summaryData = null;
   let detailData = null;
+  let manifest = null;
+  const entryLoads = {};
+  // Heavy manifest sections this page renders; the others are never fetched here.
+  const PAGE_SECTIONS = ['packRunner'];
 
-  function loadJson(url) {
-    return fetch(url, { cache: 'no-store' })
+  function loadJson(url, cacheMode) {
+    return fetch(url, { cache: cacheMode || 'no-store' })
       .then(function(res) { return res.ok ? res.json() : null; })
       .catch(function() { return null; });
   }
 
+  // Shards are content-hash named and never change, so the browser cache can keep them.
+  function loadShard(path) {
+    return loadJson('/data/' + path, 'force-cache');
+  }
+
+  // The manifest is only trusted when it is at least as new as every entry in the index.
+  function isManifestCurrent(result, index) {
+    if (!result?.entries) return false;
+    return (index?.entries || []).every(function(entry) {
+      const info = result.entries[String(entry.os || '').toLowerCase()]?.[String(entry.runMode || '').toLowerCase()];
+      return !!info && !(Date.parse(info.generatedUtc) < Date.parse(entry.generatedUtc));
+    });
+  }
+
+  function getManifestEntry(os, mode) {
+    return manifest?.entries?.[os]?.[mode] ?? null;
+  }
+
+  function loadFullData() {
+    manifest = null;
+    return Promise.all([
+      loadJson('/data/benchmark-summary.json'),
+      loadJson('/data/benchmark.json')
+    ]).then(function(results) {
+      summaryData = results[0];
+      detailData = results[1];
+    });
+  }
+
+  function loadEntry(os, mode) {
+    const info = getManifestEntry(os, mode);
+    if (!info) return Promise.resolve();
+    const key = os + ':' + mode;
+    if (!entryLoads[key]) {
+      const details = info.details || [];
+      entryLoads[key] = Promise.all([
+        loadShard(info.summary),
+        Promise.all(details.map(function(item) { return loadShard(item.path); })),
+        Promise.all(PAGE_SECTIONS.map(function(name) {
+          return info.sections?.[name] ? loadShard(info.sections[name]) : null;
+        }))
+      ]).then(function(results) {
+        const summary = results[0];
+        // A shard that cannot be fetched (e.g. pruned by a newer run) switches the page to the full JSON files.
+        if (!summary) return loadFullData();
+        PAGE_SECTIONS.forEach(function(name, i) {
+          if (results[2][i]) summary[name] = results[2][i];
+        });
+        const detail = Object.assign({}, summary, { comparisons: [], baseline: [] });
+        details.forEach(function(item, i) {
+          if (results[1][i]) detail[item.section].push(results[1][i]);
+        });
+        summaryData[os] = summaryData[os] || {};
+        detailData[os] = detailData[os] || {};
+        summaryData[os][mode] = summary;
+        detailData[os][mode] = detail;
+      });
+    }
+    return entryLoads[key];
+  }
+
   function escapeHtml(text) {
     if (!text) return '';
     return String(text).replace(/[&<>"']/g, function(m) {
@@ -73,6 +138,7 @@
   }
 
   function hasDataFor(os, mode) {
+    if (manifest) return !!getManifestEntry(os, mode)?.hasData;
     return hasEntryData(getEntry(summaryData, os, mode)) || hasEntryData(getEntry(detailData, os, mode));
   }
 
@@ -96,7 +162,7 @@
     return true;
   }
 
-  function findBestEntry(data) {
+  function findBestEntry() {
     // Priority: windows full > windows quick > linux full > linux quick > macos
     const order = [
       ['windows', 'full'], ['windows', 'quick'],
@@ -104,14 +170,13 @@
       ['macos', 'full'], ['macos', 'quick']
     ];
     for (let i = 0; i < order.length; i++) {
-      const entry = getEntry(data, order[i][0], order[i][1]);
-      if (hasEntryData(entry)) {
+      if (hasDataFor(order[i][0], order[i][1])) {
         currentOs = order[i][0];
         currentMode = order[i][1];
-        return entry;
+        return true;
       }
     }
-    return null;
+    return false;
   }
 
   function formatDate(isoString) {
@@ -317,7 +382,13 @@
 
       const ratingClass = 'bench-rating-' + (item.rating || 'unknown');
       const ratingIcon = getRatingIcon(item.rating);
-      html += '<td class="' + ratingClass + '" title="' + escapeHtml(item.rating || '') + '">' + ratingIcon + '</td>';
+      let ratingTitle = item.rating || '';
+      if (item.pareto) {
+        ratingTitle += item.pareto.onFrontier
+          ? ' (on the time/alloc Pareto frontier)'
+          : ' (' + item.pareto.gap + ' x from the Pareto frontier: ' + item.pareto.frontier.join(', ') + ')';
+      }
+      html += '<td class="' + ratingClass + '" title="' + escapeHtml(ratingTitle) + '">' + ratingIcon + '</td>';
       html += '</tr>';
     });
 
@@ -678,6 +749,14 @@
   }
 
   function renderAll() {
+    const os = currentOs;
+    const mode = currentMode;
+    loadEntry(os, mode).then(function() {
+      if (os === currentOs && mode === currentMode) renderView();
+    });
+  }
+
+  function renderView() {
     const summaryEntry = getEntry(summaryData, currentOs, currentMode);
     const detailEntry = getEntry(detailData, currentOs, currentMode);
     const entry = summaryEntry || detailEntry;
@@ -700,15 +779,22 @@
     if (!document.querySelector('.benchmark-page')) return;
 
     Promise.all([
-      loadJson('/data/benchmark-summary.json'),
-      loadJson('/data/benchmark.json')
-    ]).then(function(results) {
-      summaryData = results[0];
-      detailData = results[1];
-
+      loadJson('/data/benchmark-manifest.json'),
+      loadJson('/data/benchmark-index.json')
+    ]).then(function(loaded) {
+      const result = loaded[0];
+      if (isManifestCurrent(result, loaded[1])) {
+        // Sharded data: only the selected OS/mode is fetched.
+        manifest = result;
+        summaryData = {};
+        detailData = {};
+        return;
+      }
+      return loadFullData();
+    }).then(function() {
       // Find best available entry to set initial mode
       if (!applyUrlSelection()) {
-        findBestEntry(summaryData) || findBestEntry(detailData);
+        findBestEntry();
       }
 
       renderAll();
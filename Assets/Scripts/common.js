@@ -84,29 +84,71 @@ if (navToggle) {
 
 // Benchmark summary renderer
 (function() {
+  const SUMMARY_ORDER = [
+    ['windows', 'quick'],
+    ['windows', 'full'],
+    ['linux', 'quick'],
+    ['linux', 'full'],
+    ['macos', 'quick'],
+    ['macos', 'full']
+  ];
   let benchSummaryPromise = null;
+  function loadBenchmarkJson(url, cacheMode) {
+    return fetch(url, { cache: cacheMode || 'no-store' })
+      .then(function(res) { return res.ok ? res.json() : null; })
+      .catch(function() { return null; });
+  }
+
+  // The manifest is only trusted when it is at least as new as every entry in the index.
+  function isManifestCurrent(manifest, index) {
+    if (!manifest || !manifest.entries) return false;
+    var entries = (index && index.entries) || [];
+    for (var i = 0; i < entries.length; i++) {
+      var entry = entries[i];
+      var os = String(entry.os || '').toLowerCase();
+      var info = manifest.entries[os] && manifest.entries[os][String(entry.runMode || '').toLowerCase()];
+      if (!info || Date.parse(info.generatedUtc) < Date.parse(entry.generatedUtc)) return false;
+    }
+    return true;
+  }
+
+  function loadManifestSummary(manifest) {
+    for (var i = 0; i < SUMMARY_ORDER.length; i++) {
+      var os = SUMMARY_ORDER[i][0];
+      var mode = SUMMARY_ORDER[i][1];
+      var info = manifest.entries[os] && manifest.entries[os][mode];
+      if (!info || !info.hasData || !info.summary) continue;
+      // Shards are content-hash named and never change, so the browser cache can keep them.
+      return loadBenchmarkJson('/data/' + info.summary, 'force-cache').then(function(entry) {
+        var data = {};
+        data[os] = {};
+        data[os][mode] = entry;
+        return entry ? data : null;
+      });
+    }
+    return Promise.resolve(null);
+  }
+
   function loadBenchmarkSummary() {
     if (!benchSummaryPromise) {
-      benchSummaryPromise = fetch('/data/benchmark-summary.json', { cache: 'no-store' })
-        .then(function(res) { return res.ok ? res.json() : null; })
-        .catch(function() { return null; });
+      benchSummaryPromise = Promise.all([
+        loadBenchmarkJson('/data/benchmark-manifest.json'),
+        loadBenchmarkJson('/data/benchmark-index.json')
+      ]).then(function(results) {
+        var shard = isManifestCurrent(results[0], results[1]) ? loadManifestSummary(results[0]) : Promise.resolve(null);
+        return shard.then(function(data) {
+          return pickBenchmarkSummary(data) ? data : loadBenchmarkJson('/data/benchmark-summary.json');
+        });
+      });
     }
     return benchSummaryPromise;
   }
 
   function pickBenchmarkSummary(data) {
     if (!data) return null;
-    var order = [
-      ['windows', 'quick'],
-      ['windows', 'full'],
-      ['linux', 'quick'],
-      ['linux', 'full'],
-      ['macos', 'quick'],
-      ['macos', 'full']
-    ];
-    for (var i = 0; i < order.length; i++) {
-      var os = order[i][0];
-      var mode = order[i][1];
+    for (var i = 0; i < SUMMARY_ORDER.length; i++) {
+      var os = SUMMARY_ORDER[i][0];
+      var mode = SUMMARY_ORDER[i][1];
       var entry = data && data[os] && data[os][mode];
       if (entry && entry.summary && entry.summary.length) return entry;
     }
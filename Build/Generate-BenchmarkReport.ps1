@@ -12,7 +12,10 @@
     [switch]$AllowPartial,
     [switch]$Publish,
     [switch]$NoPublish,
-    [switch]$FailOnMissingCompare
+    [switch]$FailOnMissingCompare,
+    [string]$Budgets,
+    [switch]$NoBudgets,
+    [switch]$AllowBudgetBreach
 )
 
 $ErrorActionPreference = "Stop"
@@ -22,6 +25,16 @@ function Write-TextUtf8NoBom([string]$path, [string]$value) {
     [System.IO.File]::WriteAllText($path, $value, $encoding)
 }
 
+function Get-PythonCommand {
+    foreach ($candidate in @(@("python3"), @("python"), @("py", "-3"))) {
+        if (-not (Get-Command $candidate[0] -ErrorAction SilentlyContinue)) { continue }
+        $probe = @($candidate | Select-Object -Skip 1) + @("-c", "import sys; sys.exit(0 if sys.version_info >= (3, 10) else 1)")
+        & $candidate[0] @probe 2>$null
+        if ($LASTEXITCODE -eq 0) { return $candidate }
+    }
+    return $null
+}
+
 if ([string]::IsNullOrWhiteSpace($OutputPath)) {
     $OutputPath = Join-Path $PSScriptRoot "..\BENCHMARK.md"
 }
@@ -1258,3 +1271,32 @@ $template = @(
 ) -join "`n"
 
 Write-TextUtf8NoBom $OutputPath $template
+
+# Performance budgets are evaluated by the Python generator; run its check-budgets gate so this path fails on a breach too.
+if (-not $NoBudgets) {
+    $budgetsPath = if ([string]::IsNullOrWhiteSpace($Budgets)) { Join-Path $PSScriptRoot "benchmark-budgets.json" } else { $Budgets }
+    $reportScript = Join-Path $PSScriptRoot "generate-benchmark-report.py"
+    $python = Get-PythonCommand
+    if (-not (Test-Path $budgetsPath)) {
+        Write-Warning "Performance budgets not checked (budget file not found: $budgetsPath)."
+    } elseif ($python -and (Test-Path $reportScript)) {
+        $budgetArgs = @($python | Select-Object -Skip 1) + @(
+            $reportScript,
+            "check-budgets",
+            "--artifacts-path", $ArtifactsPath,
+            "--os-name", $osName,
+            "--run-mode", $runModeNormalized,
+            "--framework", $Framework,
+            "--budgets", $budgetsPath
+        )
+        if ($AllowBudgetBreach) {
+            $budgetArgs += "--allow-budget-breach"
+        }
+        & $python[0] @budgetArgs
+        if ($LASTEXITCODE -ne 0) {
+            throw "Performance budget check failed."
+        }
+    } else {
+        Write-Warning "Performance budgets not checked (Python 3.10+ not found or report script missing)."
+    }
+}
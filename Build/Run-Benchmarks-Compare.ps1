@@ -10,6 +10,9 @@ param(
     [switch]$Full,
     [switch]$AllowPartial,
     [switch]$SkipPreflight,
+    [switch]$CpuProfile,
+    [switch]$Disasm,
+    [switch]$FailOnRegression,
     [string]$BaseFilter = "*",
     [string]$CompareFilter = "*Compare*"
 )
@@ -36,6 +39,23 @@ $timestamp = Get-Date -Format "yyyyMMdd-HHmmss"
 $artifactsPath = Join-Path $ArtifactsRoot "$os-$timestamp"
 New-Item -ItemType Directory -Force -Path $artifactsPath | Out-Null
 
+function Get-CommandOutput([string]$command, [string[]]$arguments) {
+    try {
+        $output = & $command @arguments 2>$null
+        if ($LASTEXITCODE -eq 0 -and $output) { return "$output".Trim() }
+    } catch {
+    }
+    return $null
+}
+
+$runInfo = [ordered]@{
+    commit = Get-CommandOutput "git" @("-C", $repoRoot, "rev-parse", "HEAD")
+    branch = Get-CommandOutput "git" @("-C", $repoRoot, "rev-parse", "--abbrev-ref", "HEAD")
+    machineName = [System.Environment]::MachineName
+    dotnetSdk = Get-CommandOutput "dotnet" @("--version")
+}
+$runInfo | ConvertTo-Json | Set-Content -Path (Join-Path $artifactsPath "run-info.json") -Encoding UTF8
+
 $benchQuick = -not $Full
 $runMode = if ($benchQuick) { "quick" } else { "full" }
 $quickProps = @()
@@ -110,7 +130,11 @@ function Invoke-Benchmark {
         $args += $MsBuildProps
     }
 
-    $args += @("--", "--filter", $Filter, "--artifacts", $artifactsPath)
+    # Space separated filters become separate --filter values (BenchmarkDotNet ORs them).
+    $args += @("--", "--filter") + @($Filter -split '\s+' | Where-Object { $_ }) + @("--artifacts", $artifactsPath, "--exporters", "json")
+    if ($CpuProfile) {
+        $args += @("--profiler", "EP")
+    }
     & dotnet @args
     if ($EnvVars) {
         foreach ($key in $EnvVars.Keys) {
@@ -200,7 +224,7 @@ function Invoke-PackRunner {
         if ($MsBuildProps) {
             $args += $MsBuildProps
         }
-        $args += @("--", "--pack-runner", "--mode", $runMode, "--format", "json", "--reports-dir", $reportsDir)
+        $args += @("--", "--pack-runner", "--mode", $runMode, "--format", "json,csv", "--reports-dir", $reportsDir)
         & dotnet @args
         if ($LASTEXITCODE -ne 0) {
             throw "dotnet run failed: $Label"
@@ -217,7 +241,9 @@ try {
     $packProps = @()
     $packEnvVars = @{}
     if (-not $NoBase) {
-        Invoke-Benchmark -MsBuildProps $quickProps -Filter $BaseFilter -Label "Baseline (CodeGlyphX only)" -EnvVars $quickEnv
+        $baseProps = @($quickProps)
+        if ($Disasm) { $baseProps += "/p:BenchDisasm=true" }
+        Invoke-Benchmark -MsBuildProps $baseProps -Filter $BaseFilter -Label "Baseline (CodeGlyphX only)" -EnvVars $quickEnv
         $packProps = @($quickProps)
         foreach ($key in $quickEnv.Keys) { $packEnvVars[$key] = $quickEnv[$key] }
     }
@@ -272,11 +298,38 @@ try {
     Pop-Location
 }
 
-$reportScript = Join-Path $PSScriptRoot "Generate-BenchmarkReport.ps1"
-if (Test-Path $reportScript) {
+function Get-PythonCommand {
+    foreach ($candidate in @(@("python3"), @("python"), @("py", "-3"))) {
+        if (-not (Get-Command $candidate[0] -ErrorAction SilentlyContinue)) { continue }
+        $probe = @($candidate | Select-Object -Skip 1) + @("-c", "import sys; sys.exit(0 if sys.version_info >= (3, 10) else 1)")
+        & $candidate[0] @probe 2>$null
+        if ($LASTEXITCODE -eq 0) { return $candidate }
+    }
+    return $null
+}
+
+$reportScript = Join-Path $PSScriptRoot "generate-benchmark-report.py"
+$python = Get-PythonCommand
+if ($python -and (Test-Path $reportScript)) {
+    $reportArgs = @($python | Select-Object -Skip 1) + @(
+        $reportScript,
+        "--artifacts-path", $artifactsPath,
+        "--framework", $Framework,
+        "--configuration", $Configuration,
+        "--run-mode", $runMode
+    )
     if ($AllowPartial) {
-        & $reportScript -ArtifactsPath $artifactsPath -Framework $Framework -Configuration $Configuration -RunMode $runMode -AllowPartial
+        $reportArgs += "--allow-partial"
     } else {
-        & $reportScript -ArtifactsPath $artifactsPath -Framework $Framework -Configuration $Configuration -RunMode $runMode -FailOnMissingCompare
+        $reportArgs += "--fail-on-missing-compare"
+    }
+    if ($FailOnRegression) {
+        $reportArgs += "--fail-on-regression"
+    }
+    & $python[0] @reportArgs
+    if ($LASTEXITCODE -ne 0) {
+        throw "Benchmark report generation failed."
     }
+} else {
+    Write-Warning "Skipping BENCHMARK.md generation (Python 3.10+ not found or report script missing)."
 }
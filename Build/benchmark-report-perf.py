@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for generate-benchmark-report.py and the benchmark_report package.
+
+Builds synthetic artifact trees (compare CSVs x scenarios x vendors, large pack-runner JSON/CSV and a fully
+populated benchmark.json), then measures wall time and peak traced memory of main() and its stages at several
+scale factors. Runs offline with the standard library only; the generator and its package are copied into a scratch
+repo root so the real Assets/Data and BENCHMARK.md are never touched.
+"""
+import argparse
+import csv
+import datetime as dt
+import importlib.util
+import json
+import math
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+GENERATOR_PATH = Path(__file__).resolve().parent / "generate-benchmark-report.py"
+PACKAGE_PATH = Path(__file__).resolve().parent / "benchmark_report"
+VENDORS = ("CodeGlyphX", "ZXing.Net", "QRCoder", "Barcoder")
+PACK_ENGINES = (("CodeGlyphX", False), ("ZXing.Net", True))
+PACK_CSV_HEADER = [
+    "dateUtc", "mode", "pack", "packCategory", "packDescription", "packGuidance", "engine", "isExternal", "scenario",
+    "width", "height", "runs", "opsPerIteration", "decodeRate", "expectedRate", "medianMs", "p95Ms", "avgDecodedCount",
+    "expected", "options", "diagScaleMedian", "diagThresholdMedian", "diagInvertRate", "diagCandidateMedian",
+    "diagTriplesMedian", "diagDimensionMedian", "diagSuccessRate", "diagTopFailure",
+]
+CSV_HEADER = ["Method", "Job", "Runtime", "IterationCount", "WarmupCount", "Mean", "Error", "StdDev", "Median", "Rank", "Gen0", "Gen1", "Gen2", "Allocated"]
+# A stage whose time grows faster than scale ** SUPERLINEAR_EXPONENT is reported as superlinear.
+SUPERLINEAR_EXPONENT = 1.2
+
+
+def load_generator(scratch_root: Path):
+    build_dir = scratch_root / "Build"
+    build_dir.mkdir(parents=True, exist_ok=True)
+    target = build_dir / GENERATOR_PATH.name
+    shutil.copy2(GENERATOR_PATH, target)
+    shutil.copytree(PACKAGE_PATH, build_dir / PACKAGE_PATH.name, ignore=shutil.ignore_patterns("__pycache__"))
+    for name in [name for name in sys.modules if name == PACKAGE_PATH.name or name.startswith(PACKAGE_PATH.name + ".")]:
+        del sys.modules[name]
+    sys.path.insert(0, str(build_dir))
+    try:
+        spec = importlib.util.spec_from_file_location("generate_benchmark_report", target)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(build_dir))
+    members = {}
+    for name in sorted(sys.modules):
+        if name.startswith(PACKAGE_PATH.name + "."):
+            members.update(vars(sys.modules[name]))
+    members["main"] = module.main
+    return types.SimpleNamespace(**members)
+
+
+def format_ns(value: float) -> str:
+    if value >= 1e6:
+        return f"{value / 1e6:,.3f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:,.3f} μs"
+    return f"{value:,.2f} ns"
+
+
+def format_bytes(value: float) -> str:
+    return f"{value / 1024:,.2f} KB" if value >= 1024 else f"{int(value)} B"
+
+
+def write_report_csv(path: Path, rows):
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for method, mean_ns, allocated in rows:
+            writer.writerow(
+                [
+                    method, "Job-Perf", ".NET 8.0", "3", "1", format_ns(mean_ns), format_ns(mean_ns * 0.04),
+                    format_ns(mean_ns * 0.03), format_ns(mean_ns * 0.98), "1", f"{allocated / 50000:.4f}", "-", "-",
+                    format_bytes(allocated),
+                ]
+            )
+
+
+def build_artifacts(gen, root: Path, compare_files: int, scenarios: int, pack_scenarios: int, rng: random.Random):
+    results = root / "results"
+    results.mkdir(parents=True, exist_ok=True)
+    compare_ids = gen.expected_compare_ids()
+    compare_ids += [f"Synthetic{index}CompareBenchmarks" for index in range(max(0, compare_files - len(compare_ids)))]
+    for compare_id in compare_ids[:compare_files]:
+        rows = [
+            (f"{vendor} Scenario {index}", rng.uniform(5e4, 5e6), rng.uniform(2e3, 8e5))
+            for index in range(scenarios)
+            for vendor in VENDORS
+        ]
+        write_report_csv(results / f"{gen.BENCH_PREFIX}{compare_id}-report.csv", rows)
+    baseline_rows = [(f"QR Encode (scenario {index})", rng.uniform(1e4, 1e6), rng.uniform(1e3, 1e5)) for index in range(scenarios)]
+    write_report_csv(results / f"{gen.BENCH_PREFIX}QrCodeBenchmarks-report.csv", baseline_rows)
+
+    pack_dir = root / "pack-runner"
+    pack_dir.mkdir(parents=True, exist_ok=True)
+    packs = [f"pack{index}" for index in range(max(1, pack_scenarios // 250))]
+    per_pack = max(1, pack_scenarios // len(packs))
+    json_packs = []
+    with (pack_dir / "qr-decode-packs-quick.csv").open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(PACK_CSV_HEADER)
+        for pack in packs:
+            engines = []
+            for engine, is_external in PACK_ENGINES:
+                items = []
+                for index in range(per_pack):
+                    size = rng.choice((256, 512, 1024, 2400))
+                    rate = rng.choice((1.0, 1.0, 0.75, 0.5))
+                    median = rng.uniform(1, 200)
+                    p95 = median * rng.uniform(1.1, 2.0)
+                    name = f"{pack}-s{index}"
+                    items.append({"Name": name, "Width": size, "Height": size, "Runs": 3, "DecodeRate": rate, "ExpectedRate": rate, "MedianMs": median, "P95Ms": p95})
+                    writer.writerow(
+                        [
+                            "2026-01-01T00:00:00Z", "quick", pack, "synthetic", "", "", engine, str(is_external).lower(), name,
+                            size, size, 3, 1, rate, rate, f"{median:.3f}", f"{p95:.3f}", 1, "any", "", 2, 128, 0.1, 10, 5, 25, rate, "",
+                        ]
+                    )
+                engines.append({"Name": engine, "IsExternal": is_external, "Runs": 3 * per_pack, "DecodeRate": 0.9, "ExpectedRate": 0.9, "MedianMs": 10, "P95Ms": 20, "Scenarios": items})
+            json_packs.append({"Name": pack, "ScenarioCount": per_pack, "Engines": engines})
+    (pack_dir / "qr-decode-packs-quick.json").write_text(json.dumps({"DateUtc": "2026-01-01T00:00:00Z", "Mode": "quick", "Packs": json_packs}), encoding="utf-8")
+
+
+def seed_existing_data(gen, json_path: Path, payload: dict):
+    """Fill every OS/mode block so benchmark.json is as large as a fully populated site."""
+    payloads = []
+    for os_name in gen.OS_NAMES:
+        for run_mode in gen.RUN_MODES:
+            clone = dict(payload, os=os_name, runMode=run_mode)
+            payloads.append(clone)
+    gen.write_json(json_path, payloads)
+    return gen.load_json_document(json_path)
+
+
+def measure(fn, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": statistics.median(timings), "minSeconds": min(timings), "peakBytes": peak}
+
+
+def run_scale(scale: int, args, rng: random.Random):
+    scratch = Path(tempfile.mkdtemp(prefix="benchmark-report-perf-"))
+    try:
+        gen = load_generator(scratch)
+        artifacts = scratch / "artifacts"
+        build_artifacts(gen, artifacts, args.compare_files, args.scenarios * scale, args.pack_scenarios * scale, rng)
+        data_dir = scratch / "Assets" / "Data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        json_path = data_dir / "benchmark.json"
+        md_path = scratch / "BENCHMARK.md"
+
+        run = gen.ingest_artifacts(artifacts, "linux", "quick")
+        meta = gen.build_run_meta(gen.build_meta(None, None, None, None), run.environment, run.run_info)
+        payload = gen.build_payload(run, "net8.0", "Release", False, meta)
+        data = seed_existing_data(gen, json_path, payload)
+        section = gen.build_section(run, "net8.0", "Release")
+
+        def write_json_stage():
+            payload["generatedUtc"] = dt.datetime.now(dt.timezone.utc).isoformat()
+            gen.write_json(json_path, [payload], data)
+
+        def main_stage():
+            argv = sys.argv
+            sys.argv = [
+                str(scratch / "Build" / GENERATOR_PATH.name), "--artifacts-path", str(artifacts), "--os-name", "linux",
+                "--run-mode", "quick", "--allow-partial", "--no-history", "--no-cache", "--jobs", "1", "--output", str(md_path),
+            ]
+            try:
+                gen.main()
+            finally:
+                sys.argv = argv
+
+        stages = {
+            "ingest_artifacts": lambda: gen.ingest_artifacts(artifacts, "linux", "quick"),
+            "build_summary": lambda: gen.build_summary(run.results.comparisons),
+            "build_section": lambda: gen.build_section(run, "net8.0", "Release"),
+            "build_payload": lambda: gen.build_payload(run, "net8.0", "Release", False, meta),
+            "write_json": write_json_stage,
+            "update_sections": lambda: gen.update_sections(md_path, {("linux", "quick"): section}),
+            "write_website_shards": lambda: gen.write_website_shards(data_dir, data),
+            "main": main_stage,
+        }
+        results = {name: measure(fn, args.repeat) for name, fn in stages.items() if not args.stage or name in args.stage}
+        input_bytes = sum(path.stat().st_size for path in artifacts.rglob("*") if path.is_file())
+        return {
+            "scale": scale,
+            "scenariosPerCompare": args.scenarios * scale,
+            "packScenarios": args.pack_scenarios * scale,
+            "inputBytes": input_bytes,
+            "benchmarkJsonBytes": json_path.stat().st_size,
+            "stages": results,
+        }
+    finally:
+        if args.keep:
+            print(f"Kept scratch tree: {scratch}")
+        else:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+
+def growth_exponent(points):
+    """Log-log slope of seconds vs scale between the smallest and largest scale (1.0 = linear)."""
+    (low_scale, low), (high_scale, high) = points[0], points[-1]
+    if high_scale <= low_scale or low <= 0 or high <= 0:
+        return None
+    return math.log(high / low) / math.log(high_scale / low_scale)
+
+
+def summarize(runs):
+    stage_names = list(runs[0]["stages"].keys())
+    summary = {}
+    for name in stage_names:
+        points = [(run["scale"], run["stages"][name]["seconds"]) for run in runs]
+        exponent = growth_exponent(points) if len(points) > 1 else None
+        summary[name] = {"growthExponent": round(exponent, 3) if exponent is not None else None, "superlinear": bool(exponent and exponent > SUPERLINEAR_EXPONENT)}
+    return summary
+
+
+def print_report(runs, summary):
+    scales = [run["scale"] for run in runs]
+    header = "| Stage | " + " | ".join(f"x{scale} time | x{scale} peak" for scale in scales) + " | Growth |"
+    print(header)
+    print("| --- | " + " | ".join("--- | ---" for _ in scales) + " | --- |")
+    for name, info in summary.items():
+        cells = []
+        for run in runs:
+            stage = run["stages"][name]
+            cells.append(f"{stage['seconds'] * 1000:.1f} ms | {stage['peakBytes'] / (1024 * 1024):.1f} MB")
+        exponent = info["growthExponent"]
+        growth = "n/a" if exponent is None else f"n^{exponent:.2f}" + (" (superlinear)" if info["superlinear"] else "")
+        print(f"| {name} | " + " | ".join(cells) + f" | {growth} |")
+    for run in runs:
+        print(f"x{run['scale']}: inputs {run['inputBytes'] / (1024 * 1024):.1f} MB, benchmark.json {run['benchmarkJsonBytes'] / (1024 * 1024):.1f} MB")
+
+
+def compare_with_baseline(report: dict, baseline_path: Path, max_slowdown: float):
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8-sig"))
+    previous = {(run["scale"], name): stage["seconds"] for run in baseline.get("runs", []) for name, stage in run["stages"].items()}
+    failures = []
+    for run in report["runs"]:
+        for name, stage in run["stages"].items():
+            prior = previous.get((run["scale"], name))
+            if prior and stage["seconds"] > prior * (1 + max_slowdown):
+                failures.append(f"x{run['scale']} {name}: {prior * 1000:.1f} ms -> {stage['seconds'] * 1000:.1f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how generate-benchmark-report.py scales with artifact volume.")
+    parser.add_argument("--scales", default="1,2,4", help="comma separated scale factors applied to scenarios and pack scenarios")
+    parser.add_argument("--compare-files", type=int, default=12)
+    parser.add_argument("--scenarios", type=int, default=10, help="scenarios per compare CSV at scale 1 (x4 vendors)")
+    parser.add_argument("--pack-scenarios", type=int, default=1000, help="pack-runner scenarios per engine at scale 1")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stage", action="append", default=[], help="only measure the named stage (repeatable)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json-output", default=None)
+    parser.add_argument("--baseline", default=None, help="previous --json-output to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=0.5, help="allowed relative slowdown vs --baseline")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch trees for inspection")
+    args = parser.parse_args()
+
+    scales = sorted({int(value) for value in args.scales.split(",") if value.strip()})
+    if not scales or scales[0] < 1:
+        parser.error("--scales must contain positive integers")
+
+    rng = random.Random(args.seed)
+    runs = [run_scale(scale, args, rng) for scale in scales]
+    summary = summarize(runs)
+    print_report(runs, summary)
+
+    report = {
+        "generatedUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "settings": {"compareFiles": args.compare_files, "scenarios": args.scenarios, "packScenarios": args.pack_scenarios, "repeat": args.repeat},
+        "maxRssBytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024) if resource else None,
+        "runs": runs,
+        "summary": summary,
+    }
+    if args.json_output:
+        Path(args.json_output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        failures = compare_with_baseline(report, Path(args.baseline), args.max_slowdown)
+        if failures:
+            raise SystemExit(f"Report generator slowed down: {'; '.join(failures)}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,589 @@
+import math
+import re
+
+from .common import format_duration_ns, format_signed_duration_ns, vendor_sort_key
+from .results import BenchmarkReport, BenchmarkRow, RunResults
+
+
+SCALING_SIZE_PATTERN = re.compile(r"\b(short|medium|long)\b(?: text)?")
+# UTF-8 byte lengths of ShortText/MediumText/LongText in the benchmark classes; keep in sync.
+SCALING_INPUT_BYTES = {
+    "QrCodeBenchmarks": {"short": 13, "medium": 38, "long": 156},
+    "QrPipelineBenchmarks": {"short": 13, "medium": 38, "long": 156},
+    "MatrixCodeBenchmarks": {"medium": 21, "long": 65},
+    "QrCompareBenchmarks": {"short": 13, "medium": 38, "long": 156},
+}
+SCALING_UNITS = (("byte", "input_bytes"), ("module", "output_modules"), ("pixel", "output_pixels"))
+SCALING_SUPERLINEAR_EXPONENT = 1.15
+SCALING_SUBLINEAR_EXPONENT = 0.85
+HISTOGRAM_GLYPHS = "▁▂▃▄▅▆▇█"
+RATING_PROFILES = {
+    "balanced": {"time": 0.5, "alloc": 0.5},
+    "latency-bound": {"time": 0.8, "alloc": 0.2},
+    "gc-bound": {"time": 0.3, "alloc": 0.7},
+}
+DEFAULT_RATING_PROFILE = "balanced"
+PIPELINE_DECOMPOSITIONS = {
+    "QrCompareBenchmarks": {
+        "pipeline": "QrPipelineBenchmarks",
+        "scenarios": {"QR PNG (medium)": "medium"},
+        "stages": {
+            "encode": "QR Encode ({size} text)",
+            "pixels": "QR Render Pixels ({size}, pre-encoded)",
+            "png": "QR Render PNG ({size}, pre-encoded)",
+        },
+    },
+}
+DECOMPOSITION_STAGES = (("encode", "█"), ("rasterize", "▓"), ("compress", "▒"), ("other", "░"))
+DECOMPOSITION_BAR_WIDTH = 20
+
+
+def rate_performance(time_ratio: float | None, alloc_ratio: float | None) -> str:
+    if time_ratio is None:
+        return "unknown"
+    if alloc_ratio is not None:
+        if time_ratio <= 1.1 and alloc_ratio <= 1.25:
+            return "good"
+        if time_ratio <= 1.5 and alloc_ratio <= 2.0:
+            return "ok"
+        return "bad"
+    if time_ratio <= 1.1:
+        return "good"
+    if time_ratio <= 1.5:
+        return "ok"
+    return "bad"
+
+
+def describe_rating(profile: str) -> str:
+    if profile == "fastest":
+        return "Rating: good/ok/bad based on time + allocation ratios (good <=1.1x and <=1.25x alloc, ok <=1.5x and <=2.0x alloc)."
+    weights = RATING_PROFILES[profile]
+    return (
+        f"Rating ({profile}, {weights['time']:.0%} time / {weights['alloc']:.0%} alloc): good when CodeGlyphX is on the time/alloc "
+        "Pareto frontier or within 1.1x of it, ok within 1.5x, bad otherwise. The gap is measured against the closest frontier vendor."
+    )
+
+
+def pareto_frontier(vendors: dict):
+    points = {vendor: entry for vendor, entry in vendors.items() if entry.mean_ns}
+    use_alloc = all(entry.allocated_bytes for entry in points.values())
+
+    def key(entry):
+        return (entry.mean_ns, entry.allocated_bytes if use_alloc else 0.0)
+
+    frontier = []
+    for vendor, entry in points.items():
+        time_value, alloc_value = key(entry)
+        dominated = any(
+            other_time <= time_value and other_alloc <= alloc_value and (other_time, other_alloc) != (time_value, alloc_value)
+            for other_time, other_alloc in (key(other) for name, other in points.items() if name != vendor)
+        )
+        if not dominated:
+            frontier.append(vendor)
+    return sorted(frontier, key=lambda vendor: points[vendor].mean_ns), use_alloc
+
+
+def analyze_pareto(vendors: dict):
+    frontier, use_alloc = pareto_frontier(vendors)
+    cgx = vendors.get("CodeGlyphX")
+    if not frontier or not cgx or not cgx.mean_ns:
+        return None
+    on_frontier = "CodeGlyphX" in frontier
+
+    def ratios(reference):
+        time_ratio = cgx.mean_ns / reference.mean_ns
+        alloc_ratio = cgx.allocated_bytes / reference.allocated_bytes if use_alloc else 1.0
+        return time_ratio, alloc_ratio
+
+    gap = 1.0 if on_frontier else min(max(ratios(vendors[vendor])) for vendor in frontier)
+    profiles = {}
+    for name, weights in RATING_PROFILES.items():
+        best = None
+        for vendor in frontier:
+            time_ratio, alloc_ratio = ratios(vendors[vendor])
+            weighted = max(1.0, time_ratio) ** weights["time"] * max(1.0, alloc_ratio) ** weights["alloc"]
+            if best is None or weighted < best[1]:
+                best = (vendor, weighted)
+        profiles[name] = {"reference": best[0], "gap": round(1.0 if on_frontier else best[1], 3)}
+    return {
+        "frontier": frontier,
+        "usesAllocation": use_alloc,
+        "onFrontier": on_frontier,
+        "gap": round(gap, 3),
+        "profiles": profiles,
+    }
+
+
+def rate_pareto(pareto: dict | None, profile: str) -> str:
+    if not pareto:
+        return "unknown"
+    gap = pareto["profiles"][profile]["gap"]
+    if gap <= 1.1:
+        return "good"
+    if gap <= 1.5:
+        return "ok"
+    return "bad"
+
+
+def format_pareto(pareto: dict | None, profile: str) -> str:
+    if not pareto:
+        return ""
+    if pareto["onFrontier"]:
+        return "frontier"
+    selected = pareto["profiles"].get(profile) or {"gap": pareto["gap"], "reference": pareto["frontier"][0]}
+    return f"{selected['gap']:.2f} x off ({selected['reference']})"
+
+
+def build_summary(comparisons: list[BenchmarkReport], rating_profile: str = DEFAULT_RATING_PROFILE):
+    summary_rows = []
+    summary_items = []
+    for report in comparisons:
+        title = report.title
+        for scenario in sorted(report.scenarios.keys()):
+            vendors = report.scenarios[scenario]
+            fastest_vendor = None
+            fastest = None
+            for vendor, entry in vendors.items():
+                if not entry.mean_ns:
+                    continue
+                if fastest is None or entry.mean_ns < fastest.mean_ns:
+                    fastest = entry
+                    fastest_vendor = vendor
+            if not fastest_vendor:
+                continue
+            cgx = vendors.get("CodeGlyphX")
+            ratio_value = None
+            ratio_text = ""
+            alloc_ratio_value = None
+            alloc_ratio_text = ""
+            cgx_mean = ""
+            cgx_alloc = ""
+            if cgx and cgx.mean_ns:
+                ratio_value = round(cgx.mean_ns / fastest.mean_ns, 2)
+                ratio_text = f"{ratio_value} x"
+                cgx_mean = cgx.mean
+                cgx_alloc = cgx.allocated
+                if fastest.allocated_bytes and cgx.allocated_bytes:
+                    alloc_ratio_value = round(cgx.allocated_bytes / fastest.allocated_bytes, 2)
+                    alloc_ratio_text = f"{alloc_ratio_value} x"
+            pareto = analyze_pareto(vendors)
+            if rating_profile == "fastest":
+                rating = rate_performance(ratio_value, alloc_ratio_value)
+            else:
+                rating = rate_pareto(pareto, rating_profile)
+            summary_rows.append(
+                f"| {title} | {scenario} | {fastest_vendor} {fastest.mean} | {ratio_text} | {alloc_ratio_text} | {rating} | "
+                f"{format_pareto(pareto, rating_profile)} | {cgx_mean} | {cgx_alloc} |"
+            )
+            summary_items.append(
+                {
+                    "benchmark": title,
+                    "scenario": scenario,
+                    "fastestVendor": fastest_vendor,
+                    "fastestMean": fastest.mean,
+                    "codeGlyphXMean": cgx_mean,
+                    "codeGlyphXAlloc": cgx_alloc,
+                    "codeGlyphXVsFastest": ratio_value,
+                    "codeGlyphXVsFastestText": ratio_text,
+                    "codeGlyphXAllocVsFastest": alloc_ratio_value,
+                    "codeGlyphXAllocVsFastestText": alloc_ratio_text,
+                    "rating": rating,
+                    "ratingProfile": rating_profile,
+                    "pareto": pareto,
+                }
+            )
+    return summary_rows, summary_items
+
+
+def build_pareto_section(lines, summary_items: list[dict]):
+    items = [item for item in summary_items if item.get("pareto")]
+    if not items:
+        return
+    profile_names = list(RATING_PROFILES)
+    lines.append("### Pareto frontier (time vs allocation)")
+    lines.append("")
+    lines.append("Frontier vendors are not beaten on both mean time and allocation by any other vendor. Gap is the factor CodeGlyphX must improve by to reach the closest frontier vendor; profiles weight time vs allocation.")
+    lines.append("")
+    lines.append("| Benchmark | Scenario | Frontier | CodeGlyphX | Gap | " + " | ".join(f"Gap ({name})" for name in profile_names) + " |")
+    lines.append("| --- | --- | --- | --- | --- | " + " | ".join("---" for _ in profile_names) + " |")
+    for item in items:
+        pareto = item["pareto"]
+        status = "on frontier" if pareto["onFrontier"] else "dominated"
+        if not pareto["usesAllocation"]:
+            status += " (time only)"
+        profiles = " | ".join(
+            f"{pareto['profiles'][name]['gap']:.2f} x ({pareto['profiles'][name]['reference']})" for name in profile_names
+        )
+        lines.append(f"| {item['benchmark']} | {item['scenario']} | {', '.join(pareto['frontier'])} | {status} | {pareto['gap']:.2f} x | {profiles} |")
+    lines.append("")
+
+
+def build_baseline_section(lines, baseline: list[BenchmarkReport]):
+    if not baseline:
+        return
+    lines.append("### Baseline")
+    lines.append("")
+    for report in baseline:
+        lines.append(f"#### {report.title}")
+        lines.append("")
+        lines.append("| Scenario | Mean | Allocated |")
+        lines.append("| --- | --- | --- |")
+        for row in report.rows:
+            lines.append(f"| {row.scenario} | {row.mean} | {row.allocated} |")
+        lines.append("")
+
+
+def build_comparison_section(lines, comparisons: list[BenchmarkReport]):
+    if not comparisons:
+        return
+    lines.append("### Comparisons")
+    lines.append("")
+    for report in comparisons:
+        lines.append(f"#### {report.title}")
+        lines.append("")
+        lines.append(
+            "| Scenario | CodeGlyphX (Mean / Alloc) | ZXing.Net (Mean / Alloc) | QRCoder (Mean / Alloc) | Barcoder (Mean / Alloc) |"
+        )
+        lines.append("| --- | --- | --- | --- | --- |")
+
+        for scenario in sorted(report.scenarios.keys()):
+            group = report.scenarios[scenario]
+
+            def cell(vendor):
+                item = group.get(vendor)
+                if not item:
+                    return ""
+                return f"{item.mean}<br>{item.allocated}"
+
+            lines.append(
+                f"| {scenario} | {cell('CodeGlyphX')} | {cell('ZXing.Net')} | {cell('QRCoder')} | {cell('Barcoder')} |"
+            )
+        lines.append("")
+
+
+def format_histogram(histogram: dict | None) -> str:
+    if not histogram:
+        return ""
+    counts = histogram["counts"]
+    peak = max(counts) or 1
+    glyphs = []
+    for count in counts:
+        if not count:
+            glyphs.append(" ")
+            continue
+        level = -(-count * len(HISTOGRAM_GLYPHS) // peak) - 1
+        glyphs.append(HISTOGRAM_GLYPHS[level])
+    return "".join(glyphs)
+
+
+def build_distribution_section(lines, results: RunResults):
+    reports = results.baseline + results.comparisons
+    rows = [(report, row) for report in reports for row in report.rows if row.distribution]
+    if not rows:
+        return
+    lines.append("### Latency distribution")
+    lines.append("")
+    lines.append("Per-operation times from BenchmarkDotNet measurements (JSON exporter). Outliers use Tukey fences (1.5 x IQR); the histogram spans min..max.")
+    lines.append("")
+    lines.append("| Benchmark | Scenario | Vendor | Median | P90 | P95 | P99 | Min | Max | Outliers (low/high) | Histogram |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for report, row in rows:
+        dist = row.distribution
+        outliers = ""
+        if dist.get("lowerOutliers") is not None:
+            outliers = f"{dist['lowerOutliers']}/{dist['upperOutliers']}"
+        lines.append(
+            f"| {report.title} | {row.scenario} | {row.vendor} | {format_duration_ns(dist.get('medianNs'))} | "
+            f"{format_duration_ns(dist.get('p90Ns'))} | {format_duration_ns(dist.get('p95Ns'))} | {format_duration_ns(dist.get('p99Ns'))} | "
+            f"{format_duration_ns(dist.get('minNs'))} | {format_duration_ns(dist.get('maxNs'))} | {outliers} | `{format_histogram(dist.get('histogram'))}` |"
+        )
+    lines.append("")
+
+
+def format_rate(value: float | None, suffix: str = "") -> str:
+    if value is None:
+        return ""
+    for unit, scale in (("G", 1_000_000_000.0), ("M", 1_000_000.0), ("k", 1000.0)):
+        if abs(value) >= scale:
+            return f"{value / scale:,.2f} {unit}{suffix}"
+    return f"{value:,.2f} {suffix}".rstrip()
+
+
+def build_throughput_section(lines, results: RunResults):
+    reports = [report for report in results.baseline + results.comparisons if any(row.mean_ns for row in report.rows)]
+    if not reports:
+        return
+    lines.append("### Throughput")
+    lines.append("")
+    lines.append("- Ops/s per core: 1 / mean (benchmarks run single-threaded, so this is per-core capacity).")
+    lines.append("- Alloc rate: allocated bytes per operation x ops/s. GC/1k ops: BenchmarkDotNet Gen0 collections per 1000 operations (includes Gen1/Gen2).")
+    lines.append("- Alloc/pixel and Alloc/module appear when the benchmark CSV carries OutputPixels/OutputModules columns.")
+    lines.append("")
+    for report in reports:
+        has_sizes = any(row.output_pixels or row.output_modules for row in report.rows)
+        has_threading = any(row.completed_work_items is not None or row.lock_contentions is not None for row in report.rows)
+        lines.append(f"#### {report.title}")
+        lines.append("")
+        header = "| Scenario | Vendor | Ops/s per core | Alloc rate | GC/1k ops (Gen0/Gen1/Gen2) | GC/s |"
+        divider = "| --- | --- | --- | --- | --- | --- |"
+        if has_sizes:
+            header += " Alloc/pixel | Alloc/module |"
+            divider += " --- | --- |"
+        if has_threading:
+            header += " Work items/op | Lock contentions/op |"
+            divider += " --- | --- |"
+        lines.append(header)
+        lines.append(divider)
+        for row in sorted(report.rows, key=lambda item: (item.scenario, vendor_sort_key(item.vendor))):
+            metrics = row.throughput()
+            if not metrics:
+                continue
+            gens = [row.gen0_per_1k, row.gen1_per_1k, row.gen2_per_1k]
+            gc_text = "/".join("" if value is None else f"{value:g}" for value in gens) if any(value is not None for value in gens) else ""
+            line = (
+                f"| {row.scenario} | {row.vendor} | {format_rate(metrics['opsPerSecondPerCore'])} | "
+                f"{format_rate(metrics['allocatedBytesPerSecond'], 'B/s')} | {gc_text} | "
+                f"{'' if metrics['gcPerSecond'] is None else metrics['gcPerSecond']} |"
+            )
+            if has_sizes:
+                line += (
+                    f" {'' if metrics['allocatedPerPixel'] is None else metrics['allocatedPerPixel']} |"
+                    f" {'' if metrics['allocatedPerModule'] is None else metrics['allocatedPerModule']} |"
+                )
+            if has_threading:
+                line += f" {metrics.get('completedWorkItemsPerOp', '')} | {metrics.get('lockContentionsPerOp', '')} |"
+            lines.append(line)
+        lines.append("")
+
+
+def fit_scaling(points: list[tuple[float, float]]):
+    count = len(points)
+    mean_x = sum(x for x, _ in points) / count
+    mean_y = sum(y for _, y in points) / count
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    logs = [(math.log(x), math.log(y)) for x, y in points]
+    mean_lx = sum(lx for lx, _ in logs) / count
+    mean_ly = sum(ly for _, ly in logs) / count
+    exponent = sum((lx - mean_lx) * (ly - mean_ly) for lx, ly in logs) / sum((lx - mean_lx) ** 2 for lx, _ in logs)
+    return slope, mean_y - slope * mean_x, exponent
+
+
+def analyze_scaling(results: RunResults):
+    items = []
+    for report in results.baseline + results.comparisons:
+        families: dict[str, list[tuple[BenchmarkRow, str | None]]] = {}
+        for row in report.rows:
+            if row.vendor != "CodeGlyphX" or not row.mean_ns:
+                continue
+            match = SCALING_SIZE_PATTERN.search(row.scenario)
+            family = SCALING_SIZE_PATTERN.sub("{size}", row.scenario, count=1) if match else row.scenario
+            families.setdefault(family, []).append((row, match.group(1) if match else None))
+        known_bytes = SCALING_INPUT_BYTES.get(report.id, {})
+        for family, members in families.items():
+            if len(members) < 2:
+                continue
+            for unit, attribute in SCALING_UNITS:
+                points = []
+                for row, size in members:
+                    value = getattr(row, attribute)
+                    if value is None and unit == "byte" and size:
+                        value = known_bytes.get(size)
+                    if not value:
+                        break
+                    points.append((float(value), row.mean_ns, row.scenario))
+                if len(points) != len(members) or len({x for x, _, _ in points}) < 2:
+                    continue
+                points.sort()
+                slope, fixed, exponent = fit_scaling([(x, y) for x, y, _ in points])
+                if exponent > SCALING_SUPERLINEAR_EXPONENT:
+                    status = "superlinear"
+                elif exponent < SCALING_SUBLINEAR_EXPONENT:
+                    status = "sublinear"
+                else:
+                    status = "linear"
+                items.append(
+                    {
+                        "benchmark": report.title,
+                        "benchmarkId": report.id,
+                        "family": family,
+                        "vendor": "CodeGlyphX",
+                        "unit": unit,
+                        "points": [{"scenario": scenario, "size": x, "meanNs": round(y, 3)} for x, y, scenario in points],
+                        "nsPerUnit": round(slope, 4),
+                        "fixedNs": round(fixed, 3),
+                        "exponent": round(exponent, 3),
+                        "nsPerUnitAtLargest": round(points[-1][1] / points[-1][0], 4),
+                        "status": status,
+                    }
+                )
+    return items
+
+
+def build_scaling_section(lines, scaling: list[dict]):
+    if not scaling:
+        return
+    lines.append("### Scaling")
+    lines.append("")
+    lines.append(
+        "Scenarios that differ only by input size are fitted as mean = fixed + slope x size (per byte of payload, module or pixel). "
+        f"Exponent is the log-log growth; above {SCALING_SUPERLINEAR_EXPONENT:g} is flagged superlinear, below {SCALING_SUBLINEAR_EXPONENT:g} means fixed costs dominate."
+    )
+    lines.append("")
+    lines.append("| Benchmark | Family | Unit | Points | ns/unit (fit) | Fixed | ns/unit at largest | Exponent | Status |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in scaling:
+        sizes = ", ".join(f"{point['size']:g}" for point in item["points"])
+        status = f"**{item['status']}**" if item["status"] == "superlinear" else item["status"]
+        lines.append(
+            f"| {item['benchmark']} | {item['family']} | {item['unit']} | {sizes} | {format_signed_duration_ns(item['nsPerUnit'])} | "
+            f"{format_signed_duration_ns(item['fixedNs'])} | {format_duration_ns(item['nsPerUnitAtLargest'])} | {item['exponent']:.2f} | {status} |"
+        )
+    lines.append("")
+
+
+def split_pipeline_cost(total: float | None, encode: float | None, pixels: float | None, png: float | None):
+    if total is None or encode is None or png is None:
+        return None
+    rasterize = pixels if pixels is not None else png
+    compress = png - pixels if pixels is not None else 0.0
+    return {"encode": encode, "rasterize": rasterize, "compress": compress, "other": total - encode - png}
+
+
+def analyze_pipeline_decomposition(results: RunResults):
+    baseline = {report.id: report for report in results.baseline}
+    decompositions = []
+    for report in results.comparisons:
+        spec = PIPELINE_DECOMPOSITIONS.get(report.id)
+        pipeline = baseline.get(spec["pipeline"]) if spec else None
+        if not pipeline:
+            continue
+        stage_rows = {row.scenario: row for row in pipeline.rows}
+        for scenario, size in spec["scenarios"].items():
+            vendors = report.scenarios.get(scenario) or {}
+            end_to_end = vendors.get("CodeGlyphX")
+            rows = {stage: stage_rows.get(name.format(size=size)) for stage, name in spec["stages"].items()}
+            if not end_to_end or not end_to_end.mean_ns or not rows["encode"] or not rows["png"]:
+                continue
+            separable = bool(rows["pixels"] and rows["pixels"].mean_ns and rows["pixels"].mean_ns <= rows["png"].mean_ns)
+            times = split_pipeline_cost(
+                end_to_end.mean_ns, rows["encode"].mean_ns, rows["pixels"].mean_ns if separable else None, rows["png"].mean_ns
+            )
+            allocations = split_pipeline_cost(
+                end_to_end.allocated_bytes,
+                rows["encode"].allocated_bytes,
+                rows["pixels"].allocated_bytes if separable else None,
+                rows["png"].allocated_bytes,
+            )
+            if times is None:
+                continue
+            stages = []
+            for stage, _ in DECOMPOSITION_STAGES:
+                allocated = allocations[stage] if allocations else None
+                stages.append(
+                    {
+                        "stage": stage,
+                        "meanNs": round(times[stage], 3),
+                        "share": round(times[stage] / end_to_end.mean_ns, 4),
+                        "allocatedBytes": round(allocated, 1) if allocated is not None else None,
+                        "allocShare": round(allocated / end_to_end.allocated_bytes, 4) if allocated is not None and end_to_end.allocated_bytes else None,
+                    }
+                )
+            fastest_vendor, fastest = min(
+                ((vendor, row) for vendor, row in vendors.items() if row.mean_ns), key=lambda item: item[1].mean_ns
+            )
+            gap = end_to_end.mean_ns - fastest.mean_ns
+            decompositions.append(
+                {
+                    "benchmark": report.title,
+                    "scenario": scenario,
+                    "pipeline": spec["pipeline"],
+                    "meanNs": end_to_end.mean_ns,
+                    "allocatedBytes": end_to_end.allocated_bytes,
+                    "separable": separable,
+                    "stages": stages,
+                    "fastest": {"vendor": fastest_vendor, "meanNs": fastest.mean_ns},
+                    "gapNs": round(gap, 3),
+                    "closesGap": [item["stage"] for item in stages if gap > 0 and item["stage"] != "other" and item["meanNs"] >= gap],
+                }
+            )
+    return decompositions
+
+
+def format_decomposition_bar(stages: list[dict]) -> str:
+    positive = [(stage, max(item["meanNs"], 0.0)) for item, (stage, _) in zip(stages, DECOMPOSITION_STAGES)]
+    total = sum(value for _, value in positive)
+    if total <= 0:
+        return ""
+    glyphs = dict(DECOMPOSITION_STAGES)
+    return "".join(glyphs[stage] * round(value / total * DECOMPOSITION_BAR_WIDTH) for stage, value in positive)
+
+
+def build_decomposition_section(lines, decompositions: list[dict]):
+    if not decompositions:
+        return
+    lines.append("### Encode vs render decomposition")
+    lines.append("")
+    legend = ", ".join(f"{glyph} {stage}" for stage, glyph in DECOMPOSITION_STAGES)
+    lines.append(
+        "CodeGlyphX end-to-end compare means split using the pipeline benchmarks: encode, rasterize (Render Pixels), "
+        f"PNG compress (Render PNG - Render Pixels) and other (unattributed remainder, may be negative). Bar: {legend}."
+    )
+    lines.append("")
+    lines.append("| Benchmark | Scenario | End-to-end | Encode | Rasterize | PNG compress | Other | Breakdown | Gap to fastest | Stage alone exceeds gap |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in decompositions:
+        cells = []
+        for stage in item["stages"]:
+            alloc = f" / {stage['allocShare'] * 100:.0f}% alloc" if stage["allocShare"] is not None else ""
+            cells.append(f"{format_signed_duration_ns(stage['meanNs'])} ({stage['share'] * 100:.0f}%{alloc})")
+        if not item["separable"]:
+            cells[1] += " (whole render)"
+            cells[2] = "n/a (PNG path skips the RGBA buffer)"
+        gap = f"{format_duration_ns(item['gapNs'])} vs {item['fastest']['vendor']}" if item["gapNs"] > 0 else "fastest"
+        lines.append(
+            f"| {item['benchmark']} | {item['scenario']} | {format_duration_ns(item['meanNs'])} | " + " | ".join(cells)
+            + f" | `{format_decomposition_bar(item['stages'])}` | {gap} | {', '.join(item['closesGap']) or '—'} |"
+        )
+    lines.append("")
+
+
+def build_baseline_payload(baseline: list[BenchmarkReport]):
+    items = []
+    for report in baseline:
+        scenarios = [
+            {
+                "name": row.scenario,
+                "mean": row.mean,
+                "meanNs": row.mean_ns,
+                "errorNs": row.error_ns,
+                "stdDevNs": row.stddev_ns,
+                "allocated": row.allocated,
+                **({"distribution": row.distribution} if row.distribution else {}),
+                "throughput": row.throughput(),
+            }
+            for row in report.rows
+        ]
+        items.append({"id": report.id, "title": report.title, "scenarios": scenarios})
+    return items
+
+
+def build_comparisons_payload(comparisons: list[BenchmarkReport]):
+    items = []
+    for report in comparisons:
+        scenarios = []
+        for scenario in sorted(report.scenarios.keys()):
+            vendors = report.scenarios[scenario]
+            entry = {"name": scenario, "vendors": {key: value.to_vendor_payload() for key, value in vendors.items()}}
+            cgx = vendors.get("CodeGlyphX")
+            if cgx and cgx.mean_ns:
+                ratios = {}
+                for key, value in vendors.items():
+                    if key == "CodeGlyphX":
+                        continue
+                    if value.mean_ns:
+                        ratios[key] = round(value.mean_ns / cgx.mean_ns, 3)
+                entry["ratios"] = ratios
+            scenarios.append(entry)
+        items.append({"id": report.id, "title": report.title, "scenarios": scenarios})
+    return items
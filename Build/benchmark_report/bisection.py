@@ -0,0 +1,309 @@
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from .common import BUILD_DIR, RUN_MODES, atomic_write_text, format_duration_ns
+from .results import load_run_results
+
+
+DEFAULT_BISECT_DIR = BUILD_DIR / ".benchmark-bisect"
+DEFAULT_BISECT_THRESHOLD = 0.10
+BISECT_GOOD, BISECT_BAD, BISECT_SKIP, BISECT_ABORT = 0, 1, 125, 128
+BENCHMARK_PROJECT = Path("CodeGlyphX.Benchmarks") / "CodeGlyphX.Benchmarks.csproj"
+
+
+def run_git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def bisect_settings_key(benchmark_filter: str, framework: str, run_mode: str) -> str:
+    return hashlib.sha256(f"{benchmark_filter}\0{framework}\0{run_mode}".encode("utf-8")).hexdigest()[:12]
+
+
+def bisect_result_path(cache_dir: Path, commit: str, key: str) -> Path:
+    return cache_dir / "results" / f"{commit}-{key}.json"
+
+
+def load_bisect_result(cache_dir: Path, commit: str, key: str):
+    path = bisect_result_path(cache_dir, commit, key)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def measure_commit(repo: Path, cache_dir: Path, benchmark_filter: str, framework: str, run_mode: str):
+    commit = run_git(repo, "rev-parse", "HEAD")
+    key = bisect_settings_key(benchmark_filter, framework, run_mode)
+    cached = load_bisect_result(cache_dir, commit, key)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+
+    result = {
+        "commit": commit,
+        "filter": benchmark_filter,
+        "framework": framework,
+        "runMode": run_mode,
+        "measuredUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "status": "ok",
+        "reason": None,
+        "means": {},
+    }
+    project = repo / BENCHMARK_PROJECT
+    artifacts = cache_dir / "artifacts" / f"{commit[:12]}-{key}"
+    if not project.exists():
+        result.update(status="skip", reason=f"{BENCHMARK_PROJECT} not found")
+    else:
+        if artifacts.exists():
+            for stale in artifacts.rglob("*-report*"):
+                stale.unlink()
+        env = dict(os.environ, BENCH_QUICK="true" if run_mode == "quick" else "false")
+        command = ["dotnet", "run", "-c", "Release", "--framework", framework, "--project", str(project)]
+        if run_mode == "quick":
+            command.append("/p:BenchQuick=true")
+        if "Compare" in benchmark_filter:
+            command.append("/p:CompareExternal=true")
+            env["COMPARE_EXTERNAL"] = "true"
+        command += ["--", "--filter", *benchmark_filter.split(), "--artifacts", str(artifacts), "--exporters", "json"]
+        print(f"Measuring {commit[:10]}: {' '.join(command)}", flush=True)
+        completed = subprocess.run(command, cwd=repo, env=env)
+        results_path = artifacts / "results"
+        if completed.returncode != 0:
+            result.update(status="skip", reason=f"dotnet exited with {completed.returncode}")
+        elif not results_path.exists():
+            result.update(status="skip", reason="no BenchmarkDotNet results")
+        else:
+            results = load_run_results(results_path)
+            for report in results.baseline + results.comparisons:
+                for row in report.rows:
+                    if row.mean_ns:
+                        result["means"][f"{report.id}/{row.method}"] = {"meanNs": row.mean_ns, "errorNs": row.error_ns}
+            if not result["means"]:
+                result.update(status="skip", reason="filter matched no benchmarks")
+    cache_dir.joinpath("results").mkdir(parents=True, exist_ok=True)
+    atomic_write_text(bisect_result_path(cache_dir, commit, key), json.dumps(result, indent=2))
+    result["cached"] = False
+    return result
+
+
+def compare_bisect_means(reference: dict, result: dict, methods: list[str], threshold: float):
+    needles = [method.lower() for method in methods]
+    deltas = []
+    for name, current in sorted(result["means"].items()):
+        if needles and not any(needle in name.lower() for needle in needles):
+            continue
+        previous = reference["means"].get(name)
+        if not previous:
+            continue
+        delta = current["meanNs"] / previous["meanNs"] - 1.0
+        deltas.append(
+            {
+                "name": name,
+                "referenceNs": previous["meanNs"],
+                "meanNs": current["meanNs"],
+                "delta": round(delta, 4),
+                "regressed": delta > threshold,
+            }
+        )
+    return deltas
+
+
+def run_bisect_step(argv):
+    parser = argparse.ArgumentParser(prog="generate-benchmark-report.py bisect-step")
+    parser.add_argument("--repo", required=True)
+    parser.add_argument("--cache-dir", required=True)
+    parser.add_argument("--filter", required=True)
+    parser.add_argument("--framework", required=True)
+    parser.add_argument("--run-mode", required=True, choices=RUN_MODES)
+    parser.add_argument("--good-commit", required=True)
+    parser.add_argument("--method", action="append", default=[])
+    parser.add_argument("--threshold", type=float, required=True)
+    args = parser.parse_args(argv)
+
+    repo = Path(args.repo)
+    cache_dir = Path(args.cache_dir)
+    reference = load_bisect_result(cache_dir, args.good_commit, bisect_settings_key(args.filter, args.framework, args.run_mode))
+    if reference is None:
+        raise SystemExit(f"No cached measurement for the good commit {args.good_commit[:10]}.")
+    result = measure_commit(repo, cache_dir, args.filter, args.framework, args.run_mode)
+    if result["status"] != "ok":
+        print(f"{result['commit'][:10]}: skip ({result['reason']})")
+        return BISECT_SKIP
+    deltas = compare_bisect_means(reference, result, args.method, args.threshold)
+    worst = max(deltas, key=lambda item: item["delta"], default=None)
+    if worst is None:
+        print(f"{result['commit'][:10]}: skip (no benchmarks shared with the good commit)")
+        return BISECT_SKIP
+    code = BISECT_BAD if any(item["regressed"] for item in deltas) else BISECT_GOOD
+    print(f"{result['commit'][:10]}: {'bad' if code else 'good'} (worst {worst['name']} {worst['delta'] * 100:+.1f}%)")
+    return code
+
+
+def bisect_step_main(argv):
+    # Exit codes other than good/bad/skip abort the bisect.
+    try:
+        code = run_bisect_step(argv)
+    except SystemExit as error:
+        if error.code in (BISECT_GOOD, BISECT_BAD, BISECT_SKIP):
+            code = error.code
+        else:
+            if isinstance(error.code, str):
+                print(error.code, file=sys.stderr)
+            code = BISECT_ABORT
+    except Exception as error:
+        print(f"bisect step failed: {error}", file=sys.stderr)
+        code = BISECT_ABORT
+    sys.exit(code)
+
+
+def parse_bisect_log(text: str):
+    steps = []
+    first_bad = None
+    for line in text.splitlines():
+        match = re.match(r"^# (good|bad|skip): \[([0-9a-f]+)\]", line)
+        if match:
+            steps.append({"verdict": match.group(1), "commit": match.group(2)})
+        match = re.match(r"^# first bad commit: \[([0-9a-f]+)\]", line)
+        if match:
+            first_bad = match.group(1)
+    return steps, first_bad
+
+
+def bisect_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="generate-benchmark-report.py bisect",
+        description="Find the commit that regressed a benchmark by driving `git bisect run` with filtered BenchmarkDotNet runs.",
+    )
+    parser.add_argument("--good", required=True, help="commit where the benchmark was fine")
+    parser.add_argument("--bad", default="HEAD", help="commit where the benchmark regressed (default: HEAD)")
+    parser.add_argument("--filter", required=True, help="BenchmarkDotNet filter(s), space separated (e.g. '*QrCompareBenchmarks*')")
+    parser.add_argument("--method", action="append", default=[], help="only judge benchmarks whose 'Class/Method' contains this text (repeatable)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_BISECT_THRESHOLD, help="relative slowdown vs the good commit that counts as bad")
+    parser.add_argument("--framework", default="net8.0")
+    parser.add_argument("--full", action="store_true", help="use the full job settings instead of quick")
+    parser.add_argument("--cache-dir", default=None, help=f"per-commit results and artifacts (default: {DEFAULT_BISECT_DIR})")
+    parser.add_argument("--json-output", default=None)
+    args = parser.parse_args(argv)
+
+    repo = Path(run_git(Path(__file__).resolve().parent, "rev-parse", "--show-toplevel"))
+    cache_dir = Path(args.cache_dir).resolve() if args.cache_dir else DEFAULT_BISECT_DIR
+    run_mode = "full" if args.full else "quick"
+    if run_git(repo, "status", "--porcelain", "--untracked-files=no"):
+        raise SystemExit("Working tree has uncommitted changes; commit or stash them before bisecting.")
+    good = run_git(repo, "rev-parse", "--verify", f"{args.good}^{{commit}}")
+    bad = run_git(repo, "rev-parse", "--verify", f"{args.bad}^{{commit}}")
+    original = run_git(repo, "rev-parse", "--abbrev-ref", "HEAD")
+    if original == "HEAD":
+        original = run_git(repo, "rev-parse", "HEAD")
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    driver_dir = Path(tempfile.mkdtemp(prefix="benchmark-bisect-driver-"))
+    try:
+        bisect_with_driver(args, repo, cache_dir, driver_dir, run_mode, good, bad, original)
+    finally:
+        shutil.rmtree(driver_dir, ignore_errors=True)
+
+
+def bisect_with_driver(args, repo: Path, cache_dir: Path, driver_dir: Path, run_mode: str, good: str, bad: str, original: str):
+    shutil.copytree(Path(__file__).resolve().parent, driver_dir / "benchmark_report", ignore=shutil.ignore_patterns("__pycache__"))
+    driver = driver_dir / "generate-benchmark-report.py"
+    shutil.copy2(BUILD_DIR / "generate-benchmark-report.py", driver)
+
+    endpoints = {}
+    try:
+        for name, commit in (("good", good), ("bad", bad)):
+            run_git(repo, "checkout", "--quiet", "--detach", commit)
+            endpoints[name] = measure_commit(repo, cache_dir, args.filter, args.framework, run_mode)
+            if endpoints[name]["status"] != "ok":
+                raise SystemExit(f"Cannot measure the {name} commit {commit[:10]}: {endpoints[name]['reason']}.")
+    finally:
+        run_git(repo, "checkout", "--quiet", original)
+    endpoint_deltas = compare_bisect_means(endpoints["good"], endpoints["bad"], args.method, args.threshold)
+    if not any(item["regressed"] for item in endpoint_deltas):
+        raise SystemExit(f"No benchmark is more than {args.threshold * 100:g}% slower on {bad[:10]} than on {good[:10]}; nothing to bisect.")
+
+    step = [
+        sys.executable, str(driver), "bisect-step", "--repo", str(repo), "--cache-dir", str(cache_dir), "--filter", args.filter,
+        "--framework", args.framework, "--run-mode", run_mode, "--good-commit", good, "--threshold", str(args.threshold),
+    ]
+    for method in args.method:
+        step += ["--method", method]
+    run_git(repo, "bisect", "start", bad, good)
+    try:
+        subprocess.run(["git", "bisect", "run", *step], cwd=repo)
+        steps, first_bad = parse_bisect_log(run_git(repo, "bisect", "log"))
+    finally:
+        run_git(repo, "bisect", "reset")
+
+    key = bisect_settings_key(args.filter, args.framework, run_mode)
+    for item in steps:
+        commit = run_git(repo, "rev-parse", item["commit"])
+        measured = load_bisect_result(cache_dir, commit, key) or {}
+        item["commit"] = commit
+        item["subject"] = run_git(repo, "log", "-1", "--format=%s", commit)
+        if measured.get("status") == "ok":
+            item["deltas"] = compare_bisect_means(endpoints["good"], measured, args.method, args.threshold)
+    summary = {
+        "generatedUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "good": good,
+        "bad": bad,
+        "filter": args.filter,
+        "methods": args.method,
+        "threshold": args.threshold,
+        "runMode": run_mode,
+        "framework": args.framework,
+        "firstBad": None,
+        "steps": steps,
+    }
+    if first_bad:
+        first_bad = run_git(repo, "rev-parse", first_bad)
+        author, date, subject = run_git(repo, "log", "-1", "--format=%an%x00%aI%x00%s", first_bad).split("\0")
+        culprit = load_bisect_result(cache_dir, first_bad, key)
+        parent = load_bisect_result(cache_dir, run_git(repo, "rev-parse", f"{first_bad}^"), key)
+        summary["firstBad"] = {
+            "commit": first_bad,
+            "author": author,
+            "date": date,
+            "subject": subject,
+            "vsGood": compare_bisect_means(endpoints["good"], culprit, args.method, args.threshold) if culprit else [],
+            "vsParent": compare_bisect_means(parent, culprit, args.method, args.threshold) if culprit and parent and parent.get("status") == "ok" else [],
+        }
+    if args.json_output:
+        atomic_write_text(Path(args.json_output), json.dumps(summary, indent=2))
+
+    print("")
+    print(f"Bisect {good[:10]}..{bad[:10]} ({args.filter}, {run_mode}, threshold {args.threshold * 100:g}%)")
+    print("| Commit | Verdict | Subject |")
+    print("| --- | --- | --- |")
+    for item in steps:
+        print(f"| {item['commit'][:10]} | {item['verdict']} | {item['subject']} |")
+    culprit = summary["firstBad"]
+    if not culprit:
+        raise SystemExit("Bisect did not converge on a single commit (skipped commits hide it); see `git bisect log` output above.")
+    print("")
+    print(f"First bad commit: {culprit['commit'][:10]} {culprit['subject']} ({culprit['author']}, {culprit['date']})")
+    parent_deltas = {item["name"]: item for item in culprit["vsParent"]}
+    print("| Benchmark | Good | First bad | vs good | vs parent |")
+    print("| --- | --- | --- | --- | --- |")
+    for item in sorted(culprit["vsGood"], key=lambda entry: -entry["delta"]):
+        parent_delta = parent_deltas.get(item["name"])
+        vs_parent = f"{parent_delta['delta'] * 100:+.1f}%" if parent_delta else "n/a"
+        print(
+            f"| {item['name']} | {format_duration_ns(item['referenceNs'])} | {format_duration_ns(item['meanNs'])} | "
+            f"{item['delta'] * 100:+.1f}%{' **regressed**' if item['regressed'] else ''} | "
+            f"{vs_parent} |"
+        )
@@ -0,0 +1,482 @@
+import contextlib
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+BENCH_PREFIX = "CodeGlyphX.Benchmarks."
+COMPARE_VENDORS = {"CodeGlyphX", "ZXing.Net", "QRCoder", "Barcoder"}
+
+TITLE_MAP = {
+    "QrCodeBenchmarks": "QR (Encode)",
+    "QrDecodeBenchmarks": "QR (Decode)",
+    "BarcodeBenchmarks": "1D Barcodes (Encode)",
+    "MatrixCodeBenchmarks": "2D Matrix Codes (Encode)",
+    "QrCompareBenchmarks": "QR (Encode)",
+    "QrDecodeCleanCompareBenchmarks": "QR Decode (Clean)",
+    "QrDecodeNoisyCompareBenchmarks": "QR Decode (Noisy)",
+    "QrDecodeStressCompareBenchmarks": "QR Decode (Stress)",
+    "Code128CompareBenchmarks": "Code 128 (Encode)",
+    "Code39CompareBenchmarks": "Code 39 (Encode)",
+    "Code93CompareBenchmarks": "Code 93 (Encode)",
+    "EanCompareBenchmarks": "EAN-13 (Encode)",
+    "UpcACompareBenchmarks": "UPC-A (Encode)",
+    "DataMatrixCompareBenchmarks": "Data Matrix (Encode)",
+    "Pdf417CompareBenchmarks": "PDF417 (Encode)",
+    "AztecCompareBenchmarks": "Aztec (Encode)",
+}
+
+VENDOR_ORDER = ["CodeGlyphX", "ZXing.Net", "QRCoder", "Barcoder"]
+OS_NAMES = ("windows", "linux", "macos")
+RUN_MODES = ("quick", "full")
+# Bump when a parser or cached record layout changes.
+PARSER_VERSION = 11
+FULL_REPORT_SUFFIXES = ("-report-full.json", "-report-full-compressed.json", "-report.json", "-report-brief.json")
+BUILD_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = BUILD_DIR / ".benchmark-cache"
+DEFAULT_CACHE_MAX_MB = 256
+DEFAULT_CACHE_MAX_AGE_DAYS = 30
+DEFAULT_PRIMARY_FRAMEWORK = "net8.0"
+OUTPUT_LOCK_NAME = ".benchmark-report.lock"
+DEFAULT_LOCK_TIMEOUT_SECONDS = 600
+
+
+def normalize_method(value: str) -> str:
+    value = (value or "").strip()
+    if len(value) >= 2 and value[0] == "'" and value[-1] == "'":
+        return value[1:-1]
+    return value
+
+
+def normalize_mean_text(value: str) -> str:
+    if not value:
+        return value
+    return (
+        value.replace("µs", "μs")
+        .replace("�s", "μs")
+        .replace("Âµs", "μs")
+        .replace("Âμs", "μs")
+    )
+
+
+def parse_allocated_bytes(value: str):
+    if not value:
+        return None
+    cleaned = value.strip().replace(",", "")
+    if cleaned == "NA":
+        return None
+    match = re.match(r"^(\d+(?:\.\d+)?)\s*(B|KB|MB)$", cleaned)
+    if not match:
+        return None
+    number = float(match.group(1))
+    unit = match.group(2)
+    if unit == "B":
+        return number
+    if unit == "KB":
+        return number * 1024.0
+    if unit == "MB":
+        return number * 1024.0 * 1024.0
+    return None
+
+
+def parse_count(value: str):
+    if value is None:
+        return None
+    cleaned = value.strip().replace(",", "")
+    if not cleaned or cleaned == "NA":
+        return None
+    if cleaned == "-":
+        return 0.0
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def first_column(row: dict, names):
+    for name in names:
+        if name in row:
+            return parse_count(row[name])
+    return None
+
+
+def resolve_publish_flag(run_mode: str, publish: bool, no_publish: bool) -> bool:
+    if publish:
+        return True
+    if no_publish:
+        return False
+    return run_mode == "full"
+
+
+def get_compare_class_name(path: Path) -> str:
+    return strip_benchmark_prefix(path.stem)
+
+
+def strip_benchmark_prefix(name: str) -> str:
+    return name.replace(BENCH_PREFIX, "").replace("-report", "")
+
+
+def normalize_compare_scenario(value: str) -> str:
+    mapping = {
+        "EAN PNG": "EAN-13 PNG",
+        "QR Decode (clean, balanced)": "QR Decode (clean)",
+        "QR Decode (noisy, robust)": "QR Decode (noisy)",
+        "QR Decode (noisy, try harder)": "QR Decode (noisy)",
+    }
+    return mapping.get(value, value)
+
+
+class OutputLock:
+    __slots__ = ("path", "timeout", "handle")
+
+    def __init__(self, path: Path, timeout: float):
+        self.path = path
+        self.timeout = timeout
+        self.handle = None
+
+    def try_lock(self) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.handle = self.path.open("a+b")
+        deadline = time.monotonic() + self.timeout
+        while not self.try_lock():
+            if time.monotonic() >= deadline:
+                self.handle.close()
+                raise SystemExit(f"Timed out waiting for report lock: {self.path}")
+            time.sleep(0.1)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                self.handle.seek(0)
+                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self.handle.close()
+        return False
+
+
+class Timings:
+    __slots__ = ("stages", "counters", "started")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.stages: dict[str, dict] = {}
+        self.counters: dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += time.perf_counter() - start
+            entry["calls"] += 1
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def read(self, path: Path):
+        self.count("filesRead")
+        try:
+            self.count("bytesRead", path.stat().st_size)
+        except OSError:
+            pass
+
+    def merge(self, other: dict):
+        for name, entry in other["stages"].items():
+            target = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+            target["seconds"] += entry["seconds"]
+            target["calls"] += entry["calls"]
+        for name, value in other["counters"].items():
+            self.count(name, value)
+
+    def to_dict(self):
+        return {
+            "totalSeconds": round(time.perf_counter() - self.started, 4),
+            "stages": {name: {"seconds": round(entry["seconds"], 4), "calls": entry["calls"]} for name, entry in self.stages.items()},
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+
+TIMINGS = Timings()
+
+
+def format_timings(trace: dict) -> str:
+    lines = [f"Report generation took {trace['totalSeconds']:.3f}s"]
+    for name, entry in sorted(trace["stages"].items(), key=lambda item: item[1]["seconds"], reverse=True):
+        lines.append(f"  {name:<24} {entry['seconds'] * 1000:>10.1f} ms  x{entry['calls']}")
+    for name, value in trace["counters"].items():
+        lines.append(f"  {name:<24} {value:>10}")
+    return "\n".join(lines)
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> bool:
+    if path.exists():
+        try:
+            if hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(content).digest():
+                TIMINGS.count("filesUnchanged")
+                return False
+        except OSError:
+            pass
+    TIMINGS.count("filesWritten")
+    TIMINGS.count("bytesWritten", len(content))
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with temp.open("wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    finally:
+        if temp.exists():
+            temp.unlink()
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return True
+
+
+def atomic_write_text(path: Path, text: str) -> bool:
+    return atomic_write_bytes(path, text.encode("utf-8"))
+
+
+class ParseCache:
+    __slots__ = ("root", "max_bytes", "max_age_seconds", "hits", "misses", "pending")
+
+    def __init__(self, root: Path, max_bytes: int, max_age_seconds: float, deferred: bool = False):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        # Worker copies collect new entries here so the parent process writes them (see merge).
+        self.pending: list[tuple[str, str]] | None = [] if deferred else None
+
+    def entry_path(self, kind: str, path: Path, companions=()) -> Path:
+        digest = hashlib.sha256()
+        digest.update(f"{kind}\0{PARSER_VERSION}\0".encode("utf-8"))
+        for source in (path, *companions):
+            digest.update(f"\0{source.name}\0".encode("utf-8"))
+            with source.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        key = digest.hexdigest()
+        return self.root / key[:2] / f"{key}.json"
+
+    def get_or_parse(self, kind: str, path: Path, parse, encode=None, decode=None, companions=()):
+        try:
+            entry = self.entry_path(kind, path, companions)
+        except OSError:
+            return parse(path)
+        if entry.exists():
+            try:
+                cached = json.loads(entry.read_text(encoding="utf-8"))
+                os.utime(entry)
+                self.hits += 1
+                TIMINGS.count("cacheHits")
+                return decode(cached) if decode else cached
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+        self.misses += 1
+        TIMINGS.count("cacheMisses")
+        value = parse(path)
+        text = json.dumps(encode(value) if encode else value, separators=(",", ":"))
+        if self.pending is not None:
+            self.pending.append((str(entry), text))
+        else:
+            self.store(entry, text)
+        return value
+
+    def store(self, entry: Path, text: str):
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            temp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            temp.write_text(text, encoding="utf-8")
+            os.replace(temp, entry)
+        except OSError:
+            pass
+
+    def fork(self) -> "ParseCache":
+        return ParseCache(self.root, self.max_bytes, self.max_age_seconds, deferred=True)
+
+    def to_dict(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": list(self.pending or [])}
+
+    def merge(self, other: dict):
+        self.hits += other["hits"]
+        self.misses += other["misses"]
+        for entry, text in other["entries"]:
+            self.store(Path(entry), text)
+
+    def evict(self):
+        if not self.root.exists():
+            return 0
+        now = dt.datetime.now().timestamp()
+        entries = []
+        for entry in self.root.glob("*/*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort(key=lambda item: item[0], reverse=True)
+        removed = 0
+        total = 0
+        for mtime, size, entry in entries:
+            total += size
+            if now - mtime <= self.max_age_seconds and total <= self.max_bytes:
+                continue
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def cached_parse(cache: ParseCache | None, kind: str, path: Path, parse, encode=None, decode=None):
+    if cache is None:
+        return parse(path)
+    return cache.get_or_parse(kind, path, parse, encode, decode)
+
+
+def runtime_framework(runtime: str | None) -> str | None:
+    if not runtime:
+        return None
+    match = re.search(r"\.NET Framework (\d)\.(\d)(?:\.(\d))?", runtime)
+    if match:
+        return f"net{match.group(1)}{match.group(2)}{match.group(3) or ''}"
+    match = re.search(r"\.NET (?:Core )?(\d+)\.(\d+)", runtime)
+    if match:
+        return f"net{match.group(1)}.{match.group(2)}"
+    match = re.fullmatch(r"net\d+(?:\.\d+)?", runtime.strip().lower())
+    return match.group(0) if match else None
+
+
+def framework_sort_key(framework: str):
+    match = re.fullmatch(r"net(\d+)\.(\d+)", framework)
+    if match:
+        return (1, int(match.group(1)), int(match.group(2)))
+    match = re.fullmatch(r"net(\d)(\d)(\d?)", framework)
+    if match:
+        return (0, int(match.group(1)), int(match.group(2) + (match.group(3) or "0")))
+    return (2, 0, 0)
+
+
+def format_duration_ns(value: float | None) -> str:
+    if value is None:
+        return ""
+    for unit, scale in (("s", 1_000_000_000.0), ("ms", 1_000_000.0), ("μs", 1000.0)):
+        if value >= scale:
+            return f"{value / scale:,.3f} {unit}"
+    return f"{value:,.2f} ns"
+
+
+def format_signed_duration_ns(value: float) -> str:
+    return f"-{format_duration_ns(-value)}" if value < 0 else format_duration_ns(value)
+
+
+def vendor_sort_key(vendor: str):
+    return VENDOR_ORDER.index(vendor) if vendor in VENDOR_ORDER else len(VENDOR_ORDER)
+
+
+def get_stored_payload(data: dict, os_name: str, run_mode: str):
+    block = data.get(os_name)
+    if not isinstance(block, dict):
+        return None
+    payload = block.get(run_mode)
+    return payload if isinstance(payload, dict) else None
+
+
+def classify_change(current: float | None, previous: float | None, noise: float, threshold: float):
+    if not current or not previous:
+        return None, None
+    delta = current - previous
+    change = delta / previous
+    if abs(delta) <= noise or abs(change) <= threshold:
+        return change, None
+    return change, "regression" if delta > 0 else "improvement"
+
+
+def resolve_benchmark_id(value: str) -> str:
+    if value in TITLE_MAP:
+        return value
+    for key, title in TITLE_MAP.items():
+        if title == value and key.endswith("CompareBenchmarks"):
+            return key
+    return strip_benchmark_prefix(value)
+
+
+def parse_mean_to_ns(value: str):
+    if not value:
+        return None
+    cleaned = value.strip().replace(",", "")
+    if cleaned == "NA":
+        return None
+    match = re.match(r"^(\d+(?:\.\d+)?)\s*(ns|us|μs|ms|s)$", cleaned)
+    if not match:
+        return None
+    number = float(match.group(1))
+    unit = match.group(2)
+    scale = {
+        "ns": 1.0,
+        "us": 1000.0,
+        "μs": 1000.0,
+        "ms": 1_000_000.0,
+        "s": 1_000_000_000.0,
+    }.get(unit, 1.0)
+    return number * scale
+
+
+def parse_float(value, default=0.0):
+    try:
+        return float(value) if value not in (None, "") else default
+    except ValueError:
+        return default
+
+
+def load_json_document(path: Path):
+    if path.exists():
+        TIMINGS.read(path)
+    with TIMINGS.stage("json_load"):
+        data = json.loads(path.read_text(encoding="utf-8-sig")) if path.exists() else {}
+    for os_key in OS_NAMES:
+        if data.get(os_key) is None:
+            data[os_key] = {"quick": None, "full": None}
+        elif "quick" not in data[os_key]:
+            data[os_key] = {"quick": data[os_key], "full": None}
+    return data
@@ -0,0 +1,356 @@
+import argparse
+import json
+from pathlib import Path
+
+from .common import (
+    BUILD_DIR,
+    DEFAULT_PRIMARY_FRAMEWORK,
+    TITLE_MAP,
+    classify_change,
+    format_duration_ns,
+    parse_allocated_bytes,
+    parse_mean_to_ns,
+    resolve_benchmark_id,
+    runtime_framework,
+)
+from .results import IngestedRun, RunResults, ingest_artifacts, split_by_framework
+from .packrunner import DEFAULT_PACK_THRESHOLDS
+
+
+DEFAULT_REGRESSION_THRESHOLDS = {"mean": 0.10, "allocated": 0.05}
+DEFAULT_REGRESSION_THRESHOLDS_PATH = BUILD_DIR / "benchmark-regression-thresholds.json"
+DEFAULT_BUDGETS_PATH = BUILD_DIR / "benchmark-budgets.json"
+BUDGET_METRICS = {
+    "maxMeanNs": ("benchmark", "max"),
+    "maxAllocatedBytes": ("benchmark", "max"),
+    "minDecodeRate": ("pack", "min"),
+    "maxP95Ms": ("pack", "max"),
+}
+
+
+def load_regression_thresholds(path: Path | None, mean_threshold: float | None, alloc_threshold: float | None):
+    thresholds = {"default": dict(DEFAULT_REGRESSION_THRESHOLDS), "benchmarks": {}, "packRunner": {"default": dict(DEFAULT_PACK_THRESHOLDS), "packs": {}}}
+    if path:
+        raw = json.loads(path.read_text(encoding="utf-8-sig"))
+        thresholds["default"].update(raw.get("default") or {})
+        thresholds["benchmarks"] = raw.get("benchmarks") or {}
+        pack_raw = raw.get("packRunner") or {}
+        thresholds["packRunner"]["default"].update(pack_raw.get("default") or {})
+        thresholds["packRunner"]["packs"] = pack_raw.get("packs") or {}
+    if mean_threshold is not None:
+        thresholds["default"]["mean"] = mean_threshold
+    if alloc_threshold is not None:
+        thresholds["default"]["allocated"] = alloc_threshold
+    return thresholds
+
+
+def resolve_regression_threshold(thresholds: dict, benchmark_id: str, scenario: str, metric: str) -> float:
+    value = thresholds["default"].get(metric, DEFAULT_REGRESSION_THRESHOLDS[metric])
+    benchmark = thresholds["benchmarks"].get(benchmark_id) or {}
+    value = benchmark.get(metric, value)
+    scenario_override = (benchmark.get("scenarios") or {}).get(scenario) or {}
+    return scenario_override.get(metric, value)
+
+
+def parse_budget_limit(metric: str, value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    parsed = None
+    if isinstance(value, str):
+        if metric == "maxMeanNs":
+            parsed = parse_mean_to_ns(value)
+        elif metric == "maxAllocatedBytes":
+            parsed = parse_allocated_bytes(value)
+    if parsed is None:
+        raise SystemExit(f"Invalid budget {metric}: {value!r} (use a number or a unit string such as '250 us' / '16 KB').")
+    return parsed
+
+
+def merge_budget_layer(target: dict, layer: dict):
+    for key, value in layer.items():
+        if key in BUDGET_METRICS:
+            target[key] = parse_budget_limit(key, value)
+        elif isinstance(value, dict):
+            merge_budget_layer(target.setdefault(key, {}), value)
+        else:
+            target[key] = value
+    return target
+
+
+def load_performance_budgets(path: Path | None):
+    if not path:
+        return None
+    raw = json.loads(path.read_text(encoding="utf-8-sig"))
+    merge_budget_layer({}, {key: value for key, value in raw.items() if key != "overrides"})
+    for layer in (raw.get("overrides") or {}).values():
+        merge_budget_layer({}, layer)
+    raw["path"] = str(path)
+    return raw
+
+
+def resolve_budgets(budgets: dict, os_name: str, run_mode: str):
+    overrides = budgets.get("overrides") or {}
+    resolved = merge_budget_layer({}, {key: value for key, value in budgets.items() if key not in ("overrides", "path")})
+    applied = []
+    for name in (run_mode, os_name, f"{os_name}/{run_mode}"):
+        if name in overrides:
+            merge_budget_layer(resolved, overrides[name])
+            applied.append(name)
+    return resolved, applied
+
+
+def budget_check(kind: str, benchmark: str, scenario: str, subject: str, metric: str, limit: float, actual: float | None):
+    direction = BUDGET_METRICS[metric][1]
+    if actual is None:
+        status, headroom = "missing", None
+    else:
+        headroom = ((limit - actual) if direction == "max" else (actual - limit)) / limit if limit else None
+        status = "breach" if (actual > limit if direction == "max" else actual < limit) else "ok"
+    return {
+        "kind": kind,
+        "benchmark": benchmark,
+        "scenario": scenario,
+        "subject": subject,
+        "metric": metric,
+        "limit": limit,
+        "actual": actual,
+        "headroom": round(headroom, 4) if headroom is not None else None,
+        "status": status,
+    }
+
+
+def evaluate_budgets(run: IngestedRun, budgets: dict | None):
+    if not budgets:
+        return None
+    resolved, applied = resolve_budgets(budgets, run.os_name, run.run_mode)
+    reports = {report.id: report for report in run.results.baseline + run.results.comparisons}
+    compare_ids = {report.id for report in run.results.comparisons}
+    checks = []
+    for benchmark_key, spec in (resolved.get("benchmarks") or {}).items():
+        benchmark_id = resolve_benchmark_id(benchmark_key)
+        report = reports.get(benchmark_id)
+        title = TITLE_MAP.get(benchmark_id, benchmark_id)
+        vendor = spec.get("vendor") or "CodeGlyphX"
+        shared = {metric: limit for metric, limit in spec.items() if metric in BUDGET_METRICS}
+        scenarios = {}
+        if shared and report:
+            scenarios = dict.fromkeys(report.scenarios if benchmark_id in compare_ids else (row.scenario for row in report.rows))
+        scenarios.update(dict.fromkeys(spec.get("scenarios") or {}))
+        for scenario in scenarios:
+            limits = dict(shared, **((spec.get("scenarios") or {}).get(scenario) or {}))
+            row = None
+            if report and benchmark_id in compare_ids:
+                row = (report.scenarios.get(scenario) or {}).get(vendor)
+            elif report:
+                row = next((item for item in report.rows if item.scenario == scenario), None)
+            for metric, limit in limits.items():
+                if metric not in BUDGET_METRICS:
+                    continue
+                actual = None
+                if row is not None:
+                    actual = row.mean_ns if metric == "maxMeanNs" else row.allocated_bytes
+                checks.append(budget_check("benchmark", title, scenario, vendor, metric, limit, actual))
+
+    pack_spec = resolved.get("packRunner") or {}
+    engine_name = pack_spec.get("engine") or "CodeGlyphX"
+    pack_defaults = {metric: limit for metric, limit in (pack_spec.get("default") or {}).items() if metric in BUDGET_METRICS}
+    measured = {pack["name"]: pack for pack in (run.pack_runner or {}).get("packs") or []}
+    pack_names = dict.fromkeys(measured if pack_defaults else ())
+    pack_names.update(dict.fromkeys(pack_spec.get("packs") or {}))
+    for pack_name in pack_names:
+        limits = dict(pack_defaults, **((pack_spec.get("packs") or {}).get(pack_name) or {}))
+        engine = next((item for item in (measured.get(pack_name) or {}).get("engines") or [] if item["name"] == engine_name), None)
+        for metric, limit in limits.items():
+            if metric not in BUDGET_METRICS:
+                continue
+            actual = None
+            if engine is not None:
+                actual = engine["decodeRate"] if metric == "minDecodeRate" else engine["p95Ms"]
+            checks.append(budget_check("pack", "QR decode pack runner", pack_name, engine_name, metric, limit, actual))
+
+    order = {"breach": 0, "missing": 1, "ok": 2}
+    checks.sort(key=lambda item: (order[item["status"]], item["kind"], item["benchmark"], item["scenario"], item["metric"]))
+    return {
+        "path": budgets.get("path"),
+        "overrides": applied,
+        "checked": sum(1 for item in checks if item["status"] != "missing"),
+        "breaches": sum(1 for item in checks if item["status"] == "breach"),
+        "missing": sum(1 for item in checks if item["status"] == "missing"),
+        "checks": checks,
+    }
+
+
+def format_budget_value(metric: str, value: float | None) -> str:
+    if value is None:
+        return "—"
+    if metric == "maxMeanNs":
+        return format_duration_ns(value)
+    if metric == "maxAllocatedBytes":
+        return f"{value / 1024:,.2f} KB" if value >= 1024 else f"{value:,.0f} B"
+    if metric == "minDecodeRate":
+        return f"{value * 100:.1f}%"
+    return f"{value:,.2f} ms"
+
+
+def list_budget_breaches(budget_report: dict | None):
+    return [
+        f"{item['benchmark']} / {item['scenario']} ({item['metric']} "
+        f"{format_budget_value(item['metric'], item['actual'])} vs {format_budget_value(item['metric'], item['limit'])})"
+        for item in (budget_report or {}).get("checks", [])
+        if item["status"] == "breach"
+    ]
+
+
+def build_budget_section(lines, budget_report: dict | None):
+    if not budget_report:
+        return
+    lines.append("### Performance budgets")
+    lines.append("")
+    overrides = ", ".join(budget_report["overrides"]) or "none"
+    lines.append(
+        f"{budget_report['checked']} absolute limits checked from `{Path(budget_report['path']).name}` (overrides: {overrides}); "
+        f"{budget_report['breaches']} breached, {budget_report['missing']} not measured in this run."
+    )
+    lines.append("")
+    if not budget_report["checks"]:
+        lines.append("_No budgets apply to this run._")
+        lines.append("")
+        return
+    lines.append("| Benchmark | Scenario | Subject | Budget | Limit | Actual | Headroom | Status |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in budget_report["checks"]:
+        headroom = f"{item['headroom'] * 100:+.1f}%" if item["headroom"] is not None else ""
+        status = "**breach**" if item["status"] == "breach" else item["status"]
+        lines.append(
+            f"| {item['benchmark']} | {item['scenario']} | {item['subject']} | {item['metric']} | "
+            f"{format_budget_value(item['metric'], item['limit'])} | {format_budget_value(item['metric'], item['actual'])} | {headroom} | {status} |"
+        )
+    lines.append("")
+
+
+def check_budgets_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="generate-benchmark-report.py check-budgets",
+        description="Check one artifacts folder against the performance budgets without writing any report.",
+    )
+    parser.add_argument("--artifacts-path", required=True)
+    parser.add_argument("--os-name", default=None, choices=["windows", "linux", "macos"])
+    parser.add_argument("--run-mode", default=None, choices=["quick", "full"])
+    parser.add_argument("--framework", default=None, help="only check results of this target framework (default: all)")
+    parser.add_argument("--budgets", default=None, help=f"performance budget file (default: {DEFAULT_BUDGETS_PATH.name})")
+    parser.add_argument("--allow-budget-breach", action="store_true", help="report budget breaches without failing")
+    args = parser.parse_args(argv)
+
+    budgets_path = Path(args.budgets).resolve() if args.budgets else DEFAULT_BUDGETS_PATH
+    if not budgets_path.exists():
+        raise SystemExit(f"Budget file not found: {budgets_path}")
+    budgets = load_performance_budgets(budgets_path)
+    run = ingest_artifacts(Path(args.artifacts_path).resolve(), args.os_name, args.run_mode)
+    host = runtime_framework((run.environment or {}).get("runtime")) or DEFAULT_PRIMARY_FRAMEWORK
+    runs = [item for item in split_by_framework([run], host) if args.framework is None or item.framework == args.framework]
+    if not runs:
+        raise SystemExit(f"No results for {args.framework} in {args.artifacts_path}.")
+
+    breaches = []
+    for item in runs:
+        report = evaluate_budgets(item, budgets)
+        lines = [f"## {item.os_name}/{item.run_mode} {item.framework}", ""]
+        build_budget_section(lines, report)
+        print("\n".join(lines))
+        breaches.extend(f"{item.os_name}/{item.run_mode} {breach}" for breach in list_budget_breaches(report))
+    if breaches and not args.allow_budget_breach:
+        raise SystemExit(f"Performance budgets breached: {'; '.join(breaches)}.")
+
+
+def index_previous_rows(previous: dict):
+    rows = {}
+    for report in previous.get("baseline") or []:
+        for item in report.get("scenarios") or []:
+            rows[(report.get("id"), item.get("name"), "CodeGlyphX")] = item
+    for report in previous.get("comparisons") or []:
+        for item in report.get("scenarios") or []:
+            cgx = (item.get("vendors") or {}).get("CodeGlyphX")
+            if cgx:
+                rows[(report.get("id"), item.get("name"), "CodeGlyphX")] = cgx
+    return rows
+
+
+def compare_with_previous(results: RunResults, previous: dict | None, thresholds: dict):
+    if not previous:
+        return None
+    previous_rows = index_previous_rows(previous)
+    current_rows = []
+    for report in results.baseline:
+        current_rows.extend((report, row) for row in report.rows)
+    for report in results.comparisons:
+        current_rows.extend((report, row) for row in report.rows if row.vendor == "CodeGlyphX")
+
+    compared = 0
+    regressions = []
+    improvements = []
+    for report, row in current_rows:
+        prior = previous_rows.get((report.id, row.scenario, row.vendor))
+        if not prior:
+            continue
+        compared += 1
+        prior_error = prior.get("errorNs") or 0.0
+        time_noise = ((row.error_ns or 0.0) ** 2 + prior_error ** 2) ** 0.5
+        checks = [
+            ("mean", row.mean_ns, prior.get("meanNs"), time_noise, row.mean, prior.get("mean", "")),
+            ("allocated", row.allocated_bytes, parse_allocated_bytes(prior.get("allocated", "")), 0.0, row.allocated, prior.get("allocated", "")),
+        ]
+        for metric, current, prior_value, noise, current_text, prior_text in checks:
+            threshold = resolve_regression_threshold(thresholds, report.id, row.scenario, metric)
+            change, status = classify_change(current, prior_value, noise, threshold)
+            if not status:
+                continue
+            item = {
+                "benchmark": report.title,
+                "benchmarkId": report.id,
+                "scenario": row.scenario,
+                "metric": metric,
+                "previous": prior_text,
+                "current": current_text,
+                "change": round(change, 4),
+                "threshold": threshold,
+                "noise": round(noise / prior_value, 4) if noise and prior_value else None,
+                "status": status,
+            }
+            (regressions if status == "regression" else improvements).append(item)
+
+    return {
+        "previousGeneratedUtc": previous.get("generatedUtc"),
+        "previousCommit": (previous.get("meta") or {}).get("commit"),
+        "thresholds": thresholds["default"],
+        "compared": compared,
+        "regressions": regressions,
+        "improvements": improvements,
+    }
+
+
+def build_regression_section(lines, regression_report: dict | None):
+    if not regression_report:
+        return
+    lines.append("### Regressions")
+    lines.append("")
+    previous = regression_report.get("previousGeneratedUtc") or "unknown"
+    thresholds = regression_report["thresholds"]
+    lines.append(
+        f"Compared {regression_report['compared']} CodeGlyphX scenarios against the previous run ({previous}). "
+        f"A change is significant when it exceeds both the BenchmarkDotNet error margin and the threshold "
+        f"(default {thresholds['mean'] * 100:.0f}% time, {thresholds['allocated'] * 100:.0f}% alloc)."
+    )
+    lines.append("")
+    items = regression_report["regressions"] + regression_report["improvements"]
+    if not items:
+        lines.append("_No significant changes._")
+        lines.append("")
+        return
+    lines.append("| Benchmark | Scenario | Metric | Previous | Current | Change | Threshold | Status |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in items:
+        lines.append(
+            f"| {item['benchmark']} | {item['scenario']} | {item['metric']} | {item['previous']} | {item['current']} | "
+            f"{item['change'] * 100:+.1f}% | {item['threshold'] * 100:.0f}% | {item['status']} |"
+        )
+    lines.append("")
@@ -0,0 +1,191 @@
+import argparse
+import json
+import sqlite3
+from pathlib import Path
+
+from .common import BUILD_DIR, resolve_benchmark_id
+from .results import RunResults
+
+
+DEFAULT_HISTORY_PATH = BUILD_DIR / ".benchmark-history.sqlite"
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    generated_utc TEXT NOT NULL,
+    os TEXT NOT NULL,
+    run_mode TEXT NOT NULL,
+    framework TEXT,
+    configuration TEXT,
+    publish INTEGER,
+    artifacts TEXT NOT NULL,
+    commit_sha TEXT,
+    branch TEXT,
+    dotnet_sdk TEXT,
+    runtime TEXT,
+    machine_name TEXT,
+    processor_count INTEGER,
+    meta_json TEXT,
+    UNIQUE (os, run_mode, framework, artifacts)
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    benchmark TEXT NOT NULL,
+    title TEXT,
+    scenario TEXT NOT NULL,
+    vendor TEXT NOT NULL,
+    os TEXT NOT NULL,
+    run_mode TEXT NOT NULL,
+    generated_utc TEXT NOT NULL,
+    mean_ns REAL,
+    error_ns REAL,
+    stddev_ns REAL,
+    allocated_bytes REAL
+);
+CREATE INDEX IF NOT EXISTS ix_results_trend ON results (benchmark, scenario, vendor, os, run_mode, generated_utc);
+CREATE INDEX IF NOT EXISTS ix_results_run ON results (run_id);
+"""
+
+
+def open_history(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(path))
+    connection.executescript(HISTORY_SCHEMA)
+    return connection
+
+
+def record_run_history(path: Path, payload: dict, results: RunResults) -> bool:
+    meta = payload.get("meta") or {}
+    connection = open_history(path)
+    try:
+        with connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO runs (generated_utc, os, run_mode, framework, configuration, publish, artifacts, "
+                "commit_sha, branch, dotnet_sdk, runtime, machine_name, processor_count, meta_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    payload["generatedUtc"],
+                    payload["os"],
+                    payload["runMode"],
+                    payload["framework"],
+                    payload["configuration"],
+                    int(bool(payload["publish"])),
+                    payload["artifacts"],
+                    meta.get("commit"),
+                    meta.get("branch"),
+                    meta.get("dotnetSdk"),
+                    meta.get("runtime"),
+                    meta.get("machineName"),
+                    meta.get("processorCount"),
+                    json.dumps(meta),
+                ),
+            )
+            if not cursor.rowcount:
+                return False
+            run_id = cursor.lastrowid
+            rows = []
+            for report in results.baseline + results.comparisons:
+                for row in report.rows:
+                    rows.append(
+                        (
+                            run_id,
+                            report.id,
+                            report.title,
+                            row.scenario,
+                            row.vendor,
+                            payload["os"],
+                            payload["runMode"],
+                            payload["generatedUtc"],
+                            row.mean_ns,
+                            row.error_ns,
+                            row.stddev_ns,
+                            row.allocated_bytes,
+                        )
+                    )
+            connection.executemany(
+                "INSERT INTO results (run_id, benchmark, title, scenario, vendor, os, run_mode, generated_utc, "
+                "mean_ns, error_ns, stddev_ns, allocated_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return True
+    finally:
+        connection.close()
+
+
+def query_history_trend(
+    path: Path,
+    benchmark: str,
+    scenario: str,
+    vendor: str,
+    os_name: str | None,
+    run_mode: str | None,
+    last: int,
+    framework: str | None = None,
+):
+    sql = (
+        "SELECT r.generated_utc, r.os, r.run_mode, runs.framework, runs.commit_sha, runs.branch, runs.runtime, runs.machine_name, "
+        "r.mean_ns, r.error_ns, r.allocated_bytes FROM results r JOIN runs ON runs.id = r.run_id "
+        "WHERE r.benchmark = ? AND r.scenario = ? AND r.vendor = ?"
+    )
+    params: list = [benchmark, scenario, vendor]
+    if os_name:
+        sql += " AND r.os = ?"
+        params.append(os_name)
+    if run_mode:
+        sql += " AND r.run_mode = ?"
+        params.append(run_mode)
+    if framework:
+        sql += " AND runs.framework = ?"
+        params.append(framework)
+    sql += " ORDER BY r.generated_utc DESC LIMIT ?"
+    params.append(last)
+    connection = open_history(path)
+    try:
+        rows = connection.execute(sql, params).fetchall()
+    finally:
+        connection.close()
+    columns = ["generatedUtc", "os", "runMode", "framework", "commit", "branch", "runtime", "machineName", "meanNs", "errorNs", "allocatedBytes"]
+    return [dict(zip(columns, row)) for row in reversed(rows)]
+
+
+def history_main(argv):
+    parser = argparse.ArgumentParser(prog="generate-benchmark-report.py history", description="Show the trend of one scenario across stored runs.")
+    parser.add_argument("--history-path", default=None)
+    parser.add_argument("--benchmark", required=True, help="Benchmark class (QrCompareBenchmarks) or report title.")
+    parser.add_argument("--scenario", required=True)
+    parser.add_argument("--vendor", default="CodeGlyphX")
+    parser.add_argument("--os-name", default=None, choices=["windows", "linux", "macos"])
+    parser.add_argument("--run-mode", default=None, choices=["quick", "full"])
+    parser.add_argument("--framework", default=None, help="only runs of this target framework (e.g. net8.0)")
+    parser.add_argument("--last", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    history_path = Path(args.history_path).resolve() if args.history_path else DEFAULT_HISTORY_PATH
+    if not history_path.exists():
+        raise SystemExit(f"History store not found: {history_path}")
+    trend = query_history_trend(
+        history_path,
+        resolve_benchmark_id(args.benchmark),
+        args.scenario,
+        args.vendor,
+        args.os_name,
+        args.run_mode,
+        args.last,
+        args.framework,
+    )
+    if args.json:
+        print(json.dumps(trend, indent=2))
+        return
+    if not trend:
+        print("No history for the requested scenario.")
+        return
+    first = next((item["meanNs"] for item in trend if item["meanNs"]), None)
+    print("| Generated (UTC) | OS | Mode | Framework | Commit | Mean (ns) | Error (ns) | Allocated (B) | vs first |")
+    print("| --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in trend:
+        mean_ns = item["meanNs"]
+        drift = f"{(mean_ns / first - 1.0) * 100:+.1f}%" if mean_ns and first else ""
+        print(
+            f"| {item['generatedUtc']} | {item['os']} | {item['runMode']} | {item['framework'] or ''} | {(item['commit'] or '')[:10]} | "
+            f"{mean_ns or ''} | {item['errorNs'] or ''} | {item['allocatedBytes'] or ''} | {drift} |"
+        )
@@ -0,0 +1,229 @@
+import functools
+import hashlib
+import json
+import os
+import platform
+import re
+import struct
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+try:
+    import winreg
+except ImportError:  # POSIX
+    winreg = None
+
+from .common import FULL_REPORT_SUFFIXES, ParseCache, cached_parse
+
+
+CALIBRATION_REFERENCE_SECONDS = 0.015
+CALIBRATION_ROUNDS = 7
+ARCHITECTURE_NAMES = {"x86_64": "X64", "amd64": "X64", "x64": "X64", "i386": "X86", "i686": "X86", "x86": "X86", "aarch64": "Arm64", "arm64": "Arm64", "armv7l": "Arm", "arm": "Arm"}
+BDN_CPU_RE = re.compile(r"^(?P<cpu>.+?), (?P<count>\d+) CPUs?, (?P<logical>\d+) logical and (?P<physical>\d+) physical cores?", re.MULTILINE)
+BDN_HOST_RE = re.compile(r"^\s*\[Host\]\s*:\s*(?P<runtime>.+?)(?: \([^)]*\))?, (?P<arch>X64|X86|Arm64|Arm|[A-Za-z0-9]+) (?P<jit>\w+)(?: (?P<isa>.+))?$", re.MULTILINE)
+RUN_INFO_NAME = "run-info.json"
+BDN_HEADER_RE = re.compile(r"^BenchmarkDotNet v(?P<version>[^,]+), (?P<os>.+)$", re.MULTILINE)
+
+
+def normalize_architecture(value: str | None) -> str | None:
+    if not value:
+        return None
+    return ARCHITECTURE_NAMES.get(value.lower(), value)
+
+
+def read_command(*command: str) -> str | None:
+    try:
+        return subprocess.run(command, capture_output=True, text=True, timeout=5, check=True).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def detect_cpu_model() -> str | None:
+    if sys.platform.startswith("linux"):
+        try:
+            text = Path("/proc/cpuinfo").read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            text = ""
+        for key in ("model name", "Model", "Hardware", "cpu model"):
+            match = re.search(rf"^{key}\s*:\s*(.+)$", text, re.MULTILINE)
+            if match:
+                return match.group(1).strip()
+    elif sys.platform == "darwin":
+        model = read_command("sysctl", "-n", "machdep.cpu.brand_string")
+        if model:
+            return model
+    elif winreg is not None:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0") as key:
+                return str(winreg.QueryValueEx(key, "ProcessorNameString")[0]).strip()
+        except OSError:
+            pass
+    return platform.processor() or None
+
+
+def detect_os_architecture() -> str | None:
+    if sys.platform == "win32":
+        return normalize_architecture(os.environ.get("PROCESSOR_ARCHITEW6432") or os.environ.get("PROCESSOR_ARCHITECTURE"))
+    if sys.platform == "darwin" and read_command("sysctl", "-n", "sysctl.proc_translated") == "1":
+        return "Arm64"  # x64 process under Rosetta
+    return normalize_architecture(platform.machine())
+
+
+def detect_process_architecture() -> str | None:
+    machine = normalize_architecture(os.environ.get("PROCESSOR_ARCHITECTURE") if sys.platform == "win32" else platform.machine())
+    if struct.calcsize("P") == 4:
+        return {"X64": "X86", "Arm64": "Arm"}.get(machine, machine)
+    return machine
+
+
+def calibration_workload():
+    data = bytes(range(256)) * 256
+    for _ in range(64):
+        data = hashlib.sha256(data).digest() * 2048
+    values = [(index * 7919) % 10007 for index in range(50000)]
+    values.sort()
+    return sum(value * value for value in values)
+
+
+def run_calibration():
+    best = None
+    for _ in range(CALIBRATION_ROUNDS):
+        start = time.perf_counter()
+        calibration_workload()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        "score": round(CALIBRATION_REFERENCE_SECONDS / best, 3),
+        "seconds": round(best, 5),
+        "python": platform.python_version(),
+        "source": "generator",
+    }
+
+
+def build_meta(commit: str | None, branch: str | None, dotnet_sdk: str | None, runtime: str | None):
+    return {
+        "commit": commit or os.environ.get("GIT_COMMIT") or os.environ.get("BUILD_SOURCEVERSION"),
+        "branch": branch or os.environ.get("GIT_BRANCH") or os.environ.get("BUILD_SOURCEBRANCH"),
+        "dotnetSdk": dotnet_sdk or os.environ.get("DOTNET_SDK"),
+        "runtime": runtime,
+    }
+
+
+def is_local_run(environment: dict | None, run_info: dict | None, assume_local: bool) -> bool:
+    machine_name = (run_info or {}).get("machineName")
+    if machine_name:
+        return machine_name.lower() == platform.node().lower()
+    logical_cores = (environment or {}).get("logicalCores")
+    return assume_local and (logical_cores is None or logical_cores == os.cpu_count())
+
+
+@functools.lru_cache(maxsize=1)
+def local_calibration():
+    return run_calibration()
+
+
+def build_run_meta(meta: dict, environment: dict | None, run_info: dict | None, calibrate: bool = False, assume_local: bool = True):
+    environment = environment or {}
+    run_info = run_info or {}
+    local = is_local_run(environment, run_info, assume_local)
+    cpu_model = environment.get("cpuModel") or (detect_cpu_model() if local else None)
+    processor_count = environment.get("logicalCores") or (os.cpu_count() if local else None)
+    process_architecture = environment.get("processArchitecture") or (detect_process_architecture() if local else None)
+    os_description = environment.get("os") or (platform.platform() if local else None)
+    fingerprint = None
+    if cpu_model:
+        fingerprint = hashlib.sha256(f"{cpu_model}|{processor_count}|{process_architecture}|{os_description}".encode("utf-8")).hexdigest()[:12]
+    return {
+        "commit": meta.get("commit") or run_info.get("commit"),
+        "branch": meta.get("branch") or run_info.get("branch"),
+        "dotnetSdk": meta.get("dotnetSdk") or environment.get("dotnetSdk") or run_info.get("dotnetSdk"),
+        "runtime": meta.get("runtime") or environment.get("runtime"),
+        "osDescription": os_description,
+        "osArchitecture": detect_os_architecture() if local else None,
+        "processArchitecture": process_architecture,
+        "machineName": run_info.get("machineName") or (platform.node() if local else None),
+        "processorCount": processor_count,
+        "cpuModel": cpu_model,
+        "cpuFingerprint": fingerprint,
+        "calibration": local_calibration() if calibrate and local else None,
+        "hostSource": "benchmarkdotnet" if environment else ("generator" if local else None),
+    }
+
+
+def detect_os_name() -> str:
+    name = platform.system().lower()
+    if name.startswith("win"):
+        return "windows"
+    if name.startswith("linux"):
+        return "linux"
+    if name.startswith("darwin"):
+        return "macos"
+    return "unknown"
+
+
+def parse_bdn_environment(path: Path):
+    text = path.read_text(encoding="utf-8", errors="ignore")[:4096]
+    environment = {}
+    header = BDN_HEADER_RE.search(text)
+    if header:
+        environment["benchmarkDotNet"] = header.group("version").strip()
+        environment["os"] = header.group("os").strip()
+    cpu = BDN_CPU_RE.search(text)
+    if cpu:
+        environment["cpuModel"] = cpu.group("cpu").strip()
+        environment["logicalCores"] = int(cpu.group("logical"))
+        environment["physicalCores"] = int(cpu.group("physical"))
+    host = BDN_HOST_RE.search(text)
+    if host:
+        environment["runtime"] = host.group("runtime").strip()
+        environment["processArchitecture"] = normalize_architecture(host.group("arch"))
+        environment["jit"] = host.group("jit")
+        if host.group("isa"):
+            environment["isa"] = host.group("isa").strip()
+    return environment
+
+
+def parse_bdn_host_info(path: Path):
+    with path.open("r", encoding="utf-8-sig") as f:
+        info = json.load(f).get("HostEnvironmentInfo") or {}
+    environment = {
+        "benchmarkDotNet": info.get("BenchmarkDotNetVersion"),
+        "os": info.get("OsVersion"),
+        "cpuModel": info.get("ProcessorName"),
+        "logicalCores": info.get("LogicalCoreCount"),
+        "physicalCores": info.get("PhysicalCoreCount"),
+        "runtime": info.get("RuntimeVersion"),
+        "processArchitecture": normalize_architecture(info.get("Architecture")),
+        "dotnetSdk": info.get("DotNetCliVersion"),
+    }
+    return {key: value for key, value in environment.items() if value not in (None, "")}
+
+
+def load_bdn_environment(results_path: Path, cache: ParseCache | None = None):
+    environment = {}
+    for path in sorted(results_path.glob("*-report-github.md")):
+        environment = cached_parse(cache, "bdn-environment", path, parse_bdn_environment)
+        if environment:
+            break
+    for suffix in FULL_REPORT_SUFFIXES:
+        for path in sorted(results_path.glob(f"*{suffix}")):
+            try:
+                host_info = cached_parse(cache, "bdn-host-info", path, parse_bdn_host_info)
+            except (OSError, ValueError, AttributeError):
+                continue
+            if host_info:
+                return {**environment, **host_info}
+    return environment or None
+
+
+def load_run_info(artifacts_path: Path):
+    path = artifacts_path / RUN_INFO_NAME
+    try:
+        info = json.loads(path.read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(info, dict):
+        return None
+    return {key: str(value).strip() for key, value in info.items() if value not in (None, "") and str(value).strip()} or None
@@ -0,0 +1,572 @@
+import csv
+import json
+import math
+from pathlib import Path
+
+from .common import ParseCache, TIMINGS, cached_parse, classify_change, parse_float
+
+
+PACK_SIZE_BUCKETS = ((320, "<=320px"), (640, "<=640px"), (1024, "<=1024px"), (2048, "<=2048px"))
+PACK_SIZE_BUCKET_LARGEST = ">2048px"
+DIAG_METRICS = (
+    ("diagCandidateMedian", "candidates"),
+    ("diagTriplesMedian", "triples"),
+    ("diagInvertRate", "invertRate"),
+    ("diagScaleMedian", "scale"),
+    ("diagThresholdMedian", "threshold"),
+    ("diagDimensionMedian", "dimension"),
+)
+DIAG_COUNT_BUCKETS = ((0, "0"), (3, "1-3"), (10, "4-10"), (30, "11-30"), (100, "31-100"))
+DIAG_COUNT_BUCKET_LARGEST = ">100"
+DIAG_MIN_CORRELATION_SAMPLES = 3
+DEFAULT_PACK_THRESHOLDS = {"p95": 0.25, "decodeRate": 0.02, "noiseMs": 1.0}
+HEATMAP_GLYPHS = "░▒▓█"
+
+
+def resolve_pack_threshold(thresholds: dict, pack: str, metric: str) -> float:
+    pack_thresholds = thresholds["packRunner"]
+    value = pack_thresholds["default"].get(metric, DEFAULT_PACK_THRESHOLDS[metric])
+    return (pack_thresholds["packs"].get(pack) or {}).get(metric, value)
+
+
+def index_pack_scenarios(pack_runner: dict | None):
+    cells = {}
+    for pack in (pack_runner or {}).get("packs") or []:
+        for engine in pack.get("engines") or []:
+            for scenario in engine.get("scenarios") or []:
+                cells[(pack.get("name"), scenario.get("name"), engine.get("name"))] = scenario
+    return cells
+
+
+def compare_pack_runner(pack_runner: dict | None, previous: dict | None, thresholds: dict):
+    if not pack_runner or not previous:
+        return None
+    previous_pack = previous.get("packRunner") or {}
+    if previous_pack.get("mode") != pack_runner.get("mode"):
+        return None
+    previous_cells = index_pack_scenarios(previous_pack)
+    if not previous_cells:
+        return None
+
+    cells = []
+    engines = set()
+    for (pack, scenario, engine), current in index_pack_scenarios(pack_runner).items():
+        prior = previous_cells.get((pack, scenario, engine))
+        if not prior:
+            continue
+        engines.add(engine)
+        p95_threshold = resolve_pack_threshold(thresholds, pack, "p95")
+        rate_threshold = resolve_pack_threshold(thresholds, pack, "decodeRate")
+        noise_ms = resolve_pack_threshold(thresholds, pack, "noiseMs")
+        p95_change, status = classify_change(current.get("p95Ms"), prior.get("p95Ms"), noise_ms, p95_threshold)
+        rate_delta = (current.get("decodeRate") or 0.0) - (prior.get("decodeRate") or 0.0)
+        if rate_delta < -rate_threshold:
+            status = "decode-drop" if status != "regression" else "regression+decode-drop"
+        cells.append(
+            {
+                "pack": pack,
+                "scenario": scenario,
+                "engine": engine,
+                "previousP95Ms": prior.get("p95Ms"),
+                "currentP95Ms": current.get("p95Ms"),
+                "p95Change": round(p95_change, 4) if p95_change is not None else None,
+                "decodeRateDelta": round(rate_delta, 4),
+                "threshold": p95_threshold,
+                "status": {"regression": "slowdown", "improvement": "faster"}.get(status, status),
+            }
+        )
+    if not cells:
+        return None
+
+    cells.sort(key=lambda cell: (cell["pack"], cell["scenario"], cell["engine"]))
+    return {
+        "previousGeneratedUtc": previous_pack.get("generatedUtc"),
+        "mode": pack_runner.get("mode"),
+        "thresholds": thresholds["packRunner"]["default"],
+        "compared": len(cells),
+        "engines": sorted(engines, key=lambda name: (name != "CodeGlyphX", name)),
+        "slowdowns": sum(1 for cell in cells if cell["status"] and cell["status"] not in ("faster",)),
+        "cells": cells,
+    }
+
+
+def format_heatmap_cell(cell: dict | None) -> str:
+    if not cell:
+        return ""
+    change = cell["p95Change"]
+    if change is None:
+        text = "n/a"
+    else:
+        ratio = abs(change) / cell["threshold"] if cell["threshold"] else 0.0
+        level = sum(ratio > bound for bound in (1, 2, 4))
+        text = f"{HEATMAP_GLYPHS[level]} {change * 100:+.0f}%"
+    if abs(cell["decodeRateDelta"]) >= 0.005:
+        text += f" / {cell['decodeRateDelta'] * 100:+.0f}pp"
+    if cell["status"] in ("slowdown", "decode-drop", "regression+decode-drop"):
+        text = f"**{text}**"
+    return text
+
+
+def build_pack_heatmap_section(lines, pack_report: dict | None):
+    if not pack_report:
+        return
+    lines.append("### QR decode pack runner (latency heatmap)")
+    lines.append("")
+    previous = pack_report.get("previousGeneratedUtc") or "unknown"
+    thresholds = pack_report["thresholds"]
+    lines.append(
+        f"P95 change per scenario and engine against the previous {pack_report['mode']} pack run ({previous}); "
+        f"{pack_report['compared']} cells compared. Bold cells exceed the threshold (default {thresholds['p95'] * 100:.0f}% p95 "
+        f"beyond {thresholds['noiseMs']:g} ms, or a decode-rate drop over {thresholds['decodeRate'] * 100:.0f}pp). "
+        "Shading: ░ within threshold, ▒ up to 2x, ▓ up to 4x, █ beyond."
+    )
+    lines.append("")
+    flagged = {(cell["pack"], cell["scenario"]) for cell in pack_report["cells"] if cell["status"]}
+    if not flagged:
+        lines.append("_No significant changes._")
+        lines.append("")
+        return
+    engines = pack_report["engines"]
+    by_key = {(cell["pack"], cell["scenario"], cell["engine"]): cell for cell in pack_report["cells"]}
+    lines.append("| Pack | Scenario | " + " | ".join(engines) + " |")
+    lines.append("| --- | --- | " + " | ".join("---" for _ in engines) + " |")
+    for pack, scenario in sorted(flagged):
+        cells = [format_heatmap_cell(by_key.get((pack, scenario, engine))) for engine in engines]
+        lines.append(f"| {pack} | {scenario} | " + " | ".join(cells) + " |")
+    lines.append("")
+
+
+def find_pack_runner_report(artifacts_path: Path, run_mode: str, extension: str = "json"):
+    pack_dir = artifacts_path / "pack-runner"
+    if not pack_dir.exists():
+        return None
+    preferred = pack_dir / f"qr-decode-packs-{run_mode}.{extension}"
+    if preferred.exists():
+        return preferred
+    candidates = []
+    for path in pack_dir.glob(f"qr-decode-packs-*-{run_mode}.{extension}"):
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            mtime = 0
+        candidates.append((mtime, path))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda item: item[0], reverse=True)
+    return candidates[0][1]
+
+
+def load_pack_runner_payload(artifacts_path: Path, run_mode: str, cache: ParseCache | None = None):
+    report_path = find_pack_runner_report(artifacts_path, run_mode)
+    csv_path = find_pack_runner_report(artifacts_path, run_mode, "csv")
+    if not report_path and not csv_path:
+        return None
+
+    if report_path:
+        payload = cached_parse(cache, f"pack-runner:{run_mode}", report_path, lambda p: parse_pack_runner_report(p, run_mode))
+        payload["reportPath"] = str(report_path)
+    else:
+        payload = {"reportPath": None, "generatedUtc": None, "mode": run_mode, "packs": [], "engines": [], "note": None}
+    if csv_path:
+        payload["csvPath"] = str(csv_path)
+        payload["scenarios"] = cached_parse(cache, "pack-runner-csv", csv_path, aggregate_pack_runner_csv)
+        payload["diagnostics"] = cached_parse(cache, "pack-runner-diagnostics", csv_path, analyze_pack_diagnostics)
+    return payload
+
+
+def pack_size_bucket(width: float, height: float) -> str:
+    side = max(width, height)
+    for limit, label in PACK_SIZE_BUCKETS:
+        if side <= limit:
+            return label
+    return PACK_SIZE_BUCKET_LARGEST
+
+
+def aggregate_pack_runner_csv(path: Path):
+    groups: dict[tuple[str, str, str], dict] = {}
+    TIMINGS.read(path)
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            runs = parse_float(row.get("runs"))
+            if runs <= 0:
+                TIMINGS.count("packRowsDropped")
+                continue
+            TIMINGS.count("packRowsParsed")
+            bucket = pack_size_bucket(parse_float(row.get("width")), parse_float(row.get("height")))
+            key = (row.get("pack") or "unknown", row.get("engine") or "unknown", bucket)
+            acc = groups.get(key)
+            if acc is None:
+                acc = {
+                    "isExternal": (row.get("isExternal") or "").lower() == "true",
+                    "scenarios": 0,
+                    "runs": 0.0,
+                    "decodeWeighted": 0.0,
+                    "expectedWeighted": 0.0,
+                    "medianWeighted": 0.0,
+                    "p95Weighted": 0.0,
+                    "opsWeighted": 0.0,
+                    "maxP95Ms": 0.0,
+                }
+                groups[key] = acc
+            p95_ms = parse_float(row.get("p95Ms"))
+            acc["scenarios"] += 1
+            acc["runs"] += runs
+            acc["decodeWeighted"] += parse_float(row.get("decodeRate")) * runs
+            acc["expectedWeighted"] += parse_float(row.get("expectedRate")) * runs
+            acc["medianWeighted"] += parse_float(row.get("medianMs")) * runs
+            acc["p95Weighted"] += p95_ms * runs
+            acc["opsWeighted"] += parse_float(row.get("opsPerIteration"), 1.0) * runs
+            acc["maxP95Ms"] = max(acc["maxP95Ms"], p95_ms)
+
+    bucket_order = [label for _, label in PACK_SIZE_BUCKETS] + [PACK_SIZE_BUCKET_LARGEST]
+    items = []
+    for (pack, engine, bucket), acc in sorted(groups.items(), key=lambda item: (item[0][0], item[1]["isExternal"], item[0][1], bucket_order.index(item[0][2]))):
+        runs = acc["runs"]
+        items.append(
+            {
+                "pack": pack,
+                "engine": engine,
+                "isExternal": acc["isExternal"],
+                "sizeBucket": bucket,
+                "scenarios": acc["scenarios"],
+                "runs": runs,
+                "decodeRate": round(acc["decodeWeighted"] / runs, 4),
+                "expectedRate": round(acc["expectedWeighted"] / runs, 4),
+                "medianMs": round(acc["medianWeighted"] / runs, 3),
+                "p95Ms": round(acc["p95Weighted"] / runs, 3),
+                "maxP95Ms": round(acc["maxP95Ms"], 3),
+                "opsPerIteration": round(acc["opsWeighted"] / runs, 3),
+            }
+        )
+    return items
+
+
+def build_pack_runner_section(lines, pack_runner: dict | None):
+    scenarios = (pack_runner or {}).get("scenarios")
+    if not scenarios:
+        return
+    lines.append("### QR decode pack runner (scenarios)")
+    lines.append("")
+    lines.append("Aggregated per pack, engine and image size (longest side). Rates and latencies are weighted by runs.")
+    lines.append("")
+    lines.append("| Pack | Engine | Size | Scenarios | Runs | Decode rate | Expected rate | Median ms | P95 ms | Max P95 ms |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in scenarios:
+        lines.append(
+            f"| {item['pack']} | {item['engine']} | {item['sizeBucket']} | {item['scenarios']} | {item['runs']:g} | "
+            f"{item['decodeRate'] * 100:.0f}% | {item['expectedRate'] * 100:.0f}% | {item['medianMs']:.2f} | {item['p95Ms']:.2f} | {item['maxP95Ms']:.2f} |"
+        )
+    lines.append("")
+
+
+def diag_count_bucket(value: float) -> str:
+    for limit, label in DIAG_COUNT_BUCKETS:
+        if value <= limit:
+            return label
+    return DIAG_COUNT_BUCKET_LARGEST
+
+
+def pearson(n: int, sx: float, sy: float, sxx: float, syy: float, sxy: float):
+    if n < DIAG_MIN_CORRELATION_SAMPLES:
+        return None
+    var_x = n * sxx - sx * sx
+    var_y = n * syy - sy * sy
+    if var_x <= 0 or var_y <= 0:
+        return None
+    return round((n * sxy - sx * sy) / math.sqrt(var_x * var_y), 3)
+
+
+def analyze_pack_diagnostics(path: Path):
+    groups: dict[tuple[str, str], dict] = {}
+    buckets: dict[tuple[str, str, str], dict] = {}
+    failures: dict[tuple[str, str], dict] = {}
+    engine_totals: dict[str, float] = {}
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            runs = parse_float(row.get("runs"))
+            if runs <= 0 or row.get("diagCandidateMedian") in (None, ""):
+                continue
+            pack = row.get("pack") or "unknown"
+            engine = row.get("engine") or "unknown"
+            median_ms = parse_float(row.get("medianMs"))
+            p95_ms = parse_float(row.get("p95Ms"))
+            invert_rate = parse_float(row.get("diagInvertRate"))
+            success_rate = parse_float(row.get("diagSuccessRate"), 1.0)
+            values = {name: parse_float(row.get(column)) for column, name in DIAG_METRICS}
+
+            acc = groups.get((pack, engine))
+            if acc is None:
+                acc = {"n": 0, "runs": 0.0, "timeMs": 0.0, "inversionMs": 0.0, "sy": [0.0, 0.0], "syy": [0.0, 0.0], "metrics": {}}
+                groups[(pack, engine)] = acc
+            acc["n"] += 1
+            acc["runs"] += runs
+            acc["timeMs"] += median_ms * runs
+            acc["inversionMs"] += median_ms * runs * invert_rate / (1.0 + invert_rate)
+            for index, latency in enumerate((median_ms, p95_ms)):
+                acc["sy"][index] += latency
+                acc["syy"][index] += latency * latency
+            for name, value in values.items():
+                sums = acc["metrics"].setdefault(name, [0.0, 0.0, 0.0, 0.0])
+                sums[0] += value
+                sums[1] += value * value
+                sums[2] += value * median_ms
+                sums[3] += value * p95_ms
+
+            for dimension in ("candidates", "triples"):
+                key = (engine, dimension, diag_count_bucket(values[dimension]))
+                bucket = buckets.setdefault(key, {"scenarios": 0, "runs": 0.0, "medianWeighted": 0.0, "p95Weighted": 0.0})
+                bucket["scenarios"] += 1
+                bucket["runs"] += runs
+                bucket["medianWeighted"] += median_ms * runs
+                bucket["p95Weighted"] += p95_ms * runs
+
+            engine_totals[engine] = engine_totals.get(engine, 0.0) + median_ms * runs
+            failure = (row.get("diagTopFailure") or "").strip().lower()
+            if failure and failure != "ok" and failure != "none":
+                item = failures.setdefault((engine, failure), {"scenarios": 0, "runs": 0.0, "costMs": 0.0, "failureWeighted": 0.0, "packs": {}})
+                cost = median_ms * runs * (1.0 - success_rate)
+                item["scenarios"] += 1
+                item["runs"] += runs
+                item["costMs"] += cost
+                item["failureWeighted"] += (1.0 - success_rate) * runs
+                item["packs"][pack] = item["packs"].get(pack, 0.0) + cost
+
+    correlations = []
+    for (pack, engine), acc in sorted(groups.items()):
+        n = acc["n"]
+        metrics = {}
+        for name, (sx, sxx, sx_median, sx_p95) in acc["metrics"].items():
+            metrics[name] = {
+                "medianMs": pearson(n, sx, acc["sy"][0], sxx, acc["syy"][0], sx_median),
+                "p95Ms": pearson(n, sx, acc["sy"][1], sxx, acc["syy"][1], sx_p95),
+                "mean": round(sx / n, 3),
+            }
+        ranked = [(abs(value["p95Ms"]), name) for name, value in metrics.items() if value["p95Ms"] is not None]
+        correlations.append(
+            {
+                "pack": pack,
+                "engine": engine,
+                "scenarios": n,
+                "medianMs": round(acc["timeMs"] / acc["runs"], 3),
+                "inversionMs": round(acc["inversionMs"] / acc["runs"], 3),
+                "inversionShare": round(acc["inversionMs"] / acc["timeMs"], 4) if acc["timeMs"] else 0.0,
+                "metrics": metrics,
+                "strongestDriver": max(ranked)[1] if ranked else None,
+            }
+        )
+
+    bucket_order = [label for _, label in DIAG_COUNT_BUCKETS] + [DIAG_COUNT_BUCKET_LARGEST]
+    latency_by_count = []
+    for (engine, dimension, label), bucket in sorted(buckets.items(), key=lambda item: (item[0][0], item[0][1], bucket_order.index(item[0][2]))):
+        latency_by_count.append(
+            {
+                "engine": engine,
+                "dimension": dimension,
+                "bucket": label,
+                "scenarios": bucket["scenarios"],
+                "medianMs": round(bucket["medianWeighted"] / bucket["runs"], 3),
+                "p95Ms": round(bucket["p95Weighted"] / bucket["runs"], 3),
+            }
+        )
+
+    taxonomy = []
+    for (engine, failure), item in failures.items():
+        taxonomy.append(
+            {
+                "engine": engine,
+                "failure": failure,
+                "scenarios": item["scenarios"],
+                "failureRate": round(item["failureWeighted"] / item["runs"], 4),
+                "costMs": round(item["costMs"], 3),
+                "costShare": round(item["costMs"] / engine_totals[engine], 4) if engine_totals.get(engine) else 0.0,
+                "topPacks": [pack for pack, _ in sorted(item["packs"].items(), key=lambda entry: -entry[1])[:3]],
+            }
+        )
+    taxonomy.sort(key=lambda item: (-item["costMs"], item["engine"], item["failure"]))
+    if not correlations:
+        return None
+    return {"correlations": correlations, "latencyByCount": latency_by_count, "failures": taxonomy}
+
+
+def format_correlation(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:+.2f}"
+
+
+def build_pack_diagnostics_section(lines, pack_runner: dict | None):
+    diagnostics = (pack_runner or {}).get("diagnostics")
+    if not diagnostics:
+        return
+    lines.append("### QR decode diagnostics attribution")
+    lines.append("")
+    lines.append(
+        "Pearson correlation of the per-scenario diagnostics with median latency (r, per pack and engine). "
+        "Inversion time assumes an inverted retry repeats the decode; the driver is the diagnostic most correlated with P95."
+    )
+    lines.append("")
+    lines.append("| Pack | Engine | Scenarios | Median ms | r candidates | r triples | r invert | r dimension | Inversion ms (share) | Driver (P95) |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in diagnostics["correlations"]:
+        metrics = item["metrics"]
+        lines.append(
+            f"| {item['pack']} | {item['engine']} | {item['scenarios']} | {item['medianMs']:.2f} | "
+            + " | ".join(format_correlation(metrics[name]["medianMs"]) for name in ("candidates", "triples", "invertRate", "dimension"))
+            + f" | {item['inversionMs']:.2f} ({item['inversionShare'] * 100:.0f}%) | {item['strongestDriver'] or 'n/a'} |"
+        )
+    lines.append("")
+    lines.append("Latency by finder candidates and triples (median per scenario, runs weighted):")
+    lines.append("")
+    lines.append("| Engine | Diagnostic | Bucket | Scenarios | Median ms | P95 ms |")
+    lines.append("| --- | --- | --- | --- | --- | --- |")
+    for item in diagnostics["latencyByCount"]:
+        lines.append(
+            f"| {item['engine']} | {item['dimension']} | {item['bucket']} | {item['scenarios']} | {item['medianMs']:.2f} | {item['p95Ms']:.2f} |"
+        )
+    lines.append("")
+    if diagnostics["failures"]:
+        lines.append("Failure taxonomy ranked by latency cost (runs x median ms x failure rate):")
+        lines.append("")
+        lines.append("| Engine | Top failure | Scenarios | Failure rate | Cost ms | Share of engine time | Top packs |")
+        lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+        for item in diagnostics["failures"]:
+            lines.append(
+                f"| {item['engine']} | {item['failure']} | {item['scenarios']} | {item['failureRate'] * 100:.0f}% | {item['costMs']:.1f} | "
+                f"{item['costShare'] * 100:.1f}% | {', '.join(item['topPacks'])} |"
+            )
+        lines.append("")
+
+
+def parse_pack_runner_report(report_path: Path, run_mode: str):
+    TIMINGS.read(report_path)
+    raw = json.loads(report_path.read_text(encoding="utf-8-sig"))
+
+    def get_field(obj: dict, *names, default=None):
+        if not isinstance(obj, dict):
+            return default
+        for name in names:
+            if name in obj:
+                return obj[name]
+        return default
+
+    packs_raw = get_field(raw, "Packs", "packs", default=[]) or []
+    engines_acc: dict[str, dict] = {}
+    pack_summaries = []
+
+    for pack in packs_raw:
+        pack_name = get_field(pack, "Name", "name", default="unknown")
+        scenario_count = int(get_field(pack, "ScenarioCount", "scenarioCount", default=0) or 0)
+        engines_raw = get_field(pack, "Engines", "engines", default=[]) or []
+        engine_summaries = []
+
+        for engine in engines_raw:
+            engine_name = get_field(engine, "Name", "name", default="unknown")
+            is_external = bool(get_field(engine, "IsExternal", "isExternal", default=False))
+            runs = float(get_field(engine, "Runs", "runs", default=0) or 0)
+            decode_rate = float(get_field(engine, "DecodeRate", "decodeRate", default=0) or 0)
+            expected_rate = float(get_field(engine, "ExpectedRate", "expectedRate", default=0) or 0)
+            median_ms = float(get_field(engine, "MedianMs", "medianMs", default=0) or 0)
+            p95_ms = float(get_field(engine, "P95Ms", "p95Ms", default=0) or 0)
+
+            scenarios = get_field(engine, "Scenarios", "scenarios", default=[]) or []
+            failing_scenarios = []
+            scenario_stats = []
+            for scenario in scenarios:
+                scenario_name = get_field(scenario, "Name", "name", default=None)
+                if not scenario_name:
+                    continue
+                scenario_stats.append(
+                    {
+                        "name": scenario_name,
+                        "medianMs": round(float(get_field(scenario, "MedianMs", "medianMs", default=0) or 0), 3),
+                        "p95Ms": round(float(get_field(scenario, "P95Ms", "p95Ms", default=0) or 0), 3),
+                        "decodeRate": round(float(get_field(scenario, "DecodeRate", "decodeRate", default=0) or 0), 4),
+                    }
+                )
+                scenario_expected = float(get_field(scenario, "ExpectedRate", "expectedRate", default=1) or 1)
+                if scenario_expected < 0.9999:
+                    failing_scenarios.append(scenario_name)
+
+            engine_summaries.append(
+                {
+                    "name": engine_name,
+                    "isExternal": is_external,
+                    "runs": runs,
+                    "decodeRate": decode_rate,
+                    "expectedRate": expected_rate,
+                    "medianMs": median_ms,
+                    "p95Ms": p95_ms,
+                    "failingScenarios": failing_scenarios,
+                    "scenarios": scenario_stats,
+                }
+            )
+
+            acc = engines_acc.get(engine_name)
+            if not acc:
+                acc = {
+                    "name": engine_name,
+                    "isExternal": is_external,
+                    "runs": 0.0,
+                    "decodeWeighted": 0.0,
+                    "expectedWeighted": 0.0,
+                    "failingScenarios": set(),
+                    "failingPacks": set(),
+                }
+                engines_acc[engine_name] = acc
+            acc["runs"] += runs
+            acc["decodeWeighted"] += decode_rate * runs
+            acc["expectedWeighted"] += expected_rate * runs
+            if failing_scenarios:
+                acc["failingScenarios"].update(failing_scenarios)
+                acc["failingPacks"].add(pack_name)
+
+        pack_summaries.append(
+            {
+                "name": pack_name,
+                "scenarioCount": scenario_count,
+                "engines": engine_summaries,
+            }
+        )
+
+    engines_summary = []
+    for acc in engines_acc.values():
+        runs = acc["runs"] or 0.0
+        decode_rate = acc["decodeWeighted"] / runs if runs else None
+        expected_rate = acc["expectedWeighted"] / runs if runs else None
+        engines_summary.append(
+            {
+                "name": acc["name"],
+                "isExternal": acc["isExternal"],
+                "runs": runs,
+                "decodeRate": decode_rate,
+                "expectedRate": expected_rate,
+                "failingScenarios": sorted(acc["failingScenarios"]),
+                "failingPacks": sorted(acc["failingPacks"]),
+            }
+        )
+
+    def fmt_pct(value: float | None):
+        if value is None:
+            return "n/a"
+        return f"{value * 100.0:.0f}%"
+
+    engines_for_note = sorted(engines_summary, key=lambda e: (e["isExternal"], e["name"]))
+    note_bits = []
+    for engine in engines_for_note:
+        bit = f"{engine['name']} expected={fmt_pct(engine['expectedRate'])}"
+        failing = engine["failingScenarios"][:4]
+        if failing:
+            bit += " (misses: " + ", ".join(failing) + ")"
+        note_bits.append(bit)
+
+    note = None
+    if note_bits:
+        note = f"QR pack runner ({run_mode}): " + "; ".join(note_bits)
+
+    payload = {
+        "reportPath": str(report_path),
+        "generatedUtc": get_field(raw, "DateUtc", "dateUtc", default=None),
+        "mode": run_mode,
+        "packs": pack_summaries,
+        "engines": engines_for_note,
+        "note": note,
+    }
+    return payload
@@ -0,0 +1,235 @@
+import argparse
+import datetime as dt
+import json
+import re
+from pathlib import Path
+
+from .common import DEFAULT_PRIMARY_FRAMEWORK, TITLE_MAP, atomic_write_text, runtime_framework
+from .results import IngestedRun, compute_missing_compare, ingest_artifacts, split_by_framework
+from .history import DEFAULT_HISTORY_PATH, open_history
+
+
+RERUN_SECONDS_PER_CASE = {"quick": 6.0, "full": 40.0}
+RERUN_INVOCATION_OVERHEAD_SECONDS = 60.0
+DEFAULT_RERUN_BUDGET_MINUTES = 15.0
+DEFAULT_RERUN_MAX_RELATIVE_ERROR = 0.05
+DEFAULT_RERUN_MAX_RATIO_CV = 0.10
+BDN_RUN_TIME_RE = re.compile(r"Run time: [^(]*\((\d+(?:\.\d+)?) sec\), executed benchmarks: (\d+)")
+
+
+def estimate_seconds_per_case(artifacts_path: Path, run_mode: str) -> tuple[float, str]:
+    seconds = 0.0
+    cases = 0
+    for log_path in sorted(artifacts_path.rglob("*.log")):
+        for match in BDN_RUN_TIME_RE.finditer(log_path.read_text(encoding="utf-8", errors="ignore")):
+            seconds += float(match.group(1))
+            cases += int(match.group(2))
+    if cases:
+        return seconds / cases, "logs"
+    return RERUN_SECONDS_PER_CASE[run_mode], "default"
+
+
+def query_ratio_instability(path: Path, os_name: str, run_mode: str, framework: str | None, last: int):
+    if not path.exists():
+        return {}
+    connection = open_history(path)
+    try:
+        run_ids = [
+            row[0]
+            for row in connection.execute(
+                "SELECT id FROM runs WHERE os = ? AND run_mode = ? AND framework IS ? ORDER BY generated_utc DESC LIMIT ?",
+                (os_name, run_mode, framework, last),
+            ).fetchall()
+        ]
+        if not run_ids:
+            return {}
+        placeholders = ",".join("?" for _ in run_ids)
+        rows = connection.execute(
+            f"SELECT run_id, benchmark, scenario, vendor, mean_ns FROM results WHERE run_id IN ({placeholders}) AND mean_ns > 0",
+            run_ids,
+        ).fetchall()
+    finally:
+        connection.close()
+    per_run: dict[tuple[str, str, int], dict[str, float]] = {}
+    for run_id, benchmark, scenario, vendor, mean_ns in rows:
+        per_run.setdefault((benchmark, scenario, run_id), {})[vendor] = mean_ns
+    ratios: dict[tuple[str, str], list[float]] = {}
+    for (benchmark, scenario, _), vendors in per_run.items():
+        if len(vendors) > 1 and "CodeGlyphX" in vendors:
+            ratios.setdefault((benchmark, scenario), []).append(vendors["CodeGlyphX"] / min(vendors.values()))
+    instability = {}
+    for key, values in ratios.items():
+        if len(values) < 3:
+            continue
+        mean = sum(values) / len(values)
+        variance = sum((value - mean) ** 2 for value in values) / (len(values) - 1)
+        instability[key] = variance ** 0.5 / mean
+    return instability
+
+
+def build_rerun_plan(
+    run: IngestedRun,
+    history_path: Path | None,
+    budget_seconds: float,
+    max_relative_error: float,
+    max_ratio_cv: float,
+    history_runs: int = 10,
+):
+    results = run.results
+    seconds_per_case, duration_source = estimate_seconds_per_case(run.artifacts_path, run.run_mode)
+    instability = query_ratio_instability(history_path, run.os_name, run.run_mode, run.framework, history_runs) if history_path else {}
+    candidates = []
+    reports = [(report, False) for report in results.baseline] + [(report, True) for report in results.comparisons]
+    for report, compare in reports:
+        score = 0.0
+        methods = []
+        for row in report.rows:
+            if row.mean_ns is None:
+                score += 2.0
+                methods.append({"method": row.method, "reason": "no data"})
+                continue
+            relative_error = (row.error_ns or 0.0) / row.mean_ns
+            if relative_error > max_relative_error:
+                score += relative_error / max_relative_error
+                methods.append({"method": row.method, "reason": "noisy", "relativeError": round(relative_error, 4)})
+        for scenario in report.scenarios if compare else ():
+            cv = instability.get((report.id, scenario))
+            if cv is not None and cv > max_ratio_cv:
+                score += cv / max_ratio_cv
+                methods.append({"method": scenario, "reason": "unstable ratio", "ratioCv": round(cv, 4)})
+        if not methods:
+            continue
+        reasons = sorted({method["reason"] for method in methods})
+        candidates.append(
+            {
+                "class": report.id,
+                "title": report.title,
+                "kind": "compare" if compare else "base",
+                "score": round(score, 3),
+                "reasons": reasons,
+                "cases": len(report.rows),
+                "estimatedSeconds": round(len(report.rows) * seconds_per_case, 1),
+                "methods": sorted(methods, key=lambda item: -(item.get("relativeError") or item.get("ratioCv") or 1.0)),
+            }
+        )
+    typical_cases = sorted(len(report.rows) for report in results.comparisons)[len(results.comparisons) // 2] if results.comparisons else 4
+    _, _, _, missing_ids = compute_missing_compare(results.compare_files)
+    for class_id in missing_ids:
+        candidates.append(
+            {
+                "class": class_id,
+                "title": TITLE_MAP.get(class_id, class_id),
+                "kind": "compare",
+                "score": 1000.0,
+                "reasons": ["missing"],
+                "cases": typical_cases,
+                "estimatedSeconds": round(typical_cases * seconds_per_case, 1),
+                "methods": [],
+            }
+        )
+
+    candidates.sort(key=lambda item: (-item["score"] / max(item["estimatedSeconds"], 1.0), item["class"]))
+    candidates.sort(key=lambda item: item["score"] < 1000.0)
+    selected = []
+    spent = 0.0
+    invocations = set()
+    for item in candidates:
+        overhead = 0.0 if item["kind"] in invocations else RERUN_INVOCATION_OVERHEAD_SECONDS
+        if spent + overhead + item["estimatedSeconds"] > budget_seconds:
+            item["selected"] = False
+            continue
+        item["selected"] = True
+        spent += overhead + item["estimatedSeconds"]
+        invocations.add(item["kind"])
+        selected.append(item)
+
+    compare_filter = " ".join(f"*.{item['class']}.*" for item in selected if item["kind"] == "compare")
+    base_filter = " ".join(f"*.{item['class']}.*" for item in selected if item["kind"] == "base")
+    sh_args = ["--full"] if run.run_mode == "full" else []
+    ps_args = ["-Full"] if run.run_mode == "full" else []
+    sh_args.append("--allow-partial")
+    ps_args.append("-AllowPartial")
+    if base_filter:
+        sh_args.append(f"--base-filter '{base_filter}'")
+        ps_args.append(f"-BaseFilter '{base_filter}'")
+    else:
+        sh_args.append("--no-base")
+        ps_args.append("-NoBase")
+    if compare_filter:
+        sh_args.append(f"--compare-filter '{compare_filter}'")
+        ps_args.append(f"-CompareFilter '{compare_filter}'")
+    else:
+        sh_args.append("--no-compare")
+        ps_args.append("-NoCompare")
+    return {
+        "generatedUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "artifacts": str(run.artifacts_path),
+        "os": run.os_name,
+        "runMode": run.run_mode,
+        "framework": run.framework,
+        "budgetSeconds": budget_seconds,
+        "estimatedSeconds": round(spent, 1),
+        "secondsPerCase": round(seconds_per_case, 2),
+        "durationSource": duration_source,
+        "thresholds": {"relativeError": max_relative_error, "ratioCv": max_ratio_cv},
+        "baseFilter": base_filter or None,
+        "compareFilter": compare_filter or None,
+        "commands": {
+            "sh": "Build/run-benchmarks-compare.sh " + " ".join(sh_args) if selected else None,
+            "pwsh": "Build/Run-Benchmarks-Compare.ps1 " + " ".join(ps_args) if selected else None,
+        },
+        "candidates": candidates,
+    }
+
+
+def plan_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="generate-benchmark-report.py plan",
+        description="Plan a targeted re-run of missing, noisy or unstable benchmark classes within a time budget.",
+    )
+    parser.add_argument("--artifacts-path", required=True)
+    parser.add_argument("--os-name", default=None, choices=["windows", "linux", "macos"])
+    parser.add_argument("--run-mode", default=None, choices=["quick", "full"])
+    parser.add_argument("--framework", default=None, help="target framework to plan for when the artifacts hold several (default: the host runtime)")
+    parser.add_argument("--budget-minutes", type=float, default=DEFAULT_RERUN_BUDGET_MINUTES)
+    parser.add_argument("--max-relative-error", type=float, default=DEFAULT_RERUN_MAX_RELATIVE_ERROR, help="Error / Mean above which a method counts as noisy")
+    parser.add_argument("--max-ratio-cv", type=float, default=DEFAULT_RERUN_MAX_RATIO_CV, help="CodeGlyphX vs fastest variation across history runs")
+    parser.add_argument("--history-path", default=None)
+    parser.add_argument("--no-history", action="store_true")
+    parser.add_argument("--json-output", default=None)
+    args = parser.parse_args(argv)
+
+    run = ingest_artifacts(Path(args.artifacts_path).resolve(), args.os_name, args.run_mode)
+    host = runtime_framework((run.environment or {}).get("runtime")) or DEFAULT_PRIMARY_FRAMEWORK
+    runs = {item.framework: item for item in split_by_framework([run], host)}
+    framework = args.framework or (host if host in runs else next(iter(runs)))
+    if framework not in runs:
+        raise SystemExit(f"No results for {framework} in {args.artifacts_path} (found: {', '.join(runs)}).")
+    run = runs[framework]
+    history_path = None if args.no_history else (Path(args.history_path).resolve() if args.history_path else DEFAULT_HISTORY_PATH)
+    plan = build_rerun_plan(run, history_path, args.budget_minutes * 60.0, args.max_relative_error, args.max_ratio_cv)
+    if args.json_output:
+        atomic_write_text(Path(args.json_output), json.dumps(plan, indent=2))
+
+    print(f"Re-run plan for {plan['os']}/{plan['runMode']} {plan['framework']} ({plan['artifacts']})")
+    print(
+        f"Budget {plan['budgetSeconds'] / 60:.0f} min, estimated {plan['estimatedSeconds'] / 60:.1f} min "
+        f"({plan['secondsPerCase']:g}s per case from {plan['durationSource']})."
+    )
+    if not plan["candidates"]:
+        print("Nothing to re-run: no missing classes, noisy methods or unstable ratios.")
+        return
+    print("")
+    print("| Class | Kind | Score | Reasons | Cases | Est. time | Selected | Worst methods |")
+    print("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for item in plan["candidates"]:
+        worst = ", ".join(method["method"] for method in item["methods"][:3])
+        print(
+            f"| {item['class']} | {item['kind']} | {item['score']:g} | {', '.join(item['reasons'])} | {item['cases']} | "
+            f"{item['estimatedSeconds']:.0f}s | {'yes' if item['selected'] else 'no (budget)'} | {worst} |"
+        )
+    if plan["commands"]["sh"]:
+        print("")
+        print(plan["commands"]["sh"])
+        print(plan["commands"]["pwsh"])
+        print("Copy the re-run CSVs over the originals in the artifacts results folder before regenerating, so untouched classes are kept.")
@@ -0,0 +1,276 @@
+import math
+
+from .common import DEFAULT_PRIMARY_FRAMEWORK, OS_NAMES, format_duration_ns, framework_sort_key, get_stored_payload, parse_allocated_bytes
+from .gates import format_budget_value
+
+
+CROSS_OS_DEVIATION = 0.25
+CROSS_OS_REFERENCE = "linux"
+
+
+def index_codeglyphx_results(payload: dict):
+    results = {}
+    for report in payload.get("baseline") or []:
+        for item in report.get("scenarios") or []:
+            if item.get("meanNs"):
+                results[(report.get("title") or report.get("id"), item.get("name"))] = {
+                    "meanNs": item["meanNs"],
+                    "allocatedBytes": parse_allocated_bytes(item.get("allocated") or ""),
+                }
+    for report in payload.get("comparisons") or []:
+        for item in report.get("scenarios") or []:
+            cgx = (item.get("vendors") or {}).get("CodeGlyphX") or {}
+            if cgx.get("meanNs"):
+                results[(report.get("title") or report.get("id"), item.get("name"))] = {
+                    "meanNs": cgx["meanNs"],
+                    "allocatedBytes": parse_allocated_bytes(cgx.get("allocated") or ""),
+                }
+    return results
+
+
+def index_codeglyphx_means(payload: dict):
+    return {key: value["meanNs"] for key, value in index_codeglyphx_results(payload).items()}
+
+
+def describe_host(payload: dict):
+    meta = payload.get("meta") or {}
+    environment = payload.get("environment") or {}
+    run_meta = meta if meta.get("hostSource") else {}
+    calibration = run_meta.get("calibration") or {}
+    return {
+        "os": environment.get("os") or run_meta.get("osDescription"),
+        "cpuModel": environment.get("cpuModel") or run_meta.get("cpuModel"),
+        "cores": environment.get("logicalCores") or run_meta.get("processorCount"),
+        "runtime": environment.get("runtime") or run_meta.get("runtime"),
+        "architecture": environment.get("processArchitecture") or run_meta.get("processArchitecture"),
+        "machineName": run_meta.get("machineName"),
+        "fingerprint": run_meta.get("cpuFingerprint"),
+        "calibration": calibration.get("score"),
+        "generatedUtc": payload.get("generatedUtc"),
+    }
+
+
+def build_cross_os_report(data: dict, run_mode: str):
+    payloads = {os_name: get_stored_payload(data, os_name, run_mode) for os_name in OS_NAMES}
+    payloads = {os_name: payload for os_name, payload in payloads.items() if payload}
+    if len(payloads) < 2:
+        return None
+    reference = CROSS_OS_REFERENCE if CROSS_OS_REFERENCE in payloads else next(iter(payloads))
+    hosts = {os_name: describe_host(payload) for os_name, payload in payloads.items()}
+    means = {os_name: index_codeglyphx_means(payload) for os_name, payload in payloads.items()}
+    calibrated = all(host["calibration"] for host in hosts.values())
+    normalized = {
+        os_name: {key: value * (hosts[os_name]["calibration"] if calibrated else 1.0) for key, value in values.items()}
+        for os_name, values in means.items()
+    }
+    others = [os_name for os_name in payloads if os_name != reference]
+    ratios = {
+        os_name: {key: value / normalized[reference][key] for key, value in normalized[os_name].items() if normalized[reference].get(key)}
+        for os_name in others
+    }
+    typical = {}
+    for os_name, values in ratios.items():
+        ordered = sorted(values.values())
+        typical[os_name] = ordered[len(ordered) // 2] if ordered else None
+
+    rows = []
+    keys = sorted({key for values in means.values() for key in values})
+    for key in keys:
+        row = {"benchmark": key[0], "scenario": key[1], "meanNs": {}, "normalizedNs": {}, "ratios": {}, "deviations": {}, "flags": []}
+        for os_name in payloads:
+            if key in means[os_name]:
+                row["meanNs"][os_name] = means[os_name][key]
+                row["normalizedNs"][os_name] = round(normalized[os_name][key], 3)
+        for os_name in others:
+            ratio = ratios[os_name].get(key)
+            if ratio is None or not typical[os_name]:
+                continue
+            deviation = ratio / typical[os_name]
+            row["ratios"][os_name] = round(ratio, 3)
+            row["deviations"][os_name] = round(deviation, 3)
+            if deviation > 1.0 + CROSS_OS_DEVIATION:
+                row["flags"].append(f"slower on {os_name}")
+            elif deviation < 1.0 / (1.0 + CROSS_OS_DEVIATION):
+                row["flags"].append(f"faster on {os_name}")
+        if len(row["meanNs"]) > 1:
+            rows.append(row)
+    return {
+        "runMode": run_mode,
+        "reference": reference,
+        "hosts": hosts,
+        "calibrated": calibrated,
+        "typicalRatios": {os_name: round(value, 3) if value else None for os_name, value in typical.items()},
+        "deviationThreshold": CROSS_OS_DEVIATION,
+        "rows": rows,
+    }
+
+
+def build_cross_os_section(report: dict | None, run_mode: str) -> str:
+    title = "Quick" if run_mode == "quick" else "Full"
+    lines = [f"## Cross-OS ({title})", ""]
+    if not report:
+        lines.append("_Needs results from at least two OSes._")
+        return "\n".join(lines)
+    reference = report["reference"]
+    lines.append("| OS | Host | CPU | Cores | Runtime | Arch | Calibration | Updated |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for os_name, host in report["hosts"].items():
+        calibration = f"{host['calibration']:.2f}" if host["calibration"] else "n/a"
+        lines.append(
+            f"| {os_name} | {host.get('machineName') or host.get('os') or ''} | {host['cpuModel'] or ''} | {host['cores'] or ''} | "
+            f"{host['runtime'] or ''} | {host['architecture'] or ''} | {calibration} | {host['generatedUtc'] or ''} |"
+        )
+    lines.append("")
+    normalization = "scaled by each host's calibration score" if report["calibrated"] else "raw (at least one host has no calibration score)"
+    typical = ", ".join(f"{os_name}/{reference} {value:.2f} x" for os_name, value in report["typicalRatios"].items() if value)
+    lines.append(
+        f"CodeGlyphX means {normalization}. Ratios are vs {reference}; typical ratio: {typical or 'n/a'}. "
+        f"Scenarios more than {report['deviationThreshold'] * 100:.0f}% away from the typical ratio are flagged."
+    )
+    lines.append("")
+    os_names = list(report["hosts"])
+    others = [os_name for os_name in os_names if os_name != reference]
+    lines.append(
+        "| Benchmark | Scenario | "
+        + " | ".join(os_names)
+        + " | "
+        + " | ".join(f"{os_name}/{reference}" for os_name in others)
+        + " | Flag |"
+    )
+    lines.append("| --- | --- | " + " | ".join("---" for _ in os_names + others) + " | --- |")
+    for row in report["rows"]:
+        cells = [format_duration_ns(row["normalizedNs"].get(os_name)) for os_name in os_names]
+        ratio_cells = [f"{row['ratios'][os_name]:.2f} x" if os_name in row["ratios"] else "" for os_name in others]
+        flags = ", ".join(f"**{flag}**" for flag in row["flags"])
+        lines.append(f"| {row['benchmark']} | {row['scenario']} | " + " | ".join(cells + ratio_cells) + f" | {flags} |")
+    return "\n".join(lines)
+
+
+def get_runtime_payload(data: dict, os_name: str, run_mode: str, framework: str):
+    payload = (((data.get("runtimes") or {}).get(os_name) or {}).get(run_mode) or {}).get(framework)
+    return payload if isinstance(payload, dict) else None
+
+
+def store_runtime_payload(data: dict, payload: dict):
+    runtimes = data.setdefault("runtimes", {})
+    runtimes.setdefault(payload["os"], {}).setdefault(payload["runMode"], {})[payload["framework"]] = payload
+
+
+def store_primary_payload(data: dict, payload: dict):
+    displaced = get_stored_payload(data, payload["os"], payload["runMode"])
+    if displaced and (displaced.get("framework") or DEFAULT_PRIMARY_FRAMEWORK) != payload["framework"]:
+        store_runtime_payload(data, dict(displaced, framework=displaced.get("framework") or DEFAULT_PRIMARY_FRAMEWORK))
+    (((data.get("runtimes") or {}).get(payload["os"]) or {}).get(payload["runMode"]) or {}).pop(payload["framework"], None)
+    data[payload["os"]][payload["runMode"]] = payload
+
+
+def build_runtime_report(data: dict, run_mode: str):
+    systems = {}
+    for os_name in OS_NAMES:
+        payloads = {}
+        primary = get_stored_payload(data, os_name, run_mode)
+        if primary:
+            payloads[primary.get("framework") or DEFAULT_PRIMARY_FRAMEWORK] = primary
+        for framework, payload in (((data.get("runtimes") or {}).get(os_name) or {}).get(run_mode) or {}).items():
+            if isinstance(payload, dict):
+                payloads[framework] = payload
+        if len(payloads) < 2:
+            continue
+        frameworks = sorted(payloads, key=framework_sort_key)
+        results = {framework: index_codeglyphx_results(payloads[framework]) for framework in frameworks}
+        rows = []
+        step_totals: dict[tuple[str, str], list] = {}
+        for key in sorted({key for values in results.values() for key in values}):
+            present = [framework for framework in frameworks if key in results[framework]]
+            if len(present) < 2:
+                continue
+            steps = []
+            for before, after in zip(present, present[1:]):
+                old, new = results[before][key], results[after][key]
+                speedup = old["meanNs"] / new["meanNs"]
+                alloc_change = None
+                if old["allocatedBytes"] and new["allocatedBytes"] is not None:
+                    alloc_change = round(new["allocatedBytes"] / old["allocatedBytes"] - 1.0, 4)
+                steps.append({"from": before, "to": after, "speedup": round(speedup, 3), "allocChange": alloc_change})
+                step_totals.setdefault((before, after), []).append((speedup, key))
+            rows.append(
+                {
+                    "benchmark": key[0],
+                    "scenario": key[1],
+                    "frameworks": {framework: results[framework][key] for framework in present},
+                    "steps": steps,
+                }
+            )
+        summary = []
+        for (before, after), values in step_totals.items():
+            ordered = sorted(values)
+            summary.append(
+                {
+                    "from": before,
+                    "to": after,
+                    "scenarios": len(values),
+                    "geomeanSpeedup": round(math.exp(sum(math.log(value) for value, _ in values) / len(values)), 3),
+                    "best": {"benchmark": ordered[-1][1][0], "scenario": ordered[-1][1][1], "speedup": round(ordered[-1][0], 3)},
+                    "worst": {"benchmark": ordered[0][1][0], "scenario": ordered[0][1][1], "speedup": round(ordered[0][0], 3)},
+                }
+            )
+        summary.sort(key=lambda item: (framework_sort_key(item["from"]), framework_sort_key(item["to"])))
+        systems[os_name] = {
+            "frameworks": frameworks,
+            "generatedUtc": {framework: payloads[framework].get("generatedUtc") for framework in frameworks},
+            "steps": summary,
+            "rows": rows,
+        }
+    if not systems:
+        return None
+    return {"runMode": run_mode, "os": systems}
+
+
+def format_runtime_step(step: dict | None) -> str:
+    if not step:
+        return ""
+    alloc = f", alloc {step['allocChange'] * 100:+.0f}%" if step["allocChange"] is not None else ""
+    return f"{step['speedup']:.2f} x{alloc}"
+
+
+def build_runtime_section(report: dict | None, run_mode: str) -> str:
+    title = "Quick" if run_mode == "quick" else "Full"
+    lines = [f"## Runtimes ({title})", ""]
+    if not report:
+        lines.append("_Needs results for at least two target frameworks on the same OS._")
+        return "\n".join(lines)
+    lines.append("CodeGlyphX mean / allocated per target framework. Speedup is old mean / new mean (above 1 x = faster after upgrading).")
+    lines.append("")
+    for os_name, system in report["os"].items():
+        frameworks = system["frameworks"]
+        lines.append(f"### {os_name} ({' → '.join(frameworks)})")
+        lines.append("")
+        for step in system["steps"]:
+            lines.append(
+                f"- {step['from']} → {step['to']}: geomean {step['geomeanSpeedup']:.2f} x over {step['scenarios']} scenarios; "
+                f"best {step['best']['scenario']} ({step['best']['speedup']:.2f} x), worst {step['worst']['scenario']} ({step['worst']['speedup']:.2f} x)."
+            )
+        lines.append("")
+        pairs = list(zip(frameworks, frameworks[1:]))
+        lines.append(
+            "| Benchmark | Scenario | "
+            + " | ".join(frameworks)
+            + " | "
+            + " | ".join(f"{before} → {after}" for before, after in pairs)
+            + " |"
+        )
+        lines.append("| --- | --- | " + " | ".join("---" for _ in frameworks + pairs) + " |")
+        for row in system["rows"]:
+            cells = []
+            for framework in frameworks:
+                value = row["frameworks"].get(framework)
+                if not value:
+                    cells.append("")
+                    continue
+                alloc = format_budget_value("maxAllocatedBytes", value["allocatedBytes"]) if value["allocatedBytes"] is not None else "—"
+                cells.append(f"{format_duration_ns(value['meanNs'])} / {alloc}")
+            steps = {(step["from"], step["to"]): step for step in row["steps"]}
+            cells.extend(format_runtime_step(steps.get(pair)) for pair in pairs)
+            lines.append(f"| {row['benchmark']} | {row['scenario']} | " + " | ".join(cells) + " |")
+        lines.append("")
+    return "\n".join(lines).rstrip()
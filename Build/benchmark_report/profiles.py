@@ -0,0 +1,428 @@
+import json
+import re
+import sys
+from pathlib import Path
+
+from .common import BENCH_PREFIX, ParseCache, TITLE_MAP, cached_parse, runtime_framework, strip_benchmark_prefix
+
+
+PROFILE_GLOB = "*.speedscope.json"
+PROFILE_TIMESTAMP_RE = re.compile(r"-\d{8}-\d{6}$")
+PROFILE_GENERIC_RE = re.compile(r"\[[^\[\]]*\]")
+PROFILE_UNITS_MS = {"nanoseconds": 1e-6, "microseconds": 1e-3, "milliseconds": 1.0, "seconds": 1000.0}
+PROFILE_HARNESS_PREFIXES = ("CodeGlyphX.Benchmarks", "BenchmarkDotNet")
+HOT_FRAME_LIMIT = 10
+DISASM_GLOB = "*-asm.md"
+DISASM_TOTAL_RE = re.compile(r"^;\s*Total bytes of code (\d+)")
+DISASM_LABEL_RE = re.compile(r"^[\w.$]+:$")
+DISASM_CALL_MNEMONICS = {"call", "bl", "blr"}
+DISASM_BOUNDS_CHECK_HELPER = "CORINFO_HELP_RNGCHKFAIL"
+DISASM_VECTOR_RE = re.compile(r"\b[yz]mm\d+\b|^v?p[a-z]+\d*\s.*\bxmm\d+|^v?\w+p[sd]\s.*\bxmm\d+|\bv\d+\.\d*[bhsd]\b")
+DISASM_METRICS = (
+    ("codeBytes", "bytes"),
+    ("instructions", "instructions"),
+    ("calls", "calls"),
+    ("boundsChecks", "bounds checks"),
+    ("vectorInstructions", "vector instructions"),
+)
+DISASM_TOP_LIMIT = 10
+
+
+def frame_function(name: str) -> str:
+    function = name.split("!", 1)[1] if "!" in name else name
+    function = function.split("(", 1)[0].strip()
+    previous = None
+    while previous != function:
+        previous = function
+        function = PROFILE_GENERIC_RE.sub("", function)
+    return function.replace("..ctor", ".ctor").replace("..cctor", ".cctor") or name
+
+
+def frame_namespace(name: str) -> str:
+    function = frame_function(name)
+    segments = function.split(".")
+    if len(segments) < 3:
+        return f"[{name.split('!', 1)[0]}]" if "!" in name else "[other]"
+    return ".".join(segments[:-2][:2])
+
+
+def accumulate_open_time(counts: dict, starts: dict, totals: dict, key, at: float, opening: bool):
+    if opening:
+        if not counts.get(key):
+            starts[key] = at
+        counts[key] = counts.get(key, 0) + 1
+        return
+    if not counts.get(key):
+        return
+    counts[key] -= 1
+    if counts[key] == 0:
+        totals[key] = totals.get(key, 0.0) + at - starts.pop(key)
+
+
+def parse_speedscope(path: Path):
+    document = json.loads(path.read_text(encoding="utf-8"))
+    frames = (document.get("shared") or {}).get("frames") or []
+    names = [str(frame.get("name") or "?") for frame in frames]
+    namespaces = [frame_namespace(name) for name in names]
+    profiles = document.get("profiles") or []
+    unit = next((profile.get("unit") for profile in profiles if profile.get("unit")), "none")
+    scale = PROFILE_UNITS_MS.get(unit)
+
+    inclusive: dict[int, float] = {}
+    exclusive: dict[int, float] = {}
+    group_inclusive: dict[str, float] = {}
+    group_exclusive: dict[str, float] = {}
+    total = 0.0
+    for profile in profiles:
+        if profile.get("type") == "sampled":
+            samples = profile.get("samples") or []
+            weights = profile.get("weights") or [1.0] * len(samples)
+            for stack, weight in zip(samples, weights):
+                if not stack:
+                    continue
+                total += weight
+                leaf = stack[-1]
+                exclusive[leaf] = exclusive.get(leaf, 0.0) + weight
+                group_exclusive[namespaces[leaf]] = group_exclusive.get(namespaces[leaf], 0.0) + weight
+                for frame in set(stack):
+                    inclusive[frame] = inclusive.get(frame, 0.0) + weight
+                for group in {namespaces[frame] for frame in stack}:
+                    group_inclusive[group] = group_inclusive.get(group, 0.0) + weight
+        elif profile.get("type") == "evented":
+            stack = []
+            counts: dict = {}
+            starts: dict = {}
+            group_counts: dict = {}
+            group_starts: dict = {}
+            last = None
+            for event in profile.get("events") or []:
+                at = float(event.get("at", 0.0))
+                frame = event.get("frame")
+                if stack and last is not None and at > last:
+                    leaf = stack[-1]
+                    exclusive[leaf] = exclusive.get(leaf, 0.0) + at - last
+                    group_exclusive[namespaces[leaf]] = group_exclusive.get(namespaces[leaf], 0.0) + at - last
+                    total += at - last
+                last = at
+                if frame is None or not 0 <= frame < len(names):
+                    continue
+                opening = event.get("type") == "O"
+                if opening:
+                    stack.append(frame)
+                elif frame in stack:
+                    del stack[len(stack) - 1 - stack[::-1].index(frame)]
+                else:
+                    continue
+                accumulate_open_time(counts, starts, inclusive, frame, at, opening)
+                accumulate_open_time(group_counts, group_starts, group_inclusive, namespaces[frame], at, opening)
+
+    def to_unit(value: float) -> float:
+        return round(value * scale, 3) if scale is not None else round(value, 3)
+
+    def share(value: float) -> float:
+        return round(value / total, 4) if total else 0.0
+
+    functions: dict[str, dict] = {}
+    for frame in set(inclusive) | set(exclusive):
+        function = frame_function(names[frame])
+        entry = functions.setdefault(function, {"name": function, "namespace": namespaces[frame], "inclusive": 0.0, "exclusive": 0.0})
+        entry["inclusive"] = max(entry["inclusive"], inclusive.get(frame, 0.0))
+        entry["exclusive"] += exclusive.get(frame, 0.0)
+
+    def describe(entry: dict):
+        return {
+            "name": entry["name"],
+            "namespace": entry["namespace"],
+            "inclusive": to_unit(entry["inclusive"]),
+            "exclusive": to_unit(entry["exclusive"]),
+            "inclusiveShare": share(entry["inclusive"]),
+            "exclusiveShare": share(entry["exclusive"]),
+        }
+
+    library = [entry for entry in functions.values() if entry["namespace"].startswith("CodeGlyphX") and not entry["namespace"].startswith(PROFILE_HARNESS_PREFIXES)]
+    top_inclusive = sorted(library, key=lambda entry: (-entry["inclusive"], entry["name"]))[:HOT_FRAME_LIMIT]
+    top_exclusive = sorted(functions.values(), key=lambda entry: (-entry["exclusive"], entry["name"]))[:HOT_FRAME_LIMIT]
+    groups = sorted(set(group_inclusive) | set(group_exclusive), key=lambda group: (-group_exclusive.get(group, 0.0), group))
+    return {
+        "unit": "ms" if scale is not None else "samples",
+        "total": to_unit(total),
+        "threads": len(profiles),
+        "namespaces": [
+            {
+                "name": group,
+                "inclusive": to_unit(group_inclusive.get(group, 0.0)),
+                "exclusive": to_unit(group_exclusive.get(group, 0.0)),
+                "inclusiveShare": share(group_inclusive.get(group, 0.0)),
+                "exclusiveShare": share(group_exclusive.get(group, 0.0)),
+            }
+            for group in groups[:HOT_FRAME_LIMIT]
+        ],
+        "topInclusive": [describe(entry) for entry in top_inclusive if entry["inclusive"] > 0],
+        "topExclusive": [describe(entry) for entry in top_exclusive if entry["exclusive"] > 0],
+    }
+
+
+def load_cpu_profiles(artifacts_path: Path, cache: ParseCache | None = None):
+    profiles = {}
+    for path in sorted(artifacts_path.rglob(PROFILE_GLOB)):
+        case = PROFILE_TIMESTAMP_RE.sub("", path.name[: -len(".speedscope.json")])
+        case = case.replace(BENCH_PREFIX, "", 1)
+        class_name, _, method = case.partition(".")
+        try:
+            profile = cached_parse(cache, "speedscope", path, parse_speedscope)
+        except (OSError, ValueError, TypeError, KeyError, IndexError) as exc:
+            print(f"WARNING: skipping CPU profile {path.name}: {exc}", file=sys.stderr)
+            continue
+        profiles[case] = {
+            "id": class_name,
+            "benchmark": TITLE_MAP.get(class_name, class_name),
+            "method": method or case,
+            "path": str(path),
+            **profile,
+        }
+    return [profiles[case] for case in sorted(profiles)] or None
+
+
+def parse_disassembly(path: Path):
+    methods = []
+    runtime = None
+    benchmark = None
+    current = None
+    in_code = False
+    for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = raw.strip()
+        if raw.startswith("## "):
+            runtime = raw[3:].strip()
+            benchmark = None
+            continue
+        if line.startswith("```"):
+            in_code = not in_code
+            continue
+        if not in_code or not line:
+            continue
+        total = DISASM_TOTAL_RE.match(line)
+        if total:
+            if current:
+                current["codeBytes"] = int(total.group(1))
+                methods.append(current)
+            current = None
+            continue
+        if line.startswith(";"):
+            if current is None and "(" in line:
+                name = line[1:].strip()
+                benchmark = benchmark or name
+                current = {
+                    "method": name,
+                    "benchmark": benchmark,
+                    "runtime": runtime,
+                    "codeBytes": None,
+                    "instructions": 0,
+                    "calls": 0,
+                    "boundsChecks": 0,
+                    "vectorInstructions": 0,
+                }
+            continue
+        if current is None or DISASM_LABEL_RE.match(line):
+            continue
+        mnemonic = line.split(None, 1)[0].lower()
+        current["instructions"] += 1
+        if DISASM_BOUNDS_CHECK_HELPER in line:
+            current["boundsChecks"] += 1
+        elif mnemonic in DISASM_CALL_MNEMONICS:
+            if "CORINFO_HELP_" not in line:
+                current["calls"] += 1
+        if DISASM_VECTOR_RE.search(line.lower()):
+            current["vectorInstructions"] += 1
+    return methods
+
+
+def load_disassembly(results_path: Path, cache: ParseCache | None = None):
+    methods = {}
+    for path in sorted(results_path.glob(DISASM_GLOB)):
+        class_id = strip_benchmark_prefix(path.name[: -len("-asm.md")])
+        for item in cached_parse(cache, "disassembly", path, parse_disassembly):
+            key = (item["runtime"], item["method"])
+            entry = methods.get(key)
+            benchmark = f"{class_id}.{item['benchmark'].rsplit('.', 1)[-1].split('(', 1)[0]}"
+            if entry is None:
+                entry = {key: value for key, value in item.items() if key != "benchmark"}
+                entry["benchmarks"] = []
+                methods[key] = entry
+            if benchmark not in entry["benchmarks"]:
+                entry["benchmarks"].append(benchmark)
+    if not methods:
+        return None
+    return {"methods": [methods[key] for key in sorted(methods, key=lambda key: (key[0] or "", key[1]))]}
+
+
+def filter_disassembly(disassembly: dict | None, framework: str, host: str):
+    if not disassembly:
+        return None
+    methods = [item for item in disassembly["methods"] if (runtime_framework(item["runtime"]) or host) == framework]
+    return {"methods": methods} if methods else None
+
+
+def describe_disassembly_change(deltas: dict, previous: dict, current: dict) -> list[str]:
+    notes = []
+    if deltas.get("calls"):
+        notes.append("more inlining" if deltas["calls"] < 0 else "less inlining")
+    if deltas.get("boundsChecks"):
+        if not current["boundsChecks"]:
+            notes.append("bounds checks removed")
+        elif not previous["boundsChecks"]:
+            notes.append("bounds checks added")
+        else:
+            notes.append("fewer bounds checks" if deltas["boundsChecks"] < 0 else "more bounds checks")
+    if deltas.get("vectorInstructions"):
+        if not previous["vectorInstructions"]:
+            notes.append("vectorized")
+        elif not current["vectorInstructions"]:
+            notes.append("no longer vectorized")
+        else:
+            notes.append("vector code changed")
+    if not notes and deltas.get("codeBytes"):
+        notes.append("smaller code" if deltas["codeBytes"] < 0 else "larger code")
+    return notes
+
+
+def disassembly_key(item: dict):
+    return runtime_framework(item.get("runtime")) or item.get("runtime") or "", item["method"]
+
+
+def compare_disassembly(disassembly: dict | None, previous: dict | None):
+    prior = (previous or {}).get("disassembly")
+    if not disassembly or not prior:
+        return None
+    previous_methods = {disassembly_key(item): item for item in prior.get("methods") or []}
+    current_methods = {disassembly_key(item): item for item in disassembly["methods"]}
+    changes = []
+    for key, current in current_methods.items():
+        before = previous_methods.get(key)
+        if not before:
+            continue
+        deltas = {}
+        for metric, _ in DISASM_METRICS:
+            if current.get(metric) is not None and before.get(metric) is not None and current[metric] != before[metric]:
+                deltas[metric] = current[metric] - before[metric]
+        if deltas:
+            changes.append(
+                {
+                    "method": current["method"],
+                    "runtime": current["runtime"],
+                    "benchmarks": current["benchmarks"],
+                    "previous": {metric: before.get(metric) for metric, _ in DISASM_METRICS},
+                    "current": {metric: current.get(metric) for metric, _ in DISASM_METRICS},
+                    "deltas": deltas,
+                    "notes": describe_disassembly_change(deltas, before, current),
+                }
+            )
+    changes.sort(key=lambda item: (-abs(item["deltas"].get("codeBytes", 0)), item["method"]))
+    return {
+        "previousGeneratedUtc": previous.get("generatedUtc"),
+        "compared": len(set(current_methods) & set(previous_methods)),
+        "changes": changes,
+        "added": sorted(current_methods[key]["method"] for key in set(current_methods) - set(previous_methods)),
+        "removed": sorted(previous_methods[key]["method"] for key in set(previous_methods) - set(current_methods)),
+    }
+
+
+def format_disassembly_metric(item: dict, metric: str) -> str:
+    value = item["current"][metric]
+    delta = item["deltas"].get(metric)
+    if value is None:
+        return "n/a"
+    return f"{value} ({delta:+d})" if delta else f"{value}"
+
+
+def build_disassembly_section(lines, disassembly: dict | None, disassembly_report: dict | None):
+    if not disassembly:
+        return
+    methods = disassembly["methods"]
+    lines.append("### JIT code size")
+    lines.append("")
+    total_bytes = sum(item["codeBytes"] or 0 for item in methods)
+    lines.append(
+        f"Native code from BenchmarkDotNet's DisassemblyDiagnoser: {len(methods)} methods, {total_bytes:,} bytes. "
+        "Calls exclude JIT helpers, so fewer calls means more inlining; bounds checks count range-check failure paths; "
+        "vector instructions count packed SIMD operations."
+    )
+    lines.append("")
+    if disassembly_report:
+        previous = disassembly_report.get("previousGeneratedUtc") or "unknown"
+        lines.append(f"Compared {disassembly_report['compared']} methods with the previous run ({previous}).")
+        lines.append("")
+        if disassembly_report["changes"]:
+            lines.append("| Method | Bytes | Instructions | Calls | Bounds checks | Vector instructions | Change |")
+            lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+            for item in disassembly_report["changes"]:
+                lines.append(
+                    f"| `{item['method']}` | "
+                    + " | ".join(format_disassembly_metric(item, metric) for metric, _ in DISASM_METRICS)
+                    + f" | {', '.join(item['notes'])} |"
+                )
+            lines.append("")
+        else:
+            lines.append("_No code changes in compared methods._")
+            lines.append("")
+        for label, names in (("No longer listed (inlined or not reached)", disassembly_report["removed"]), ("Newly listed", disassembly_report["added"])):
+            if names:
+                shown = ", ".join(f"`{name}`" for name in names[:DISASM_TOP_LIMIT])
+                more = f" (+{len(names) - DISASM_TOP_LIMIT} more)" if len(names) > DISASM_TOP_LIMIT else ""
+                lines.append(f"- {label}: {shown}{more}")
+        if disassembly_report["removed"] or disassembly_report["added"]:
+            lines.append("")
+    largest = sorted(methods, key=lambda item: (-(item["codeBytes"] or 0), item["method"]))[:DISASM_TOP_LIMIT]
+    lines.append("| Largest methods | Bytes | Instructions | Calls | Bounds checks | Vector instructions | Benchmarks |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- |")
+    for item in largest:
+        lines.append(
+            f"| `{item['method']}` | {item['codeBytes'] if item['codeBytes'] is not None else 'n/a'} | {item['instructions']} | {item['calls']} | "
+            f"{item['boundsChecks']} | {item['vectorInstructions']} | {len(item['benchmarks'])} |"
+        )
+    lines.append("")
+
+
+def format_frame_name(name: str) -> str:
+    return f"`` {name} ``" if "`" in name else f"`{name}`"
+
+
+def format_profile_time(value: float, unit: str) -> str:
+    return f"{value:,.1f} ms" if unit == "ms" else f"{value:,.0f} samples"
+
+
+def build_hot_frames_section(lines, profiles: list[dict] | None):
+    if not profiles:
+        return
+    lines.append("### Hot frames")
+    lines.append("")
+    lines.append(
+        "CPU samples from BenchmarkDotNet's EventPipe profiler (speedscope export). Exclusive time is spent in the frame itself; "
+        "inclusive adds its callees. Namespaces are collapsed to two levels (CodeGlyphX.Qr, CodeGlyphX.Rendering, System.IO, ...)."
+    )
+    lines.append("")
+    for profile in profiles:
+        unit = profile["unit"]
+        lines.append(f"#### {profile['benchmark']} / {profile['method']} ({format_profile_time(profile['total'], unit)}, {profile['threads']} threads)")
+        lines.append("")
+        lines.append("| Namespace | Exclusive | Inclusive |")
+        lines.append("| --- | --- | --- |")
+        for item in profile["namespaces"]:
+            lines.append(f"| {item['name']} | {item['exclusiveShare'] * 100:.1f}% | {item['inclusiveShare'] * 100:.1f}% |")
+        lines.append("")
+        lines.append("| Top exclusive | Namespace | Exclusive | Inclusive |")
+        lines.append("| --- | --- | --- | --- |")
+        for item in profile["topExclusive"]:
+            lines.append(
+                f"| {format_frame_name(item['name'])} | {item['namespace']} | {format_profile_time(item['exclusive'], unit)} ({item['exclusiveShare'] * 100:.1f}%) | "
+                f"{item['inclusiveShare'] * 100:.1f}% |"
+            )
+        lines.append("")
+        if profile["topInclusive"]:
+            lines.append("| Top inclusive (CodeGlyphX) | Namespace | Inclusive | Exclusive |")
+            lines.append("| --- | --- | --- | --- |")
+            for item in profile["topInclusive"]:
+                lines.append(
+                    f"| {format_frame_name(item['name'])} | {item['namespace']} | {format_profile_time(item['inclusive'], unit)} ({item['inclusiveShare'] * 100:.1f}%) | "
+                    f"{item['exclusiveShare'] * 100:.1f}% |"
+                )
+            lines.append("")
@@ -0,0 +1,625 @@
+import datetime as dt
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional: .br shards are skipped when the brotli package is not installed
+    brotli = None
+
+from .common import (
+    OS_NAMES,
+    OUTPUT_LOCK_NAME,
+    OutputLock,
+    RUN_MODES,
+    TIMINGS,
+    atomic_write_bytes,
+    atomic_write_text,
+    format_timings,
+    get_stored_payload,
+    load_json_document,
+    resolve_publish_flag,
+)
+from .results import IngestedRun, compute_missing_compare
+from .packrunner import build_pack_diagnostics_section, build_pack_heatmap_section, build_pack_runner_section, compare_pack_runner
+from .profiles import build_disassembly_section, build_hot_frames_section, compare_disassembly
+from .analysis import (
+    DEFAULT_RATING_PROFILE,
+    analyze_pipeline_decomposition,
+    analyze_scaling,
+    build_baseline_payload,
+    build_baseline_section,
+    build_comparison_section,
+    build_comparisons_payload,
+    build_decomposition_section,
+    build_distribution_section,
+    build_pareto_section,
+    build_scaling_section,
+    build_summary,
+    build_throughput_section,
+    describe_rating,
+)
+from .gates import build_budget_section, build_regression_section, compare_with_previous, evaluate_budgets, list_budget_breaches
+from .platforms import (
+    build_cross_os_report,
+    build_cross_os_section,
+    build_runtime_report,
+    build_runtime_section,
+    get_runtime_payload,
+    store_primary_payload,
+    store_runtime_payload,
+)
+from .history import DEFAULT_HISTORY_PATH, record_run_history
+from .host import build_run_meta
+
+
+SHARD_DIR_NAME = "benchmark"
+SHARD_SECTIONS = ("comparisons", "baseline")
+# The summary shard keeps run metadata, scalar fields and the headline table; every other non-empty section gets its own shard.
+SUMMARY_SHARD_FIELDS = (
+    "generatedUtc",
+    "schemaVersion",
+    "os",
+    "framework",
+    "configuration",
+    "runMode",
+    "runModeDetails",
+    "runModeSource",
+    "publish",
+    "meta",
+    "environment",
+    "missingComparisons",
+    "missingComparisonIds",
+    "howToRead",
+    "notes",
+    "summary",
+)
+
+
+def build_section(
+    run: IngestedRun,
+    framework: str,
+    configuration: str,
+    regression_report: dict | None = None,
+    pack_report: dict | None = None,
+    rating_profile: str = DEFAULT_RATING_PROFILE,
+    budget_report: dict | None = None,
+    disassembly_report: dict | None = None,
+    meta: dict | None = None,
+) -> str:
+    results = run.results
+    artifacts_path = run.artifacts_path
+    run_mode = run.run_mode
+    run_mode_details = run.run_mode_details
+    run_mode_warning = run.run_mode_warning
+    _, _, missing_compare, _ = compute_missing_compare(results.compare_files)
+
+    os_name = run.os_name
+    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    lines = []
+    run_mode_title = "Quick" if run_mode == "quick" else "Full"
+    lines.append(f"## {os_name.upper()} ({run_mode_title})")
+    lines.append("")
+    lines.append(f"Updated: {timestamp}")
+    lines.append(f"Framework: {framework}")
+    lines.append(f"Configuration: {configuration}")
+    meta = meta or {}
+    host_parts = [
+        f"OS: {meta.get('osDescription') or 'unknown'}",
+        f"Arch: {meta.get('processArchitecture') or meta.get('osArchitecture') or 'unknown'}",
+        f"CPU: {meta.get('cpuModel') + ', ' if meta.get('cpuModel') else ''}{meta.get('processorCount') or '?'} logical cores",
+    ]
+    if meta.get("runtime"):
+        host_parts.append(f"Runtime: {meta['runtime']}")
+    lines.append(" | ".join(host_parts))
+    lines.append(f"Artifacts: {artifacts_path}")
+    lines.append("How to read:")
+    lines.append("- Mean: average time per operation. Lower is better.")
+    lines.append("- Allocated: managed memory allocated per operation. Lower is better.")
+    lines.append("- CodeGlyphX vs Fastest: CodeGlyphX mean divided by the fastest mean for that scenario. 1 x means CodeGlyphX is fastest; 1.5 x means ~50% slower.")
+    lines.append("- CodeGlyphX Alloc vs Fastest: CodeGlyphX allocated divided by the fastest allocation for that scenario. 1 x means CodeGlyphX allocates the least; higher is more allocations.")
+    lines.append(f"- {describe_rating(rating_profile)}")
+    lines.append("- Δ lines in comparison tables show vendor ratios vs CodeGlyphX (time / alloc).")
+    lines.append("- Quick runs use fewer iterations for fast feedback; Full runs use BenchmarkDotNet defaults and are recommended for publishing.")
+    lines.append("- Quick and Full runs include the same scenario list; only the iteration settings differ.")
+    lines.append("- Benchmarks run under controlled, ideal conditions on a single machine; treat results as directional, not definitive.")
+    lines.append("Notes:")
+    lines.append(f"- {run_mode_details}")
+    lines.append("- Quick runs include the same scenario set as Full runs; run time is driven by iteration counts.")
+    lines.append("- Comparisons target PNG output and include encode+render (not encode-only).")
+    lines.append("- Module size and quiet zone are matched to CodeGlyphX defaults where possible; image size is derived from CodeGlyphX modules.")
+    lines.append("- ZXing.Net uses ZXing.Net.Bindings.ImageSharp.V3 (ImageSharp 3.x renderer).")
+    lines.append("- Barcoder uses Barcoder.Renderer.Image (ImageSharp renderer).")
+    lines.append("- QRCoder uses PngByteQRCode (managed PNG output, no external renderer).")
+    lines.append("- QR decode comparisons use raw RGBA32 bytes (ZXing via RGBLuminanceSource).")
+    lines.append("- QR decode clean uses CodeGlyphX Balanced; noisy uses CodeGlyphX Robust with aggressive sampling/limits; ZXing uses default (clean) and TryHarder (noisy).")
+    warnings = []
+    if run_mode_warning:
+        warnings.append(run_mode_warning)
+    if missing_compare:
+        warnings.append(f"Missing compare results: {', '.join(missing_compare)}.")
+    if warnings:
+        lines.append("Warnings:")
+        lines.extend(f"- {warning}" for warning in warnings)
+    lines.append("")
+
+    summary_rows = []
+    summary_items = []
+    if results.comparisons:
+        summary_rows, summary_items = build_summary(results.comparisons, rating_profile)
+        if summary_rows:
+            lines.append("### Summary (Comparisons)")
+            lines.append("")
+            lines.append("| Benchmark | Scenario | Fastest | CodeGlyphX vs Fastest | CodeGlyphX Alloc vs Fastest | Rating | Pareto | CodeGlyphX Mean | CodeGlyphX Alloc |")
+            lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+            lines.extend(summary_rows)
+            lines.append("")
+            build_pareto_section(lines, summary_items)
+        else:
+            summary_items = []
+
+    build_budget_section(lines, budget_report)
+    build_regression_section(lines, regression_report)
+    build_baseline_section(lines, results.baseline)
+    build_comparison_section(lines, results.comparisons)
+    build_throughput_section(lines, results)
+    build_scaling_section(lines, analyze_scaling(results))
+    build_decomposition_section(lines, analyze_pipeline_decomposition(results))
+    build_distribution_section(lines, results)
+    build_pack_runner_section(lines, run.pack_runner)
+    build_pack_diagnostics_section(lines, run.pack_runner)
+    build_pack_heatmap_section(lines, pack_report)
+    build_hot_frames_section(lines, run.profiles)
+    build_disassembly_section(lines, run.disassembly, disassembly_report)
+
+    return "\n".join(lines).rstrip()
+
+
+def build_template(blocks):
+    return "\n".join(
+        [
+            "# Benchmarks",
+            "",
+            "**Data locations**",
+            "- Generated files are overwritten on each run (do not edit by hand).",
+            "- Human-readable report: `BENCHMARK.md`",
+            "- Website JSON: `Assets/Data/benchmark.json`",
+            "- Summary JSON: `Assets/Data/benchmark-summary.json`",
+            "- Index JSON: `Assets/Data/benchmark-index.json`",
+            "- Website shards: `Assets/Data/benchmark-manifest.json` + `Assets/Data/benchmark/*.<hash>.json` (minified, .gz/.br precompressed, immutable; only the current manifest's shards are kept).",
+            "- The summary shard holds run metadata and the headline table; each comparison, baseline and heavy section (pack runner, scaling, hot frames, disassembly, ...) is a separate shard loaded on demand.",
+            "",
+            "**Publish flag**",
+            "- Quick runs default to `publish=false` (draft).",
+            "- Full runs default to `publish=true`.",
+            "- Override with `-Publish` or `-NoPublish` on the report generator.",
+            "",
+            "**Regression gate**",
+            "- Each run is compared with the previously stored run for the same OS/mode before it is overwritten.",
+            "- A change counts only when it exceeds the BenchmarkDotNet error margin and the threshold in `Build/benchmark-regression-thresholds.json`.",
+            "- QR decode pack runs are compared per scenario and engine (p95 and decode rate) and shown as a heatmap.",
+            "- Both run scripts generate the report with `generate-benchmark-report.py`; pass `--fail-on-regression` (`-FailOnRegression`) to fail the build on significant slowdowns, allocation growth or pack-runner p95/decode-rate regressions.",
+            "- Absolute limits (max mean, max allocated, min pack decode rate, max pack p95) live in `Build/benchmark-budgets.json` with per-OS/run-mode overrides; a breach fails the run unless `--allow-budget-breach` is passed (`Generate-BenchmarkReport.ps1` runs the same gate through `check-budgets`; use `-AllowBudgetBreach` or `-NoBudgets`).",
+            "",
+            "**Cross-OS**",
+            "- Host details in `meta` (OS, CPU, runtime, fingerprint) come from each run's BenchmarkDotNet environment and the `run-info.json` written by the run scripts.",
+            "- A short calibration score is added only for runs measured on the generating host (skip with `--no-calibration`).",
+            "- The Cross-OS sections line up CodeGlyphX scenarios across OSes, scaled by calibration, and flag scenarios that deviate from the typical host ratio.",
+            "",
+            "**Runtimes**",
+            "- The benchmark classes pin a net8.0 job, so a normal run measures net8.0 whatever `--framework` says; the framework of each result comes from the CSV Runtime column (`--framework` only labels results without one, and a mismatch is reported as a warning).",
+            "- Results for other frameworks (e.g. artifacts from a build that adds jobs for more runtimes) are stored under `runtimes` in benchmark.json and compared in the Runtimes sections; `--primary-framework` (default net8.0) fills the OS sections, and a replaced primary payload of another framework moves to `runtimes`.",
+            "",
+            "**Hot frames**",
+            "- Run the benchmark scripts with `--profile` (`-CpuProfile`) to attach BenchmarkDotNet's EventPipe profiler; its `*.speedscope.json` exports are picked up from the artifacts folder.",
+            "- Each profiled benchmark gets its top exclusive and inclusive frames plus a per-namespace split (`hotFrames` in benchmark.json).",
+            "",
+            "**JIT code size**",
+            "- Run the benchmark scripts with `--disasm` (`-Disasm`) to enable the DisassemblyDiagnoser on the QR encode and pipeline benchmarks (Reed-Solomon, mask scoring and PNG filter paths).",
+            "- The `*-asm.md` exports are reduced to code bytes, instructions, calls, bounds checks and vector instructions per method (`disassembly` in benchmark.json) and diffed against the previous stored run, so inlining, bounds-check or vectorization changes show up without a timing change.",
+            "",
+            "**History**",
+            "- Every ingested run is appended to a local SQLite store (`Build/.benchmark-history.sqlite`, override with `--history-path`).",
+            "- Query a scenario trend with `generate-benchmark-report.py history --benchmark <class or title> --scenario <name> --last N`.",
+            "",
+            "**QR decode pack runner CSV schema**",
+            "- Columns: dateUtc, mode, pack, packCategory, packDescription, packGuidance, engine, isExternal, scenario, width, height, runs, opsPerIteration, decodeRate, expectedRate, medianMs, p95Ms, avgDecodedCount, expected, options, diagScaleMedian, diagThresholdMedian, diagInvertRate, diagCandidateMedian, diagTriplesMedian, diagDimensionMedian, diagSuccessRate, diagTopFailure.",
+            "- The diag columns feed the decode diagnostics attribution (correlation with latency, inversion estimate, failure taxonomy; `packRunner.diagnostics` in benchmark.json).",
+            "",
+            blocks["windows_quick"],
+            "",
+            blocks["windows_full"],
+            "",
+            blocks["linux_quick"],
+            "",
+            blocks["linux_full"],
+            "",
+            blocks["macos_quick"],
+            "",
+            blocks["macos_full"],
+            "",
+            blocks["cross-os_quick"],
+            "",
+            blocks["cross-os_full"],
+            "",
+            blocks["runtimes_quick"],
+            "",
+            blocks["runtimes_full"],
+            "",
+        ]
+    )
+
+
+def extract_block(text: str, os_name: str, run_mode: str):
+    marker = f"BENCHMARK:{os_name.upper()}:{run_mode.upper()}"
+    start = f"<!-- {marker}:START -->"
+    end = f"<!-- {marker}:END -->"
+    pattern = re.compile(re.escape(start) + r"[\s\S]*?" + re.escape(end))
+    match = pattern.search(text)
+    if match:
+        return match.group(0)
+    return f"{start}\n_no results yet_\n{end}"
+
+
+def update_sections(path: Path, sections: dict[tuple[str, str], str]):
+    if path.exists():
+        TIMINGS.read(path)
+    text = path.read_text(encoding="utf-8-sig") if path.exists() else ""
+    blocks = {f"{os_name}_{run_mode}": extract_block(text, os_name, run_mode) for os_name in (*OS_NAMES, "cross-os", "runtimes") for run_mode in RUN_MODES}
+    for (os_name, run_mode), section in sections.items():
+        marker = f"BENCHMARK:{os_name.upper()}:{run_mode.upper()}"
+        blocks[f"{os_name}_{run_mode}"] = f"<!-- {marker}:START -->\n{section}\n<!-- {marker}:END -->"
+    atomic_write_text(path, build_template(blocks))
+
+
+def get_framework_payload(data: dict, os_name: str, run_mode: str, framework: str | None):
+    stored = get_stored_payload(data, os_name, run_mode)
+    if stored and stored.get("framework") == framework:
+        return stored
+    return get_runtime_payload(data, os_name, run_mode, framework)
+
+
+def publish_reports(runs: list[IngestedRun], args, meta: dict, thresholds: dict, output_path: Path, json_path: Path, previous_payloads: dict | None = None):
+    with OutputLock(json_path.parent / OUTPUT_LOCK_NAME, args.lock_timeout):
+        data = load_json_document(json_path)
+        sections = {}
+        payloads = []
+        for run in runs:
+            key = (run.os_name, run.run_mode)
+            primary = run.framework == args.primary_framework
+            stored = get_framework_payload(data, run.os_name, run.run_mode, run.framework)
+            if previous_payloads is None:
+                previous = stored
+            else:
+                if (*key, run.framework) not in previous_payloads:
+                    previous_payloads[(*key, run.framework)] = stored
+                previous = previous_payloads[(*key, run.framework)]
+            run_meta = build_run_meta(meta, run.environment, run.run_info, not args.no_calibration, not args.artifacts_root)
+            with TIMINGS.stage("compare_previous"):
+                regression_report = compare_with_previous(run.results, previous, thresholds)
+                pack_report = compare_pack_runner(run.pack_runner, previous, thresholds)
+                budget_report = evaluate_budgets(run, thresholds.get("budgets"))
+                disassembly_report = compare_disassembly(run.disassembly, previous)
+            if primary:
+                with TIMINGS.stage("build_section"):
+                    sections[key] = build_section(
+                        run,
+                        run.framework,
+                        args.configuration,
+                        regression_report,
+                        pack_report,
+                        args.rating_profile,
+                        budget_report,
+                        disassembly_report,
+                        run_meta,
+                    )
+            publish_flag = resolve_publish_flag(run.run_mode, args.publish, args.no_publish)
+            with TIMINGS.stage("build_payload"):
+                payloads.append(
+                    build_payload(
+                        run,
+                        run.framework,
+                        args.configuration,
+                        publish_flag,
+                        run_meta,
+                        regression_report,
+                        pack_report,
+                        args.rating_profile,
+                        budget_report,
+                        disassembly_report,
+                    )
+                )
+        if args.timings_in_meta:
+            trace = TIMINGS.to_dict()
+            for payload in payloads:
+                payload["meta"]["timings"] = trace
+
+        primary_payloads = [payload for payload in payloads if payload["framework"] == args.primary_framework]
+        for payload in payloads:
+            if payload["framework"] == args.primary_framework:
+                store_primary_payload(data, payload)
+            else:
+                store_runtime_payload(data, payload)
+        if payloads and not primary_payloads:
+            print(
+                f"WARNING: no {args.primary_framework} results; {', '.join(sorted({payload['framework'] for payload in payloads}))} "
+                "stored under runtimes only and the OS sections were not updated (see --primary-framework).",
+                file=sys.stderr,
+            )
+        with TIMINGS.stage("cross_os"):
+            data["crossOs"] = {run_mode: build_cross_os_report(data, run_mode) for run_mode in RUN_MODES}
+            data["runtimeComparison"] = {run_mode: build_runtime_report(data, run_mode) for run_mode in RUN_MODES}
+            for run_mode in RUN_MODES:
+                sections[("cross-os", run_mode)] = build_cross_os_section(data["crossOs"][run_mode], run_mode)
+                sections[("runtimes", run_mode)] = build_runtime_section(data["runtimeComparison"][run_mode], run_mode)
+
+        with TIMINGS.stage("update_sections"):
+            update_sections(output_path, sections)
+        with TIMINGS.stage("write_json"):
+            write_json(json_path, primary_payloads, data)
+        with TIMINGS.stage("write_website_shards"):
+            write_website_shards(json_path.parent, data)
+    # JSON output is already stored under Assets/Data for website ingestion.
+    return payloads
+
+
+def finish_reports(args, runs: list[IngestedRun], payloads: list[dict], cache, fail_on_missing_compare: bool):
+    if not args.no_history:
+        history_path = Path(args.history_path).resolve() if args.history_path else DEFAULT_HISTORY_PATH
+        with TIMINGS.stage("history"):
+            for run, payload in zip(runs, payloads):
+                record_run_history(history_path, payload, run.results)
+
+    if cache is not None:
+        with TIMINGS.stage("cache_evict"):
+            cache.evict()
+
+    if args.timings or args.timings_output:
+        trace = TIMINGS.to_dict()
+        if args.timings:
+            print(format_timings(trace), file=sys.stderr)
+        if args.timings_output:
+            Path(args.timings_output).write_text(json.dumps(trace, indent=2), encoding="utf-8")
+
+    if fail_on_missing_compare:
+        missing = [payload for payload in payloads if payload["missingComparisons"]]
+        if len(payloads) == 1 and missing:
+            raise SystemExit(f"Missing compare results: {', '.join(missing[0]['missingComparisons'])}.")
+        if missing:
+            details = "; ".join(f"{payload['os']}/{payload['runMode']}: {', '.join(payload['missingComparisons'])}" for payload in missing)
+            raise SystemExit(f"Missing compare results: {details}.")
+
+    breaches = [
+        f"{payload['os']}/{payload['runMode']} {breach}"
+        for payload in payloads
+        for breach in list_budget_breaches(payload.get("budgets"))
+    ]
+    if breaches and not args.allow_budget_breach:
+        raise SystemExit(f"Performance budgets breached: {'; '.join(breaches)}.")
+
+    if args.fail_on_regression:
+        names = sorted(
+            {
+                f"{payload['os']}/{payload['runMode']} {item['benchmark']} / {item['scenario']} ({item['metric']})"
+                for payload in payloads
+                for item in (payload.get("regressions") or {}).get("regressions", [])
+            }
+            | {
+                f"{payload['os']}/{payload['runMode']} pack {cell['pack']} / {cell['scenario']} / {cell['engine']} ({cell['status']})"
+                for payload in payloads
+                for cell in (payload.get("packRunnerRegressions") or {}).get("cells", [])
+                if cell["status"] and cell["status"] != "faster"
+            }
+        )
+        if names:
+            raise SystemExit(f"Benchmark regressions detected: {'; '.join(names)}.")
+
+
+def build_payload(
+    run: IngestedRun,
+    framework: str,
+    configuration: str,
+    publish: bool,
+    meta: dict,
+    regression_report: dict | None = None,
+    pack_report: dict | None = None,
+    rating_profile: str = DEFAULT_RATING_PROFILE,
+    budget_report: dict | None = None,
+    disassembly_report: dict | None = None,
+):
+    results = run.results
+    _, _, missing_compare, missing_compare_ids = compute_missing_compare(results.compare_files)
+
+    baseline = build_baseline_payload(results.baseline)
+    comparisons = build_comparisons_payload(results.comparisons)
+    summary_rows, summary_items = build_summary(results.comparisons, rating_profile) if results.comparisons else ([], [])
+    pack_runner = run.pack_runner
+
+    notes = [
+        run.run_mode_details,
+        "Comparisons target PNG output and include encode+render (not encode-only).",
+        "Module size and quiet zone are matched to CodeGlyphX defaults where possible; image size is derived from CodeGlyphX modules.",
+        "ZXing.Net uses ZXing.Net.Bindings.ImageSharp.V3 (ImageSharp 3.x renderer).",
+        "Barcoder uses Barcoder.Renderer.Image (ImageSharp renderer).",
+        "QRCoder uses PngByteQRCode (managed PNG output, no external renderer).",
+        "QR decode comparisons use raw RGBA32 bytes (ZXing via RGBLuminanceSource).",
+        "QR decode clean uses CodeGlyphX Balanced; noisy uses CodeGlyphX Robust with aggressive sampling/limits; ZXing uses default (clean) and TryHarder (noisy).",
+    ]
+    if pack_runner and pack_runner.get("note"):
+        notes.append(pack_runner["note"])
+
+    return {
+        "generatedUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "schemaVersion": 1,
+        "os": run.os_name,
+        "framework": framework,
+        "configuration": configuration,
+        "runMode": run.run_mode,
+        "runModeDetails": run.run_mode_details,
+        "runModeSource": run.run_mode_source,
+        "publish": publish,
+        "artifacts": str(run.artifacts_path),
+        "meta": meta,
+        "environment": run.environment,
+        "missingComparisons": missing_compare,
+        "missingComparisonIds": missing_compare_ids,
+        "howToRead": [
+            "Mean: average time per operation. Lower is better.",
+            "Allocated: managed memory allocated per operation. Lower is better.",
+            "CodeGlyphX vs Fastest: CodeGlyphX mean divided by the fastest mean for that scenario. 1 x means CodeGlyphX is fastest; 1.5 x means ~50% slower.",
+            "CodeGlyphX Alloc vs Fastest: CodeGlyphX allocated divided by the fastest allocation for that scenario. 1 x means CodeGlyphX allocates the least; higher is more allocations.",
+            describe_rating(rating_profile),
+            "Quick runs use fewer iterations for fast feedback; Full runs use BenchmarkDotNet defaults and are recommended for publishing.",
+        ],
+        "notes": notes,
+        "summary": summary_items,
+        "baseline": baseline,
+        "comparisons": comparisons,
+        "scaling": analyze_scaling(results),
+        "decomposition": analyze_pipeline_decomposition(results),
+        "packRunner": pack_runner,
+        "regressions": regression_report,
+        "budgets": budget_report,
+        "packRunnerRegressions": pack_report,
+        "hotFrames": run.profiles,
+        "disassembly": run.disassembly,
+        "disassemblyChanges": disassembly_report,
+    }
+
+
+def build_summary_payload(payload: dict):
+    return {
+        "generatedUtc": payload["generatedUtc"],
+        "schemaVersion": payload["schemaVersion"],
+        "os": payload["os"],
+        "framework": payload["framework"],
+        "configuration": payload["configuration"],
+        "runMode": payload["runMode"],
+        "runModeDetails": payload["runModeDetails"],
+        "runModeSource": payload["runModeSource"],
+        "publish": payload["publish"],
+        "artifacts": payload["artifacts"],
+        "meta": payload["meta"],
+        "missingComparisons": payload["missingComparisons"],
+        "missingComparisonIds": payload["missingComparisonIds"],
+        "howToRead": payload["howToRead"],
+        "notes": payload["notes"],
+        "summary": payload["summary"],
+        "packRunner": payload.get("packRunner"),
+        "regressions": payload.get("regressions"),
+    }
+
+
+def build_index_entry(payload: dict):
+    return {
+        "os": payload["os"],
+        "runMode": payload["runMode"],
+        "runModeSource": payload["runModeSource"],
+        "generatedUtc": payload["generatedUtc"],
+        "publish": payload["publish"],
+        "framework": payload["framework"],
+        "configuration": payload["configuration"],
+        "artifacts": payload["artifacts"],
+        "meta": payload["meta"],
+    }
+
+
+def write_json(path: Path, payloads: list[dict], data: dict | None = None):
+    if data is None:
+        data = load_json_document(path)
+    for payload in payloads:
+        data[payload["os"]][payload["runMode"]] = payload
+    atomic_write_text(path, json.dumps(data, indent=2))
+
+    summary_path = path.parent / "benchmark-summary.json"
+    summary_data = load_json_document(summary_path)
+    for payload in payloads:
+        summary_data[payload["os"]][payload["runMode"]] = build_summary_payload(payload)
+    atomic_write_text(summary_path, json.dumps(summary_data, indent=2))
+
+    index_path = path.parent / "benchmark-index.json"
+    index_data = json.loads(index_path.read_text(encoding="utf-8-sig")) if index_path.exists() else {"schemaVersion": 1, "entries": []}
+    if index_data.get("entries") is None:
+        index_data["entries"] = []
+    replaced = {(payload["os"], payload["runMode"]) for payload in payloads}
+    index_data["entries"] = [entry for entry in index_data["entries"] if (entry.get("os"), entry.get("runMode")) not in replaced]
+    index_data["entries"].extend(build_index_entry(payload) for payload in payloads)
+    atomic_write_text(index_path, json.dumps(index_data, indent=2))
+
+
+def write_shard(shard_dir: Path, name: str, value) -> str:
+    content = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    file_name = f"{name}.{hashlib.sha256(content).hexdigest()[:16]}.json"
+    target = shard_dir / file_name
+    if not target.exists():
+        atomic_write_bytes(target, content)
+    gz_target = shard_dir / f"{file_name}.gz"
+    if not gz_target.exists():
+        atomic_write_bytes(gz_target, gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        br_target = shard_dir / f"{file_name}.br"
+        if not br_target.exists():
+            atomic_write_bytes(br_target, brotli.compress(content, quality=11))
+    return file_name
+
+
+def shard_slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-").lower()
+
+
+def write_website_shards(data_dir: Path, data: dict):
+    shard_dir = data_dir / SHARD_DIR_NAME
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    referenced = set()
+    for os_name in OS_NAMES:
+        entries[os_name] = {}
+        for run_mode in RUN_MODES:
+            payload = get_stored_payload(data, os_name, run_mode)
+            if not payload:
+                entries[os_name][run_mode] = None
+                continue
+            summary = {key: value for key, value in payload.items() if key in SUMMARY_SHARD_FIELDS or not isinstance(value, (dict, list))}
+            summary_file = write_shard(shard_dir, f"{os_name}-{run_mode}-summary", summary)
+            referenced.add(summary_file)
+            details = []
+            for section in SHARD_SECTIONS:
+                for item in payload.get(section) or []:
+                    item_id = item.get("id") or item.get("title") or "unknown"
+                    file_name = write_shard(shard_dir, f"{os_name}-{run_mode}-{section}-{shard_slug(item_id)}", item)
+                    referenced.add(file_name)
+                    details.append({"section": section, "id": item.get("id"), "title": item.get("title"), "path": f"{SHARD_DIR_NAME}/{file_name}"})
+            sections = {}
+            for section, value in payload.items():
+                if section in summary or section in SHARD_SECTIONS or not value:
+                    continue
+                file_name = write_shard(shard_dir, f"{os_name}-{run_mode}-{shard_slug(section)}", value)
+                referenced.add(file_name)
+                sections[section] = f"{SHARD_DIR_NAME}/{file_name}"
+            entries[os_name][run_mode] = {
+                "generatedUtc": payload.get("generatedUtc"),
+                "publish": payload.get("publish"),
+                "hasData": bool(payload.get("summary") or payload.get("comparisons")),
+                "summary": f"{SHARD_DIR_NAME}/{summary_file}",
+                "details": details,
+                "sections": sections,
+            }
+
+    manifest = {
+        "schemaVersion": 1,
+        "generatedUtc": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "encodings": ["gzip", "br"] if brotli is not None else ["gzip"],
+        "entries": entries,
+    }
+    atomic_write_text(data_dir / "benchmark-manifest.json", json.dumps(manifest, separators=(",", ":")))
+
+    # Only the shards of the manifest just written are kept; the site falls back to benchmark.json if one is missing.
+    for path in shard_dir.iterdir():
+        if path.is_file() and path.name.removesuffix(".gz").removesuffix(".br") not in referenced:
+            path.unlink()
+    return manifest
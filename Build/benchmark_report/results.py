@@ -0,0 +1,587 @@
+import csv
+import dataclasses
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .common import (
+    COMPARE_VENDORS,
+    FULL_REPORT_SUFFIXES,
+    OS_NAMES,
+    ParseCache,
+    TIMINGS,
+    TITLE_MAP,
+    cached_parse,
+    first_column,
+    framework_sort_key,
+    get_compare_class_name,
+    normalize_compare_scenario,
+    normalize_mean_text,
+    normalize_method,
+    parse_allocated_bytes,
+    parse_count,
+    parse_mean_to_ns,
+    runtime_framework,
+    strip_benchmark_prefix,
+)
+from .host import detect_os_name, load_bdn_environment, load_run_info
+from .packrunner import load_pack_runner_payload
+from .profiles import filter_disassembly, load_cpu_profiles, load_disassembly
+
+
+REPORT_GLOB = "*-report.csv"
+HISTOGRAM_BINS = 12
+OUTPUT_PIXEL_COLUMNS = ("OutputPixels", "Pixels")
+OUTPUT_MODULE_COLUMNS = ("OutputModules", "Modules")
+INPUT_BYTE_COLUMNS = ("PayloadBytes", "InputBytes", "Length")
+
+
+def resolve_os_name(artifacts_path: Path, override: str | None) -> str:
+    if override:
+        return override.lower()
+    leaf = artifacts_path.name.lower()
+    for candidate in ("windows", "linux", "macos"):
+        if leaf.startswith(f"{candidate}-"):
+            return candidate
+    return detect_os_name()
+
+
+def load_csv_rows(path: Path):
+    TIMINGS.read(path)
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        sample = f.read(2048)
+        f.seek(0)
+        with TIMINGS.stage("csv_sniff"):
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=";,")
+            except csv.Error:
+                dialect = csv.get_dialect("excel")
+        with TIMINGS.stage("csv_read"):
+            reader = csv.DictReader(f, dialect=dialect)
+            return list(reader)
+
+
+def list_report_files(results_path: Path):
+    files = sorted(results_path.glob(REPORT_GLOB))
+    baseline_files = [p for p in files if "Compare" not in p.name]
+    compare_files = [p for p in files if "Compare" in p.name]
+    return baseline_files, compare_files
+
+
+def expected_compare_ids():
+    return sorted([key for key in TITLE_MAP.keys() if key.endswith("CompareBenchmarks")])
+
+
+def compute_missing_compare(compare_files):
+    expected = expected_compare_ids()
+    actual = sorted([get_compare_class_name(p) for p in compare_files])
+    missing_titles = [TITLE_MAP.get(name, name) for name in expected if name not in actual]
+    missing_ids = [name for name in expected if name not in actual]
+    return expected, actual, missing_titles, missing_ids
+
+
+def parse_vendor_scenario(method: str):
+    method = (method or "").strip()
+    if not method:
+        return "Unknown", method
+    parts = method.split(None, 1)
+    if len(parts) == 2 and parts[0] in COMPARE_VENDORS:
+        return parts[0], parts[1]
+    return "Unknown", method
+
+
+@dataclass(slots=True)
+class BenchmarkRow:
+    method: str
+    vendor: str
+    scenario: str
+    mean: str
+    mean_ns: float | None
+    allocated: str
+    allocated_bytes: float | None
+    error_ns: float | None
+    stddev_ns: float | None
+    distribution: dict | None = None
+    gen0_per_1k: float | None = None
+    gen1_per_1k: float | None = None
+    gen2_per_1k: float | None = None
+    completed_work_items: float | None = None
+    lock_contentions: float | None = None
+    output_pixels: float | None = None
+    output_modules: float | None = None
+    input_bytes: float | None = None
+    runtime: str | None = None
+
+    def throughput(self):
+        if not self.mean_ns:
+            return None
+        ops_per_second = 1_000_000_000.0 / self.mean_ns
+        metrics = {
+            "opsPerSecondPerCore": round(ops_per_second, 2),
+            "allocatedBytesPerSecond": round(self.allocated_bytes * ops_per_second, 0) if self.allocated_bytes is not None else None,
+            "gen0Per1kOps": self.gen0_per_1k,
+            "gen1Per1kOps": self.gen1_per_1k,
+            "gen2Per1kOps": self.gen2_per_1k,
+            "gcPer1kOps": self.gen0_per_1k,
+            "gcPerSecond": round(self.gen0_per_1k * ops_per_second / 1000.0, 3) if self.gen0_per_1k is not None else None,
+            "allocatedPerPixel": None,
+            "allocatedPerModule": None,
+        }
+        if self.allocated_bytes is not None and self.output_pixels:
+            metrics["allocatedPerPixel"] = round(self.allocated_bytes / self.output_pixels, 4)
+        if self.allocated_bytes is not None and self.output_modules:
+            metrics["allocatedPerModule"] = round(self.allocated_bytes / self.output_modules, 4)
+        if self.completed_work_items is not None:
+            metrics["completedWorkItemsPerOp"] = self.completed_work_items
+        if self.lock_contentions is not None:
+            metrics["lockContentionsPerOp"] = self.lock_contentions
+        return metrics
+
+    def to_vendor_payload(self):
+        payload = {
+            "mean": self.mean,
+            "meanNs": self.mean_ns,
+            "errorNs": self.error_ns,
+            "stdDevNs": self.stddev_ns,
+            "allocated": self.allocated,
+        }
+        if self.distribution:
+            payload["distribution"] = self.distribution
+        payload["throughput"] = self.throughput()
+        return payload
+
+
+@dataclass(slots=True)
+class BenchmarkReport:
+    id: str
+    title: str
+    path: Path
+    rows: list[BenchmarkRow]
+    scenarios: dict[str, dict[str, BenchmarkRow]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RunResults:
+    results_path: Path
+    baseline_files: list[Path]
+    compare_files: list[Path]
+    baseline: list[BenchmarkReport]
+    comparisons: list[BenchmarkReport]
+
+
+def encode_benchmark_report(report: BenchmarkReport | None):
+    if report is None:
+        return None
+    return {
+        "rows": [[getattr(row, name) for name in BenchmarkRow.__slots__] for row in report.rows],
+    }
+
+
+def decode_benchmark_report(data, path: Path, compare: bool):
+    if data is None:
+        return None
+    base_name = strip_benchmark_prefix(path.stem)
+    report = BenchmarkReport(
+        id=base_name,
+        title=TITLE_MAP.get(base_name, base_name),
+        path=path,
+        rows=[BenchmarkRow(*values) for values in data["rows"]],
+    )
+    if compare:
+        for row in report.rows:
+            report.scenarios.setdefault(row.scenario, {})[row.vendor] = row
+    return report
+
+
+def find_full_report(csv_path: Path):
+    stem = csv_path.name[: -len("-report.csv")]
+    for suffix in FULL_REPORT_SUFFIXES:
+        candidate = csv_path.with_name(stem + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize_measurements(values: list[float]):
+    values = sorted(values)
+    q1 = percentile(values, 0.25)
+    q3 = percentile(values, 0.75)
+    iqr = q3 - q1
+    lower_fence = q1 - 1.5 * iqr
+    upper_fence = q3 + 1.5 * iqr
+    low, high = values[0], values[-1]
+    histogram = [0] * HISTOGRAM_BINS
+    width = (high - low) / HISTOGRAM_BINS
+    for value in values:
+        index = HISTOGRAM_BINS - 1 if width == 0 else min(int((value - low) / width), HISTOGRAM_BINS - 1)
+        histogram[index] += 1
+    return {
+        "source": "measurements",
+        "n": len(values),
+        "minNs": low,
+        "medianNs": percentile(values, 0.50),
+        "p90Ns": percentile(values, 0.90),
+        "p95Ns": percentile(values, 0.95),
+        "p99Ns": percentile(values, 0.99),
+        "maxNs": high,
+        "lowerOutliers": sum(1 for value in values if value < lower_fence),
+        "upperOutliers": sum(1 for value in values if value > upper_fence),
+        "histogram": {"minNs": low, "maxNs": high, "counts": histogram},
+    }
+
+
+def summarize_full_benchmark(benchmark: dict):
+    workload = []
+    for measurement in benchmark.get("Measurements") or []:
+        if measurement.get("IterationMode") != "Workload" or measurement.get("IterationStage") != "Actual":
+            continue
+        operations = measurement.get("Operations") or 0
+        nanoseconds = measurement.get("Nanoseconds")
+        if operations and nanoseconds is not None:
+            workload.append(nanoseconds / operations)
+    if workload:
+        return summarize_measurements(workload)
+    statistics = benchmark.get("Statistics") or {}
+    percentiles = statistics.get("Percentiles") or {}
+    if not statistics.get("N"):
+        return None
+    return {
+        "source": "statistics",
+        "n": statistics.get("N"),
+        "minNs": statistics.get("Min"),
+        "medianNs": statistics.get("Median"),
+        "p90Ns": percentiles.get("P90"),
+        "p95Ns": percentiles.get("P95"),
+        "p99Ns": None,
+        "maxNs": statistics.get("Max"),
+        "lowerOutliers": None,
+        "upperOutliers": None,
+        "histogram": None,
+    }
+
+
+def load_full_report(path: Path):
+    TIMINGS.read(path)
+    with TIMINGS.stage("json_load"):
+        raw = json.loads(path.read_text(encoding="utf-8-sig"))
+    entries: dict[str, list[dict]] = {}
+    for benchmark in raw.get("Benchmarks") or []:
+        method = normalize_method(benchmark.get("MethodTitle") or benchmark.get("Method") or "")
+        statistics = benchmark.get("Statistics") or {}
+        memory = benchmark.get("Memory") or {}
+        entries.setdefault(method, []).append(
+            {
+                "meanNs": statistics.get("Mean"),
+                "allocatedBytes": memory.get("BytesAllocatedPerOperation"),
+                "distribution": summarize_full_benchmark(benchmark),
+            }
+        )
+    return entries
+
+
+def load_benchmark_report(path: Path, compare: bool, cache: ParseCache | None = None):
+    full_report_path = find_full_report(path)
+    if cache is not None:
+        return cache.get_or_parse(
+            "compare-csv" if compare else "baseline-csv",
+            path,
+            lambda p: load_benchmark_report(p, compare),
+            encode_benchmark_report,
+            lambda data: decode_benchmark_report(data, path, compare),
+            (full_report_path,) if full_report_path else (),
+        )
+    full_entries = load_full_report(full_report_path) if full_report_path else {}
+    rows = load_csv_rows(path)
+    if not rows:
+        return None
+    base_name = strip_benchmark_prefix(path.stem)
+    report = BenchmarkReport(id=base_name, title=TITLE_MAP.get(base_name, base_name), path=path, rows=[])
+    for row in rows:
+        method = normalize_method(row.get("Method", ""))
+        if compare:
+            if not method:
+                TIMINGS.count("rowsDropped")
+                continue
+            vendor, scenario = parse_vendor_scenario(method)
+            scenario = normalize_compare_scenario(scenario)
+        else:
+            vendor, scenario = "CodeGlyphX", method
+        mean_text = normalize_mean_text(row.get("Mean", ""))
+        allocated = row.get("Allocated", "")
+        item = BenchmarkRow(
+            method=method,
+            vendor=vendor,
+            scenario=scenario,
+            mean=mean_text,
+            mean_ns=parse_mean_to_ns(mean_text),
+            allocated=allocated,
+            allocated_bytes=parse_allocated_bytes(allocated),
+            error_ns=parse_mean_to_ns(normalize_mean_text(row.get("Error", ""))),
+            stddev_ns=parse_mean_to_ns(normalize_mean_text(row.get("StdDev", ""))),
+            gen0_per_1k=parse_count(row.get("Gen0")),
+            gen1_per_1k=parse_count(row.get("Gen1")),
+            gen2_per_1k=parse_count(row.get("Gen2")),
+            completed_work_items=parse_count(row.get("Completed Work Items")),
+            lock_contentions=parse_count(row.get("Lock Contentions")),
+            output_pixels=first_column(row, OUTPUT_PIXEL_COLUMNS),
+            output_modules=first_column(row, OUTPUT_MODULE_COLUMNS),
+            input_bytes=first_column(row, INPUT_BYTE_COLUMNS),
+            runtime=(row.get("Runtime") or "").strip() or None,
+        )
+        full_entry = full_entries[method].pop(0) if full_entries.get(method) else None
+        if full_entry:
+            item.mean_ns = full_entry["meanNs"] or item.mean_ns
+            if full_entry["allocatedBytes"] is not None:
+                item.allocated_bytes = float(full_entry["allocatedBytes"])
+            item.distribution = full_entry["distribution"]
+        report.rows.append(item)
+        if compare:
+            report.scenarios.setdefault(scenario, {})[vendor] = item
+    return report
+
+
+def load_run_results(results_path: Path, cache: ParseCache | None = None) -> RunResults:
+    if not results_path.exists():
+        raise SystemExit(f"Results folder not found: {results_path}")
+    baseline_files, compare_files = list_report_files(results_path)
+    with TIMINGS.stage("parse_reports"):
+        baseline = [report for report in (load_benchmark_report(p, False, cache) for p in baseline_files) if report]
+        comparisons = [report for report in (load_benchmark_report(p, True, cache) for p in compare_files) if report]
+    for report in baseline + comparisons:
+        TIMINGS.count("rowsParsed", len(report.rows))
+        TIMINGS.count("rowsUnparseable", sum(1 for row in report.rows if row.mean_ns is None))
+    return RunResults(
+        results_path=results_path,
+        baseline_files=baseline_files,
+        compare_files=compare_files,
+        baseline=baseline,
+        comparisons=comparisons,
+    )
+
+
+@dataclass(slots=True)
+class IngestedRun:
+    artifacts_path: Path
+    os_name: str
+    run_mode: str
+    run_mode_details: str
+    run_mode_warning: str | None
+    run_mode_source: str
+    results: RunResults
+    pack_runner: dict | None
+    environment: dict | None = None
+    framework: str | None = None
+    profiles: list[dict] | None = None
+    disassembly: dict | None = None
+    run_info: dict | None = None
+
+
+def ingest_artifacts(artifacts_path: Path, os_override: str | None, run_mode: str | None, cache: ParseCache | None = None) -> IngestedRun:
+    os_name = resolve_os_name(artifacts_path, os_override)
+    results_path = artifacts_path / "results"
+    run_mode, run_mode_details, run_mode_warning, run_mode_source = resolve_run_mode(run_mode, results_path, cache)
+    results = load_run_results(results_path, cache)
+    return IngestedRun(
+        artifacts_path=artifacts_path,
+        os_name=os_name,
+        run_mode=run_mode,
+        run_mode_details=run_mode_details,
+        run_mode_warning=run_mode_warning,
+        run_mode_source=run_mode_source,
+        results=results,
+        pack_runner=load_pack_runner_payload(artifacts_path, run_mode, cache),
+        environment=load_bdn_environment(results_path, cache),
+        profiles=load_cpu_profiles(artifacts_path, cache),
+        disassembly=load_disassembly(results_path, cache),
+        run_info=load_run_info(artifacts_path),
+    )
+
+
+def discover_artifact_paths(root: Path):
+    if (root / "results").is_dir():
+        return [root]
+    return sorted(path for path in root.iterdir() if path.is_dir() and (path / "results").is_dir())
+
+
+def ingest_artifacts_traced(artifacts_path: Path, os_override: str | None, run_mode: str | None, cache: ParseCache | None = None):
+    TIMINGS.reset()
+    run = ingest_artifacts(artifacts_path, os_override, run_mode, cache)
+    return run, TIMINGS.to_dict(), cache.to_dict() if cache is not None else None
+
+
+def ingest_all(artifact_paths: list[Path], os_override: str | None, run_mode: str | None, cache: ParseCache | None, jobs: int):
+    if jobs <= 1 or len(artifact_paths) <= 1:
+        return [ingest_artifacts(path, os_override, run_mode, cache) for path in artifact_paths]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(artifact_paths))) as executor:
+        futures = [
+            executor.submit(ingest_artifacts_traced, path, os_override, run_mode, cache.fork() if cache is not None else None)
+            for path in artifact_paths
+        ]
+        runs = []
+        for future in futures:
+            run, trace, cache_state = future.result()
+            TIMINGS.merge(trace)
+            if cache_state is not None:
+                cache.merge(cache_state)
+            runs.append(run)
+        return runs
+
+
+def filter_report(report: BenchmarkReport, rows: list[BenchmarkRow], compare: bool) -> BenchmarkReport:
+    filtered = BenchmarkReport(id=report.id, title=report.title, path=report.path, rows=rows)
+    if compare:
+        for row in rows:
+            filtered.scenarios.setdefault(row.scenario, {})[row.vendor] = row
+    return filtered
+
+
+def split_by_framework(runs: list[IngestedRun], default_framework: str) -> list[IngestedRun]:
+    split = []
+    for run in runs:
+        host = runtime_framework((run.environment or {}).get("runtime")) or default_framework
+        reports = [(report, False) for report in run.results.baseline] + [(report, True) for report in run.results.comparisons]
+        frameworks = sorted({runtime_framework(row.runtime) or host for report, _ in reports for row in report.rows}, key=framework_sort_key)
+        if len(frameworks) <= 1:
+            run.framework = frameworks[0] if frameworks else host
+            split.append(run)
+            continue
+        for framework in frameworks:
+            baseline = []
+            comparisons = []
+            for report, compare in reports:
+                rows = [row for row in report.rows if (runtime_framework(row.runtime) or host) == framework]
+                if rows:
+                    (comparisons if compare else baseline).append(filter_report(report, rows, compare))
+            results = dataclasses.replace(run.results, baseline=baseline, comparisons=comparisons)
+            environment = run.environment
+            if framework != host and environment:
+                runtime = next((row.runtime for report, _ in reports for row in report.rows if runtime_framework(row.runtime) == framework), None)
+                environment = {key: value for key, value in environment.items() if key not in ("runtime", "jit", "isa")}
+                if runtime:
+                    environment["runtime"] = runtime
+            split.append(
+                dataclasses.replace(
+                    run,
+                    results=results,
+                    framework=framework,
+                    pack_runner=run.pack_runner if framework == host else None,
+                    environment=environment,
+                    profiles=run.profiles if framework == host else None,
+                    disassembly=filter_disassembly(run.disassembly, framework, host),
+                )
+            )
+    return split
+
+
+def warn_framework_mismatch(runs: list[IngestedRun], framework: str):
+    for run in runs:
+        reports = run.results.baseline + run.results.comparisons
+        measured = sorted({runtime_framework(row.runtime) for report in reports for row in report.rows} - {None}, key=framework_sort_key)
+        if measured and framework not in measured:
+            print(
+                f"WARNING: --framework {framework} does not match the Runtime column of {run.artifacts_path} ({', '.join(measured)}); "
+                "the benchmarks pin their runtime, so results are labelled from the CSV.",
+                file=sys.stderr,
+            )
+
+
+def select_latest_runs(runs: list[IngestedRun]):
+    selected: dict[tuple[str, str, str | None], IngestedRun] = {}
+    for run in sorted(runs, key=lambda item: item.artifacts_path.name):
+        key = (run.os_name, run.run_mode, run.framework)
+        if key in selected:
+            print(
+                f"WARNING: {run.artifacts_path} replaces {selected[key].artifacts_path} for {run.os_name}/{run.run_mode}"
+                f"{f' ({run.framework})' if run.framework else ''}.",
+                file=sys.stderr,
+            )
+        selected[key] = run
+    return [
+        selected[key]
+        for key in sorted(
+            selected,
+            key=lambda item: (OS_NAMES.index(item[0]) if item[0] in OS_NAMES else len(OS_NAMES), item[1], framework_sort_key(item[2] or "")),
+        )
+    ]
+
+
+def format_run_mode(run_mode: str, source: str | None = None, requested: str | None = None) -> str:
+    if run_mode == "quick":
+        label = "Run mode: Quick (warmupCount=1, iterationCount=3, invocationCount=1)."
+    else:
+        label = "Run mode: Full (BenchmarkDotNet default job settings)."
+    if source in ("inferred", "inferred-mismatch"):
+        if requested and requested != run_mode:
+            return f"{label} (inferred from artifacts; requested {requested})."
+        return f"{label} (inferred from artifacts)."
+    return label
+
+
+def parse_job_counts(path: Path):
+    count_re = re.compile(r"(IterationCount|WarmupCount|InvocationCount)\\s*=\\s*(\\d+)")
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    counts = {}
+    for match in count_re.finditer(text):
+        counts[match.group(1).lower()] = int(match.group(2))
+    return counts
+
+
+def infer_run_mode_from_reports(results_path: Path, cache: ParseCache | None = None) -> str | None:
+    candidates = list(results_path.glob("*-report-github.md"))
+    if not candidates:
+        candidates = list(results_path.glob("*-report.md"))
+    if not candidates:
+        return None
+
+    for path in sorted(candidates):
+        try:
+            counts = cached_parse(cache, "job-counts", path, parse_job_counts)
+        except OSError:
+            continue
+        iteration = counts.get("iterationcount")
+        warmup = counts.get("warmupcount")
+        invocation = counts.get("invocationcount")
+        if iteration is None or warmup is None:
+            continue
+        if iteration == 3 and warmup == 1 and (invocation is None or invocation == 1):
+            return "quick"
+        return "full"
+    return None
+
+
+def resolve_run_mode(run_mode: str | None, results_path: Path, cache: ParseCache | None = None):
+    inferred = infer_run_mode_from_reports(results_path, cache)
+    requested = run_mode
+    warning = None
+    source = "explicit" if run_mode else None
+
+    if inferred:
+        if run_mode and inferred != run_mode:
+            warning = f"Run mode mismatch: requested {run_mode}, inferred {inferred} from artifacts."
+            run_mode = inferred
+            source = "inferred-mismatch"
+        elif not run_mode:
+            run_mode = inferred
+            source = "inferred"
+    if not run_mode:
+        run_mode = "quick" if os.environ.get("BENCH_QUICK") == "true" else "full"
+        source = "env-default"
+
+    if warning:
+        print(f"WARNING: {warning}", file=sys.stderr)
+
+    details = format_run_mode(run_mode, source=source, requested=requested)
+    return run_mode, details, warning, source
@@ -0,0 +1,117 @@
+import time
+from pathlib import Path
+
+from .common import ParseCache, TIMINGS
+from .results import IngestedRun, discover_artifact_paths, expected_compare_ids, ingest_artifacts, select_latest_runs, split_by_framework
+from .report import publish_reports
+
+
+class MemoryParseCache:
+    __slots__ = ("fallback", "entries")
+
+    def __init__(self, fallback: ParseCache | None):
+        self.fallback = fallback
+        self.entries: dict[tuple[str, str], tuple] = {}
+
+    def get_or_parse(self, kind: str, path: Path, parse, encode=None, decode=None, companions=()):
+        try:
+            signature = tuple((str(source), source.stat().st_mtime_ns, source.stat().st_size) for source in (path, *companions))
+        except OSError:
+            return parse(path)
+        entry = self.entries.get((kind, str(path)))
+        if entry and entry[0] == signature:
+            TIMINGS.count("memoryCacheHits")
+            return entry[1]
+        value = self.fallback.get_or_parse(kind, path, parse, encode, decode, companions) if self.fallback else parse(path)
+        self.entries[(kind, str(path))] = (signature, value)
+        return value
+
+    def evict(self):
+        return self.fallback.evict() if self.fallback else 0
+
+
+def snapshot_artifacts(artifacts_path: Path):
+    snapshot = {}
+    for folder in (artifacts_path / "results", artifacts_path / "pack-runner"):
+        if not folder.is_dir():
+            continue
+        for path in folder.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                snapshot[path.name if folder.name == "results" else f"pack-runner/{path.name}"] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def format_watch_progress(run: IngestedRun, payload: dict) -> str:
+    expected = expected_compare_ids()
+    missing = payload["missingComparisonIds"]
+    regressions = len((payload.get("regressions") or {}).get("regressions", []))
+    pack_slowdowns = (payload.get("packRunnerRegressions") or {}).get("slowdowns", 0)
+    parts = [
+        f"{run.os_name}/{run.run_mode}: {len(expected) - len(missing)}/{len(expected)} compare reports",
+        f"{len(run.results.baseline)} baseline reports",
+        "pack runner " + ("done" if run.pack_runner else "pending"),
+        f"{regressions} regressions",
+    ]
+    if pack_slowdowns:
+        parts.append(f"{pack_slowdowns} pack slowdowns")
+    if missing:
+        parts.append("waiting for " + ", ".join(missing))
+    return "[watch] " + "; ".join(parts)
+
+
+def watch_artifacts(args, artifact_paths: list[Path], cache: ParseCache | None, meta: dict, thresholds: dict, output_path: Path, json_path: Path):
+    memory_cache = MemoryParseCache(cache)
+    root = Path(args.artifacts_root).resolve() if args.artifacts_root else None
+    previous_payloads: dict[tuple[str, str], dict | None] = {}
+    pending: dict[Path, dict] = {}
+    published: dict[Path, dict] = {}
+    ingested: dict[Path, list[IngestedRun]] = {}
+    latest_payloads: dict[tuple[str, str, str | None], dict] = {}
+    deadline = time.monotonic() + args.watch_timeout if args.watch_timeout else None
+    print(f"[watch] Polling every {args.watch_interval:g}s; press Ctrl+C to stop.")
+    try:
+        while True:
+            paths = list(artifact_paths)
+            if root and root.is_dir():
+                paths.extend(path for path in discover_artifact_paths(root) if path not in paths)
+            changed = []
+            for path in paths:
+                if not (path / "results").is_dir():
+                    continue
+                snapshot = snapshot_artifacts(path)
+                if snapshot == published.get(path):
+                    continue
+                if snapshot != pending.get(path):
+                    pending[path] = snapshot
+                    continue
+                published[path] = snapshot
+                with TIMINGS.stage("ingest"):
+                    ingested[path] = split_by_framework([ingest_artifacts(path, args.os_name, args.run_mode, memory_cache)], args.framework)
+                changed.extend(ingested[path])
+
+            if changed:
+                selected = select_latest_runs([run for items in ingested.values() for run in items])
+                changed_ids = {id(run) for run in changed}
+                refreshed = [run for run in selected if id(run) in changed_ids]
+                if refreshed:
+                    payloads = publish_reports(refreshed, args, meta, thresholds, output_path, json_path, previous_payloads)
+                    for run, payload in zip(refreshed, payloads):
+                        latest_payloads[(run.os_name, run.run_mode, run.framework)] = payload
+                        print(format_watch_progress(run, payload), flush=True)
+                if latest_payloads and all(not payload["missingComparisonIds"] for payload in latest_payloads.values()):
+                    print("[watch] All expected compare reports are present.")
+                    break
+            if deadline is not None and time.monotonic() >= deadline:
+                print("[watch] Timeout reached.")
+                break
+            time.sleep(args.watch_interval)
+    except KeyboardInterrupt:
+        print("[watch] Stopped.")
+
+    selected = select_latest_runs([run for items in ingested.values() for run in items])
+    runs = [run for run in selected if (run.os_name, run.run_mode, run.framework) in latest_payloads]
+    return runs, [latest_payloads[(run.os_name, run.run_mode, run.framework)] for run in runs]
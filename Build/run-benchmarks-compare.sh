@@ -15,6 +15,9 @@ COMPARE_FILTER_SET=0
 BENCH_QUICK=1
 ALLOW_PARTIAL=0
 SKIP_PREFLIGHT=0
+PROFILE=0
+DISASM=0
+FAIL_ON_REGRESSION=0
 
 usage() {
   cat <<EOF
@@ -29,11 +32,14 @@ Options:
   --compare-zxing            Compare only ZXing (implies compare run)
   --compare-qrcoder          Compare only QRCoder (implies compare run)
   --compare-barcoder         Compare only Barcoder (implies compare run)
-  --base-filter <filter>     Benchmark filter for baseline (default: *)
-  --compare-filter <filter>  Benchmark filter for compare (default: *Compare*)
+  --base-filter <filter>     Benchmark filter(s) for baseline, space separated (default: *)
+  --compare-filter <filter>  Benchmark filter(s) for compare, space separated (default: *Compare*)
   --full                     Run full BenchmarkDotNet settings (default: quick)
   --allow-partial            Allow incomplete compare results in report
   --skip-preflight           Skip dependency preflight checks
+  --profile                  Attach the EventPipe CPU profiler (speedscope output feeds the Hot frames report)
+  --disasm                   Export JIT disassembly for the QR encode/pipeline benchmarks (feeds the JIT code size report)
+  --fail-on-regression       Fail when the report flags regressions against the previous run
   -h, --help                 Show this help
 EOF
   return 0
@@ -54,6 +60,9 @@ while [[ $# -gt 0 ]]; do
     --full) BENCH_QUICK=0; shift ;;
     --allow-partial) ALLOW_PARTIAL=1; shift ;;
     --skip-preflight) SKIP_PREFLIGHT=1; shift ;;
+    --profile) PROFILE=1; shift ;;
+    --disasm) DISASM=1; shift ;;
+    --fail-on-regression) FAIL_ON_REGRESSION=1; shift ;;
     -h|--help) usage; exit 0 ;;
     *) echo "Unknown option: $1"; usage; exit 1 ;;
   esac
@@ -79,6 +88,24 @@ TIMESTAMP="$(date +"%Y%m%d-%H%M%S")"
 ARTIFACTS_PATH="$ARTIFACTS_ROOT/$OS_NAME-$TIMESTAMP"
 mkdir -p "$ARTIFACTS_PATH"
 
+json_string() {
+  local value="${1//\\/\\\\}"
+  value="${value//\"/\\\"}"
+  printf '"%s"' "$value"
+}
+
+write_run_info() {
+  local commit branch machine sdk
+  commit="$(git -C "$SCRIPT_DIR/.." rev-parse HEAD 2>/dev/null || true)"
+  branch="$(git -C "$SCRIPT_DIR/.." rev-parse --abbrev-ref HEAD 2>/dev/null || true)"
+  machine="$(hostname 2>/dev/null || uname -n)"
+  sdk="$(dotnet --version 2>/dev/null || true)"
+  printf '{"commit": %s, "branch": %s, "machineName": %s, "dotnetSdk": %s}\n' \
+    "$(json_string "$commit")" "$(json_string "$branch")" "$(json_string "$machine")" "$(json_string "$sdk")" > "$ARTIFACTS_PATH/run-info.json"
+}
+
+write_run_info
+
 run_bench() {
   local label="$1"
   local filter="$2"
@@ -92,7 +119,13 @@ run_bench() {
   if [[ ${#props[@]} -gt 0 ]]; then
     args+=("${props[@]}")
   fi
-  args+=(-- --filter "$filter" --artifacts "$ARTIFACTS_PATH")
+  # Space separated filters become separate --filter values (BenchmarkDotNet ORs them).
+  local filters
+  read -r -a filters <<< "$filter"
+  args+=(-- --filter "${filters[@]}" --artifacts "$ARTIFACTS_PATH" --exporters json)
+  if [[ $PROFILE -eq 1 ]]; then
+    args+=(--profiler EP)
+  fi
   if [[ -n "$env_prefix" ]]; then
     eval "$env_prefix dotnet \"\${args[@]}\""
   else
@@ -121,7 +154,7 @@ run_pack_runner() {
   if [[ ${#props[@]} -gt 0 ]]; then
     args+=("${props[@]}")
   fi
-  args+=(-- --pack-runner --mode "$mode_arg" --format json --reports-dir "$reports_dir")
+  args+=(-- --pack-runner --mode "$mode_arg" --format json,csv --reports-dir "$reports_dir")
 
   local pack_env="$env_prefix"
   pack_env+="CODEGLYPHX_PACK_REPORTS_DIR=\"$reports_dir\" "
@@ -161,6 +194,9 @@ if [[ $NO_BASE -eq 0 ]]; then
   if [[ $BENCH_QUICK -eq 1 ]]; then
     base_props+=("/p:BenchQuick=true")
   fi
+  if [[ $DISASM -eq 1 ]]; then
+    base_props+=("/p:BenchDisasm=true")
+  fi
   run_bench "Baseline (CodeGlyphX only)" "$BASE_FILTER" "$base_env" "${base_props[@]}"
 fi
 
@@ -197,7 +233,6 @@ fi
 
 run_pack_runner "QR decode pack runner" "$PACK_ENV_PREFIX" "${PACK_PROPS[@]}"
 
-REPORT_SCRIPT_PS1="$SCRIPT_DIR/Generate-BenchmarkReport.ps1"
 REPORT_SCRIPT_PY="$SCRIPT_DIR/generate-benchmark-report.py"
 REPORT_RUN_MODE=$([[ $BENCH_QUICK -eq 1 ]] && echo "quick" || echo "full")
 REPORT_ENFORCE_COMPARE=1
@@ -205,23 +240,18 @@ if [[ $ALLOW_PARTIAL -eq 1 || "$COMPARE_FILTER" != "*Compare*" ]]; then
   REPORT_ENFORCE_COMPARE=0
 fi
 
-if command -v pwsh >/dev/null 2>&1 && [[ -f "$REPORT_SCRIPT_PS1" ]]; then
-  report_args=(pwsh -NoProfile -File "$REPORT_SCRIPT_PS1" -ArtifactsPath "$ARTIFACTS_PATH" -Framework "$FRAMEWORK" -Configuration "$CONFIGURATION" -RunMode "$REPORT_RUN_MODE")
+if command -v python3 >/dev/null 2>&1 && [[ -f "$REPORT_SCRIPT_PY" ]]; then
+  report_args=(python3 "$REPORT_SCRIPT_PY" --artifacts-path "$ARTIFACTS_PATH" --framework "$FRAMEWORK" --configuration "$CONFIGURATION" --run-mode "$REPORT_RUN_MODE")
   if [[ $ALLOW_PARTIAL -eq 1 ]]; then
-    report_args+=("-AllowPartial")
+    report_args+=(--allow-partial)
   elif [[ $REPORT_ENFORCE_COMPARE -eq 1 ]]; then
-    report_args+=("-FailOnMissingCompare")
+    report_args+=(--fail-on-missing-compare)
   fi
-  "${report_args[@]}"
-elif command -v python3 >/dev/null 2>&1 && [[ -f "$REPORT_SCRIPT_PY" ]]; then
-  if [[ $ALLOW_PARTIAL -eq 1 ]]; then
-    python3 "$REPORT_SCRIPT_PY" --artifacts-path "$ARTIFACTS_PATH" --framework "$FRAMEWORK" --configuration "$CONFIGURATION" --run-mode "$REPORT_RUN_MODE" --allow-partial
-  elif [[ $REPORT_ENFORCE_COMPARE -eq 1 ]]; then
-    python3 "$REPORT_SCRIPT_PY" --artifacts-path "$ARTIFACTS_PATH" --framework "$FRAMEWORK" --configuration "$CONFIGURATION" --run-mode "$REPORT_RUN_MODE" --fail-on-missing-compare
-  else
-    python3 "$REPORT_SCRIPT_PY" --artifacts-path "$ARTIFACTS_PATH" --framework "$FRAMEWORK" --configuration "$CONFIGURATION" --run-mode "$REPORT_RUN_MODE"
+  if [[ $FAIL_ON_REGRESSION -eq 1 ]]; then
+    report_args+=(--fail-on-regression)
   fi
+  "${report_args[@]}"
 else
   echo ""
-  echo "Skipping BENCHMARK.md generation (pwsh/python3 not found or report scripts missing)."
+  echo "Skipping BENCHMARK.md generation (python3 not found or report script missing)."
 fi
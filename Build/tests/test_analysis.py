@@ -0,0 +1,97 @@
+import sys
+import unittest
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.analysis import analyze_pareto, fit_scaling, pareto_frontier, rate_pareto, split_pipeline_cost
+from benchmark_report.results import BenchmarkRow, load_run_results
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def row(vendor: str, mean_ns: float | None, allocated_bytes: float | None) -> BenchmarkRow:
+    return BenchmarkRow(
+        method=f"{vendor} Scenario",
+        vendor=vendor,
+        scenario="Scenario",
+        mean="",
+        mean_ns=mean_ns,
+        allocated="",
+        allocated_bytes=allocated_bytes,
+        error_ns=None,
+        stddev_ns=None,
+    )
+
+
+class ParetoTests(unittest.TestCase):
+    def test_frontier_drops_dominated_vendors_and_sorts_by_time(self):
+        vendors = {
+            "CodeGlyphX": row("CodeGlyphX", 120, 16),
+            "ZXing.Net": row("ZXing.Net", 240, 64),
+            "QRCoder": row("QRCoder", 100, 96),
+        }
+        frontier, use_alloc = pareto_frontier(vendors)
+
+        self.assertTrue(use_alloc)
+        self.assertEqual(frontier, ["QRCoder", "CodeGlyphX"])
+
+    def test_missing_allocation_falls_back_to_time_only(self):
+        vendors = {
+            "CodeGlyphX": row("CodeGlyphX", 120, 16),
+            "QRCoder": row("QRCoder", 100, None),
+        }
+        frontier, use_alloc = pareto_frontier(vendors)
+
+        self.assertFalse(use_alloc)
+        self.assertEqual(frontier, ["QRCoder"])
+
+    def test_vendor_on_frontier_rates_good(self):
+        results = load_run_results(FIXTURES / "artifacts" / "results")
+        compare = next(report for report in results.comparisons if report.id == "QrCompareBenchmarks")
+        pareto = analyze_pareto(compare.scenarios["PNG (Medium)"])
+
+        self.assertTrue(pareto["onFrontier"])
+        self.assertEqual(pareto["gap"], 1.0)
+        self.assertEqual(rate_pareto(pareto, "balanced"), "good")
+
+    def test_gap_is_measured_against_the_closest_frontier_vendor(self):
+        results = load_run_results(FIXTURES / "artifacts" / "results")
+        compare = next(report for report in results.comparisons if report.id == "QrCompareBenchmarks")
+        pareto = analyze_pareto(compare.scenarios["SVG (Medium)"])
+
+        self.assertFalse(pareto["onFrontier"])
+        self.assertEqual(pareto["frontier"], ["ZXing.Net"])
+        self.assertEqual(pareto["gap"], 2.0)
+        self.assertEqual(rate_pareto(pareto, "balanced"), "bad")
+
+    def test_no_codeglyphx_row_means_no_rating(self):
+        self.assertIsNone(analyze_pareto({"QRCoder": row("QRCoder", 100, 96)}))
+        self.assertEqual(rate_pareto(None, "balanced"), "unknown")
+
+
+class ScalingTests(unittest.TestCase):
+    def test_linear_fit(self):
+        slope, intercept, exponent = fit_scaling([(1, 5), (2, 8), (4, 14), (8, 26)])
+
+        self.assertAlmostEqual(slope, 3.0)
+        self.assertAlmostEqual(intercept, 2.0)
+        self.assertLess(exponent, 1.0)
+
+    def test_quadratic_growth_reports_exponent_two(self):
+        _, _, exponent = fit_scaling([(size, size * size * 0.5) for size in (21, 41, 81, 177)])
+
+        self.assertAlmostEqual(exponent, 2.0)
+
+    def test_pipeline_split_separates_rasterize_from_compress(self):
+        self.assertEqual(
+            split_pipeline_cost(100.0, 20.0, 30.0, 50.0),
+            {"encode": 20.0, "rasterize": 30.0, "compress": 20.0, "other": 30.0},
+        )
+        self.assertIsNone(split_pipeline_cost(100.0, 20.0, 30.0, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
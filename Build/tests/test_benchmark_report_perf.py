@@ -0,0 +1,76 @@
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+HARNESS = BUILD_DIR / "benchmark-report-perf.py"
+
+spec = importlib.util.spec_from_file_location("benchmark_report_perf", HARNESS)
+perf = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(perf)
+
+
+def stage_run(scale: int, seconds: float) -> dict:
+    return {"scale": scale, "stages": {"main": {"seconds": seconds, "peakBytes": 0}}}
+
+
+class GrowthTests(unittest.TestCase):
+    def test_linear_and_quadratic_growth(self):
+        self.assertAlmostEqual(perf.growth_exponent([(1, 0.5), (4, 2.0)]), 1.0)
+        self.assertAlmostEqual(perf.growth_exponent([(1, 0.5), (4, 8.0)]), 2.0)
+
+    def test_degenerate_points_have_no_exponent(self):
+        self.assertIsNone(perf.growth_exponent([(2, 1.0), (2, 3.0)]))
+        self.assertIsNone(perf.growth_exponent([(1, 0.0), (4, 1.0)]))
+
+    def test_summary_flags_superlinear_stages(self):
+        summary = perf.summarize([stage_run(1, 1.0), stage_run(2, 4.0)])
+
+        self.assertEqual(summary["main"], {"growthExponent": 2.0, "superlinear": True})
+        self.assertFalse(perf.summarize([stage_run(1, 1.0), stage_run(2, 2.0)])["main"]["superlinear"])
+
+
+class BaselineTests(unittest.TestCase):
+    def test_only_slowdowns_beyond_the_limit_fail(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        baseline = root / "baseline.json"
+        baseline.write_text(json.dumps({"runs": [stage_run(1, 1.0), stage_run(2, 2.0)]}), encoding="utf-8")
+        report = {"runs": [stage_run(1, 1.4), stage_run(2, 3.5)]}
+
+        self.assertEqual(perf.compare_with_baseline(report, baseline, 0.5), ["x2 main: 2000.0 ms -> 3500.0 ms"])
+
+
+class HarnessRunTests(unittest.TestCase):
+    def test_small_run_writes_a_report_per_scale(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        output = root / "perf.json"
+        subprocess.run(
+            [
+                sys.executable, str(HARNESS),
+                "--scales", "1,2",
+                "--compare-files", "2",
+                "--scenarios", "2",
+                "--pack-scenarios", "5",
+                "--repeat", "1",
+                "--json-output", str(output),
+            ],
+            check=True,
+            capture_output=True,
+            cwd=root,
+        )
+        report = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertEqual([run["scale"] for run in report["runs"]], [1, 2])
+        self.assertIn("main", report["summary"])
+        self.assertTrue(all(run["stages"]["main"]["seconds"] > 0 for run in report["runs"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
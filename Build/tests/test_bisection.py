@@ -0,0 +1,110 @@
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report import bisection
+from benchmark_report.bisection import BISECT_ABORT, BISECT_BAD, BISECT_GOOD, BISECT_SKIP, bisect_result_path, bisect_settings_key
+
+GOOD_COMMIT = "a" * 40
+CURRENT_COMMIT = "b" * 40
+FILTER = "*QrCodeBenchmarks*"
+METHOD = "QrCodeBenchmarks/QR Encode (Long)"
+
+
+def measured(status: str = "ok", mean_ns: float = 1000.0, reason: str | None = None, name: str = METHOD):
+    return {"commit": CURRENT_COMMIT, "status": status, "reason": reason, "means": {name: {"meanNs": mean_ns, "errorNs": 1.0}}}
+
+
+class BisectStepTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        self.argv = [
+            "--repo", str(self.cache_dir),
+            "--cache-dir", str(self.cache_dir),
+            "--filter", FILTER,
+            "--framework", "net8.0",
+            "--run-mode", "quick",
+            "--good-commit", GOOD_COMMIT,
+            "--threshold", "0.1",
+        ]
+
+    def write_reference(self, mean_ns: float = 1000.0):
+        path = bisect_result_path(self.cache_dir, GOOD_COMMIT, bisect_settings_key(FILTER, "net8.0", "quick"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"status": "ok", "means": {METHOD: {"meanNs": mean_ns, "errorNs": 1.0}}}), encoding="utf-8")
+
+    def run_step(self, argv, result=None):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch.object(bisection, "measure_commit", return_value=result) as measure:
+            with redirect_stdout(stdout), redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                bisection.bisect_step_main(argv)
+        return raised.exception.code, stdout.getvalue(), stderr.getvalue(), measure
+
+    def test_within_threshold_is_good(self):
+        self.write_reference()
+        code, stdout, _, _ = self.run_step(self.argv, measured(mean_ns=1050.0))
+
+        self.assertEqual(code, BISECT_GOOD)
+        self.assertIn("good", stdout)
+
+    def test_regression_beyond_threshold_is_bad(self):
+        self.write_reference()
+        code, stdout, _, _ = self.run_step(self.argv, measured(mean_ns=1500.0))
+
+        self.assertEqual(code, BISECT_BAD)
+        self.assertIn("+50.0%", stdout)
+
+    def test_method_filter_limits_the_comparison(self):
+        self.write_reference()
+        code, _, _, _ = self.run_step([*self.argv, "--method", "Short"], measured(mean_ns=1500.0))
+
+        self.assertEqual(code, BISECT_SKIP)
+
+    def test_unbuildable_commit_is_skipped(self):
+        self.write_reference()
+        code, stdout, _, _ = self.run_step(self.argv, measured(status="skip", reason="dotnet exited with 1"))
+
+        self.assertEqual(code, BISECT_SKIP)
+        self.assertIn("dotnet exited with 1", stdout)
+
+    def test_no_shared_benchmarks_is_skipped(self):
+        self.write_reference()
+        code, _, _, _ = self.run_step(self.argv, measured(name="QrCodeBenchmarks/Other"))
+
+        self.assertEqual(code, BISECT_SKIP)
+
+    def test_missing_reference_aborts_without_measuring(self):
+        code, _, stderr, measure = self.run_step(self.argv, measured())
+
+        self.assertEqual(code, BISECT_ABORT)
+        self.assertIn("No cached measurement", stderr)
+        measure.assert_not_called()
+
+    def test_usage_errors_abort_instead_of_marking_bad(self):
+        code, _, _, _ = self.run_step(self.argv[:-2])
+
+        self.assertEqual(code, BISECT_ABORT)
+
+    def test_unexpected_errors_abort(self):
+        self.write_reference()
+        with mock.patch.object(bisection, "measure_commit", side_effect=RuntimeError("git failed")):
+            with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as raised:
+                bisection.bisect_step_main(self.argv)
+
+        self.assertEqual(raised.exception.code, BISECT_ABORT)
+        self.assertIn("git failed", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import io
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.gates import check_budgets_main, evaluate_budgets, load_performance_budgets, resolve_budgets
+from benchmark_report.report import finish_reports
+from benchmark_report.results import IngestedRun, load_run_results
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+BUDGETS = {
+    "benchmarks": {
+        "QrCompareBenchmarks": {
+            "maxMeanNs": "200 us",
+            "scenarios": {"Missing (Medium)": {"maxMeanNs": 1000}},
+        },
+        "QrCodeBenchmarks": {"maxAllocatedBytes": "256 KB"},
+    },
+    "overrides": {
+        "quick": {"benchmarks": {"QrCompareBenchmarks": {"maxMeanNs": "150 us"}}},
+        "linux/quick": {"benchmarks": {"QrCompareBenchmarks": {"scenarios": {"SVG (Medium)": {"maxMeanNs": "1 ms"}}}}},
+        "windows": {"benchmarks": {"QrCompareBenchmarks": {"maxMeanNs": "1 s"}}},
+    },
+}
+
+
+def make_run(run_mode: str = "quick", os_name: str = "linux") -> IngestedRun:
+    return IngestedRun(
+        artifacts_path=FIXTURES / "artifacts",
+        os_name=os_name,
+        run_mode=run_mode,
+        run_mode_details="",
+        run_mode_warning=None,
+        run_mode_source="test",
+        results=load_run_results(FIXTURES / "artifacts" / "results"),
+        pack_runner=None,
+    )
+
+
+def make_args(**overrides):
+    values = {"no_history": True, "timings": False, "timings_output": None, "allow_budget_breach": False, "fail_on_regression": False}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_payload(**overrides):
+    payload = {"os": "linux", "runMode": "quick", "missingComparisons": [], "budgets": None, "regressions": None, "packRunnerRegressions": None}
+    payload.update(overrides)
+    return payload
+
+
+class BudgetTests(unittest.TestCase):
+    def test_overrides_apply_mode_then_os_then_os_and_mode(self):
+        resolved, applied = resolve_budgets(BUDGETS, "linux", "quick")
+        compare = resolved["benchmarks"]["QrCompareBenchmarks"]
+
+        self.assertEqual(applied, ["quick", "linux/quick"])
+        self.assertEqual(compare["maxMeanNs"], 150_000)
+        self.assertEqual(compare["scenarios"]["SVG (Medium)"]["maxMeanNs"], 1_000_000)
+        self.assertEqual(resolved["benchmarks"]["QrCodeBenchmarks"]["maxAllocatedBytes"], 256 * 1024)
+
+    def test_overrides_do_not_leak_into_other_targets(self):
+        resolved, applied = resolve_budgets(BUDGETS, "macos", "full")
+
+        self.assertEqual(applied, [])
+        self.assertEqual(resolved["benchmarks"]["QrCompareBenchmarks"]["maxMeanNs"], 200_000)
+
+    def test_invalid_limit_exits(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        path = root / "budgets.json"
+        path.write_text(json.dumps({"benchmarks": {"QrCodeBenchmarks": {"maxMeanNs": "fast"}}}), encoding="utf-8")
+
+        with self.assertRaises(SystemExit):
+            load_performance_budgets(path)
+
+    def test_evaluate_reports_breaches_ok_and_missing(self):
+        report = evaluate_budgets(make_run(), BUDGETS)
+        statuses = {item["scenario"]: item["status"] for item in report["checks"]}
+
+        self.assertEqual(
+            statuses,
+            {"PNG (Medium)": "ok", "SVG (Medium)": "ok", "Missing (Medium)": "missing", "QR Encode (Short)": "ok", "QR Encode (Long)": "ok"},
+        )
+        self.assertEqual((report["checked"], report["breaches"], report["missing"]), (4, 0, 1))
+
+    def test_full_run_without_overrides_breaches(self):
+        report = evaluate_budgets(make_run("full"), BUDGETS)
+        breach = report["checks"][0]
+
+        self.assertEqual(report["breaches"], 1)
+        self.assertEqual((breach["scenario"], breach["status"], breach["actual"]), ("SVG (Medium)", "breach", 300_000))
+        self.assertEqual(breach["headroom"], -0.5)
+
+    def test_no_budgets_means_no_report(self):
+        self.assertIsNone(evaluate_budgets(make_run(), None))
+
+
+class FinishReportsTests(unittest.TestCase):
+    def setUp(self):
+        budgets = evaluate_budgets(make_run("full"), BUDGETS)
+        self.breached = make_payload(runMode="full", budgets=budgets)
+        self.regressed = make_payload(
+            regressions={"regressions": [{"benchmark": "QR (Encode)", "scenario": "QR Encode (Long)", "metric": "mean"}]},
+        )
+
+    def test_clean_run_passes(self):
+        finish_reports(make_args(fail_on_regression=True), [], [make_payload()], None, True)
+
+    def test_budget_breach_fails_unless_allowed(self):
+        with self.assertRaises(SystemExit) as raised:
+            finish_reports(make_args(), [], [self.breached], None, False)
+        self.assertIn("Performance budgets breached: linux/full QR (Encode) / SVG (Medium) (maxMeanNs", raised.exception.code)
+
+        finish_reports(make_args(allow_budget_breach=True), [], [self.breached], None, False)
+
+    def test_regressions_fail_only_when_requested(self):
+        finish_reports(make_args(), [], [self.regressed], None, False)
+
+        with self.assertRaises(SystemExit) as raised:
+            finish_reports(make_args(fail_on_regression=True), [], [self.regressed], None, False)
+        self.assertEqual(raised.exception.code, "Benchmark regressions detected: linux/quick QR (Encode) / QR Encode (Long) (mean).")
+
+    def test_faster_pack_cells_are_not_regressions(self):
+        cells = [{"pack": "pack0", "scenario": "s0", "engine": "CodeGlyphX", "status": "faster"}]
+        finish_reports(make_args(fail_on_regression=True), [], [make_payload(packRunnerRegressions={"cells": cells})], None, False)
+
+        cells[0]["status"] = "slower"
+        with self.assertRaises(SystemExit):
+            finish_reports(make_args(fail_on_regression=True), [], [make_payload(packRunnerRegressions={"cells": cells})], None, False)
+
+    def test_missing_comparisons_fail_when_required(self):
+        payload = make_payload(missingComparisons=["QR (Compare)"])
+        finish_reports(make_args(), [], [payload], None, False)
+
+        with self.assertRaises(SystemExit) as raised:
+            with redirect_stderr(io.StringIO()):
+                finish_reports(make_args(), [], [payload], None, True)
+        self.assertEqual(raised.exception.code, "Missing compare results: QR (Compare).")
+
+
+class CheckBudgetsTests(unittest.TestCase):
+    def setUp(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        self.budgets = root / "budgets.json"
+        self.budgets.write_text(json.dumps(BUDGETS), encoding="utf-8")
+
+    def run_check(self, *extra):
+        argv = ["--artifacts-path", str(FIXTURES / "artifacts"), "--os-name", "linux", "--budgets", str(self.budgets), *extra]
+        output = io.StringIO()
+        with redirect_stdout(output):
+            check_budgets_main(argv)
+        return output.getvalue()
+
+    def test_breach_fails_unless_allowed(self):
+        with self.assertRaises(SystemExit) as raised:
+            self.run_check()
+        self.assertIn("Performance budgets breached: linux/full QR (Encode) / SVG (Medium) (maxMeanNs", raised.exception.code)
+
+        output = self.run_check("--allow-budget-breach")
+        self.assertIn("## linux/full net8.0", output)
+        self.assertIn("| **breach** |", output)
+
+    def test_mode_override_passes(self):
+        output = self.run_check("--run-mode", "quick")
+        self.assertIn("(overrides: quick, linux/quick); 0 breached", output)
+
+    def test_unknown_framework_exits(self):
+        with self.assertRaises(SystemExit) as raised:
+            self.run_check("--framework", "net10.0")
+        self.assertIn("No results for net10.0", raised.exception.code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import unittest
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.host import build_meta, build_run_meta, load_bdn_environment, load_run_info, parse_bdn_environment
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+HOST = FIXTURES / "host"
+
+
+class BenchmarkDotNetEnvironmentTests(unittest.TestCase):
+    def test_github_header_is_parsed(self):
+        environment = parse_bdn_environment(HOST / "results" / "CodeGlyphX.Benchmarks.QrCodeBenchmarks-report-github.md")
+
+        self.assertEqual(environment["os"], "Windows 11 (10.0.26100.2605)")
+        self.assertEqual((environment["cpuModel"], environment["logicalCores"], environment["physicalCores"]), ("AMD Ryzen 9 7950X", 32, 16))
+        self.assertEqual((environment["runtime"], environment["processArchitecture"], environment["jit"]), (".NET 8.0.11", "X64", "RyuJIT"))
+
+    def test_full_report_host_info_wins_over_the_header(self):
+        environment = load_bdn_environment(HOST / "results")
+
+        self.assertEqual(environment["runtime"], ".NET 8.0.11 (8.0.1124.51707)")
+        self.assertEqual(environment["dotnetSdk"], "9.0.101")
+        self.assertEqual(environment["isa"], "AVX-512F+CD+BW+DQ+VL+VBMI")
+
+    def test_run_info_drops_blank_values(self):
+        self.assertEqual(
+            load_run_info(HOST),
+            {"commit": "0123456789abcdef0123456789abcdef01234567", "branch": "main", "machineName": "bench-runner-win-01"},
+        )
+        self.assertIsNone(load_run_info(FIXTURES / "artifacts"))
+
+
+class RunMetaTests(unittest.TestCase):
+    def test_foreign_run_is_described_only_from_its_artifacts(self):
+        meta = build_run_meta(
+            {"commit": None, "branch": None, "dotnetSdk": None, "runtime": None},
+            load_bdn_environment(HOST / "results"),
+            load_run_info(HOST),
+            calibrate=True,
+            assume_local=False,
+        )
+
+        self.assertEqual(meta["hostSource"], "benchmarkdotnet")
+        self.assertEqual(meta["machineName"], "bench-runner-win-01")
+        self.assertEqual((meta["cpuModel"], meta["processorCount"], meta["processArchitecture"]), ("AMD Ryzen 9 7950X", 32, "X64"))
+        self.assertEqual((meta["commit"], meta["branch"], meta["dotnetSdk"]), ("0123456789abcdef0123456789abcdef01234567", "main", "9.0.101"))
+        self.assertIsNone(meta["osArchitecture"])
+        self.assertIsNone(meta["calibration"])
+        self.assertEqual(len(meta["cpuFingerprint"]), 12)
+
+    def test_invocation_values_override_run_info(self):
+        meta = build_run_meta(build_meta("fedcba", "feature", "10.0.100", None), None, load_run_info(HOST), assume_local=False)
+
+        self.assertEqual((meta["commit"], meta["branch"], meta["dotnetSdk"]), ("fedcba", "feature", "10.0.100"))
+        self.assertIsNone(meta["hostSource"])
+        self.assertIsNone(meta["cpuModel"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.common import ParseCache
+from benchmark_report.profiles import compare_disassembly, filter_disassembly, load_cpu_profiles, load_disassembly, parse_disassembly, parse_speedscope
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+ARTIFACTS = FIXTURES / "artifacts"
+SPEEDSCOPE = ARTIFACTS / "CodeGlyphX.Benchmarks.QrCodeBenchmarks.Encode-20260101-120000.speedscope.json"
+DISASSEMBLY = ARTIFACTS / "results" / "CodeGlyphX.Benchmarks.QrPipelineBenchmarks-asm.md"
+NET8 = ".NET 8.0.11 (8.0.1124.51707), X64 RyuJIT AVX2"
+NET10 = ".NET 10.0.0 (10.0.25.52411), X64 RyuJIT AVX2"
+ENTRY = "CodeGlyphX.Benchmarks.QrPipelineBenchmarks.Encode()"
+ENCODER = "CodeGlyphX.QrEncoder.Encode(System.String)"
+
+
+class SpeedscopeTests(unittest.TestCase):
+    def test_sampled_profile_weights_inclusive_and_exclusive_time(self):
+        profile = parse_speedscope(SPEEDSCOPE)
+        exclusive = {item["name"]: item["exclusive"] for item in profile["topExclusive"]}
+        inclusive = {item["name"]: item["inclusive"] for item in profile["topInclusive"]}
+
+        self.assertEqual((profile["unit"], profile["total"], profile["threads"]), ("ms", 5.0, 1))
+        self.assertEqual(profile["topExclusive"][0]["name"], "CodeGlyphX.Qr.ReedSolomon.Compute")
+        self.assertEqual(profile["topExclusive"][0]["exclusiveShare"], 0.6)
+        self.assertEqual(exclusive["CodeGlyphX.Qr.QrEncoder.Encode"], 1.0)
+        self.assertEqual(inclusive, {"CodeGlyphX.Qr.QrEncoder.Encode": 4.0, "CodeGlyphX.Qr.ReedSolomon.Compute": 3.0})
+
+    def test_namespaces_are_ranked_by_exclusive_time(self):
+        namespaces = parse_speedscope(SPEEDSCOPE)["namespaces"]
+
+        self.assertEqual([item["name"] for item in namespaces], ["CodeGlyphX.Qr", "CodeGlyphX.Benchmarks", "System.Threading"])
+        self.assertEqual(namespaces[1]["inclusiveShare"], 1.0)
+
+    def test_evented_profile_tracks_open_and_close_events(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        path = root / "evented.speedscope.json"
+        path.write_text(
+            '{"shared": {"frames": [{"name": "CodeGlyphX!CodeGlyphX.Qr.QrEncoder.Encode()"}, {"name": "CodeGlyphX!CodeGlyphX.Qr.Mask.Apply()"}]},'
+            ' "profiles": [{"type": "evented", "unit": "microseconds", "events": ['
+            '{"type": "O", "frame": 0, "at": 0}, {"type": "O", "frame": 1, "at": 1000}, {"type": "C", "frame": 1, "at": 4000}, {"type": "C", "frame": 0, "at": 5000}]}]}',
+            encoding="utf-8",
+        )
+        profile = parse_speedscope(path)
+        exclusive = {item["name"]: item["exclusive"] for item in profile["topExclusive"]}
+
+        self.assertEqual(profile["total"], 5.0)
+        self.assertEqual(exclusive, {"CodeGlyphX.Qr.Mask.Apply": 3.0, "CodeGlyphX.Qr.QrEncoder.Encode": 2.0})
+        self.assertEqual(profile["topInclusive"][0]["inclusive"], 5.0)
+
+    def test_profiles_are_named_from_the_file(self):
+        profiles = load_cpu_profiles(ARTIFACTS)
+
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual((profiles[0]["id"], profiles[0]["benchmark"], profiles[0]["method"]), ("QrCodeBenchmarks", "QR (Encode)", "Encode"))
+
+    def test_cached_profiles_match_a_fresh_parse(self):
+        root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        cache = ParseCache(root, max_bytes=1024 * 1024, max_age_seconds=3600)
+
+        first = load_cpu_profiles(ARTIFACTS, cache)
+        self.assertEqual(load_cpu_profiles(ARTIFACTS, cache), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+class DisassemblyTests(unittest.TestCase):
+    def test_methods_are_counted_per_runtime(self):
+        methods = {(item["runtime"], item["method"]): item for item in parse_disassembly(DISASSEMBLY)}
+        encoder = methods[(NET8, ENCODER)]
+
+        self.assertEqual(len(methods), 3)
+        self.assertEqual(methods[(NET8, ENTRY)]["calls"], 1)
+        self.assertEqual(methods[(NET10, ENTRY)]["codeBytes"], 12)
+        self.assertEqual(methods[(NET10, ENTRY)]["calls"], 0)
+        self.assertEqual(
+            {metric: encoder[metric] for metric in ("codeBytes", "instructions", "calls", "boundsChecks", "vectorInstructions")},
+            {"codeBytes": 48, "instructions": 8, "calls": 0, "boundsChecks": 1, "vectorInstructions": 2},
+        )
+
+    def test_load_groups_benchmarks_and_filters_by_framework(self):
+        disassembly = load_disassembly(ARTIFACTS / "results")
+        net8 = filter_disassembly(disassembly, "net8.0", "net8.0")
+
+        self.assertEqual(disassembly["methods"][0]["benchmarks"], ["QrPipelineBenchmarks.Encode"])
+        self.assertEqual(sorted(item["method"] for item in net8["methods"]), [ENTRY, ENCODER])
+        self.assertEqual([item["runtime"] for item in filter_disassembly(disassembly, "net10.0", "net8.0")["methods"]], [NET10])
+        self.assertIsNone(filter_disassembly(disassembly, "net472", "net8.0"))
+
+    def test_compare_matches_methods_by_framework_across_patch_releases(self):
+        current = filter_disassembly(load_disassembly(ARTIFACTS / "results"), "net8.0", "net8.0")
+        previous = {
+            "generatedUtc": "2026-01-01T00:00:00Z",
+            "disassembly": {
+                "methods": [
+                    dict(item, runtime=".NET 8.0.10 (8.0.1024.46610), X64 RyuJIT AVX2", codeBytes=item["codeBytes"] + 8, vectorInstructions=0)
+                    if item["method"] == ENCODER
+                    else dict(item, runtime=".NET 8.0.10 (8.0.1024.46610), X64 RyuJIT AVX2")
+                    for item in current["methods"]
+                ]
+                + [{"method": ENTRY, "runtime": NET10, "codeBytes": 40, "instructions": 9, "calls": 2, "boundsChecks": 0, "vectorInstructions": 0, "benchmarks": []}],
+            },
+        }
+        report = compare_disassembly(current, previous)
+
+        self.assertEqual(report["compared"], 2)
+        self.assertEqual(len(report["changes"]), 1)
+        change = report["changes"][0]
+        self.assertEqual((change["method"], change["runtime"]), (ENCODER, NET8))
+        self.assertEqual(change["deltas"], {"codeBytes": -8, "vectorInstructions": 2})
+        self.assertEqual(change["notes"], ["vectorized"])
+        self.assertEqual(report["added"], [])
+        self.assertEqual(report["removed"], [ENTRY])
+
+    def test_compare_without_history_is_skipped(self):
+        disassembly = load_disassembly(ARTIFACTS / "results")
+
+        self.assertIsNone(compare_disassembly(disassembly, None))
+        self.assertIsNone(compare_disassembly(disassembly, {"disassembly": None}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.platforms import get_runtime_payload, store_primary_payload
+from benchmark_report.report import SUMMARY_SHARD_FIELDS, write_website_shards
+
+
+def make_payload(**overrides):
+    payload = {
+        "generatedUtc": "2026-01-01T00:00:00+00:00",
+        "schemaVersion": 1,
+        "os": "linux",
+        "artifacts": "/tmp/artifacts",
+        "framework": "net8.0",
+        "runMode": "quick",
+        "publish": False,
+        "meta": {"commit": "abc"},
+        "notes": ["note"],
+        "summary": [{"benchmark": "QR (Encode)", "scenario": "PNG (Medium)"}],
+        "comparisons": [{"id": "QrCompareBenchmarks", "title": "QR (Encode)", "scenarios": []}],
+        "baseline": [{"id": "QrCodeBenchmarks", "title": "QR", "rows": []}],
+        "packRunner": {"packs": [], "scenarios": [{"name": "clean"}]},
+        "hotFrames": [{"benchmark": "QR (Encode)"}],
+        "scaling": [],
+        "regressions": None,
+    }
+    payload.update(overrides)
+    return payload
+
+
+class WebsiteShardTests(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def read(self, path: str):
+        return json.loads((self.root / path).read_text(encoding="utf-8"))
+
+    def test_summary_holds_only_headline_fields(self):
+        manifest = write_website_shards(self.root, {"linux": {"quick": make_payload()}})
+        entry = manifest["entries"]["linux"]["quick"]
+        summary = self.read(entry["summary"])
+
+        self.assertEqual(set(summary) - set(SUMMARY_SHARD_FIELDS), {"artifacts", "regressions"})
+        self.assertEqual(summary["summary"], make_payload()["summary"])
+        self.assertEqual([(item["section"], item["id"]) for item in entry["details"]], [("comparisons", "QrCompareBenchmarks"), ("baseline", "QrCodeBenchmarks")])
+        self.assertIsNone(manifest["entries"]["windows"]["quick"])
+
+    def test_heavy_sections_get_their_own_shards(self):
+        entry = write_website_shards(self.root, {"linux": {"quick": make_payload()}})["entries"]["linux"]["quick"]
+
+        self.assertEqual(sorted(entry["sections"]), ["hotFrames", "packRunner"])
+        self.assertEqual(self.read(entry["sections"]["packRunner"]), make_payload()["packRunner"])
+        self.assertTrue((self.root / (entry["sections"]["packRunner"] + ".gz")).exists())
+
+    def test_only_the_current_manifest_shards_are_kept(self):
+        write_website_shards(self.root, {"linux": {"quick": make_payload()}})
+        manifest = write_website_shards(self.root, {"linux": {"quick": make_payload(generatedUtc="2026-01-02T00:00:00+00:00", notes=["changed"])}})
+        entry = manifest["entries"]["linux"]["quick"]
+        referenced = {Path(path).name for path in [entry["summary"], *(item["path"] for item in entry["details"]), *entry["sections"].values()]}
+        kept = {path.name.removesuffix(".gz").removesuffix(".br") for path in (self.root / "benchmark").iterdir()}
+
+        self.assertEqual(kept, referenced)
+        self.assertEqual(json.loads((self.root / "benchmark-manifest.json").read_text(encoding="utf-8")), manifest)
+
+
+class PrimaryPayloadTests(unittest.TestCase):
+    def test_primary_of_another_framework_moves_to_runtimes(self):
+        old = make_payload()
+        data = {"linux": {"quick": old}}
+        new = make_payload(framework="net10.0", generatedUtc="2026-02-01T00:00:00+00:00")
+        store_primary_payload(data, new)
+
+        self.assertIs(data["linux"]["quick"], new)
+        self.assertEqual(get_runtime_payload(data, "linux", "quick", "net8.0"), old)
+
+    def test_primary_replaces_its_own_framework_and_stale_runtime_copy(self):
+        data = {"linux": {"quick": make_payload()}, "runtimes": {"linux": {"quick": {"net10.0": make_payload(framework="net10.0")}}}}
+        new = make_payload(generatedUtc="2026-02-01T00:00:00+00:00")
+        store_primary_payload(data, new)
+
+        self.assertIs(data["linux"]["quick"], new)
+        self.assertEqual(data["runtimes"]["linux"]["quick"], {"net10.0": make_payload(framework="net10.0")})
+
+        newer = make_payload(framework="net10.0", generatedUtc="2026-03-01T00:00:00+00:00")
+        store_primary_payload(data, newer)
+        self.assertIs(data["linux"]["quick"], newer)
+        self.assertEqual(list(data["runtimes"]["linux"]["quick"]), ["net8.0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
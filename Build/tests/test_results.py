@@ -0,0 +1,134 @@
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+BUILD_DIR = Path(__file__).resolve().parents[1]
+if str(BUILD_DIR) not in sys.path:
+    sys.path.insert(0, str(BUILD_DIR))
+
+from benchmark_report.common import ParseCache
+from benchmark_report.results import ingest_all, ingest_artifacts, load_benchmark_report, load_run_results, warn_framework_mismatch
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+RESULTS = FIXTURES / "artifacts" / "results"
+
+
+class ParseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.cache = ParseCache(self.root / "cache", max_bytes=1024 * 1024, max_age_seconds=3600)
+
+    def test_identical_content_under_different_names_gets_separate_entries(self):
+        first = self.root / "CodeGlyphX.Benchmarks.QrCodeBenchmarks-report.csv"
+        second = self.root / "CodeGlyphX.Benchmarks.AztecCodeBenchmarks-report.csv"
+        shutil.copyfile(RESULTS / "CodeGlyphX.Benchmarks.QrCodeBenchmarks-report.csv", first)
+        shutil.copyfile(first, second)
+
+        self.assertNotEqual(self.cache.entry_path("baseline-csv", first), self.cache.entry_path("baseline-csv", second))
+        self.assertEqual(load_benchmark_report(first, False, self.cache).id, "QrCodeBenchmarks")
+        self.assertEqual(load_benchmark_report(second, False, self.cache).id, "AztecCodeBenchmarks")
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_second_parse_is_a_hit_with_the_same_rows(self):
+        path = RESULTS / "CodeGlyphX.Benchmarks.QrCompareBenchmarks-report.csv"
+        fresh = load_benchmark_report(path, True, self.cache)
+        cached = load_benchmark_report(path, True, self.cache)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(cached.path, path)
+        self.assertEqual(cached.rows, fresh.rows)
+        self.assertEqual(sorted(cached.scenarios), ["PNG (Medium)", "SVG (Medium)"])
+
+    def test_companion_changes_invalidate_the_entry(self):
+        path = self.root / "report.csv"
+        companion = self.root / "report-full.json"
+        path.write_text("Method\n", encoding="utf-8")
+        companion.write_text("{}", encoding="utf-8")
+        before = self.cache.entry_path("compare-csv", path, (companion,))
+        companion.write_text('{"Benchmarks": []}', encoding="utf-8")
+
+        self.assertNotEqual(before, self.cache.entry_path("compare-csv", path, (companion,)))
+
+
+class IngestAllTests(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="benchmark-report-tests-"))
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.paths = []
+        for name in ("linux-20260101-120000", "linux-20260102-120000"):
+            shutil.copytree(RESULTS, self.root / name / "results")
+            self.paths.append(self.root / name)
+
+    def test_parallel_workers_report_their_cache_use_to_the_parent(self):
+        cache = ParseCache(self.root / "cache", max_bytes=1024 * 1024, max_age_seconds=3600)
+        runs = ingest_all(self.paths, "linux", "quick", cache, jobs=2)
+        misses = cache.misses
+        entries = sorted((self.root / "cache").glob("*/*.json"))
+
+        self.assertEqual([run.artifacts_path for run in runs], self.paths)
+        self.assertGreater(misses, 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertTrue(entries)
+
+        rerun = ParseCache(self.root / "cache", max_bytes=1024 * 1024, max_age_seconds=3600)
+        again = ingest_all(self.paths, "linux", "quick", rerun, jobs=2)
+
+        self.assertEqual((rerun.hits, rerun.misses), (misses, 0))
+        self.assertEqual(sorted((self.root / "cache").glob("*/*.json")), entries)
+        self.assertEqual([run.results.comparisons[0].rows for run in again], [run.results.comparisons[0].rows for run in runs])
+
+    def test_parallel_and_serial_ingest_match(self):
+        serial = ingest_all(self.paths, "linux", "quick", None, jobs=1)
+        parallel = ingest_all(self.paths, "linux", "quick", None, jobs=2)
+
+        self.assertEqual([run.results for run in parallel], [run.results for run in serial])
+
+
+class LoadRunResultsTests(unittest.TestCase):
+    def test_compare_rows_are_split_by_vendor_and_scenario(self):
+        results = load_run_results(RESULTS)
+        compare = next(report for report in results.comparisons if report.id == "QrCompareBenchmarks")
+        png = compare.scenarios["PNG (Medium)"]
+
+        self.assertEqual(sorted(png), ["CodeGlyphX", "QRCoder", "ZXing.Net"])
+        self.assertEqual(png["CodeGlyphX"].mean_ns, 120_000)
+        self.assertEqual(png["CodeGlyphX"].allocated_bytes, 16 * 1024)
+        self.assertEqual(png["CodeGlyphX"].runtime, ".NET 8.0")
+
+    def test_baseline_rows_are_attributed_to_codeglyphx(self):
+        results = load_run_results(RESULTS)
+        baseline = next(report for report in results.baseline if report.id == "QrCodeBenchmarks")
+
+        self.assertEqual([row.vendor for row in baseline.rows], ["CodeGlyphX", "CodeGlyphX"])
+        self.assertEqual(baseline.rows[1].mean_ns, 2_000_000)
+
+    def test_missing_results_folder_exits(self):
+        with self.assertRaises(SystemExit):
+            load_run_results(FIXTURES / "missing")
+
+
+class FrameworkMismatchTests(unittest.TestCase):
+    def warnings_for(self, framework: str) -> str:
+        run = ingest_artifacts(FIXTURES / "artifacts", "linux", None)
+        output = io.StringIO()
+        with redirect_stderr(output):
+            warn_framework_mismatch([run], framework)
+        return output.getvalue()
+
+    def test_matching_framework_is_silent(self):
+        self.assertEqual(self.warnings_for("net8.0"), "")
+
+    def test_framework_not_in_runtime_column_warns(self):
+        warnings = self.warnings_for("net10.0")
+
+        self.assertIn("--framework net10.0 does not match the Runtime column", warnings)
+        self.assertIn("(net8.0)", warnings)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,10 @@ namespace CodeGlyphX.Benchmarks;
 [SimpleJob(RuntimeMoniker.Net80)]
 #endif
 [MemoryDiagnoser]
+#if BENCH_DISASM
+// Hot loops reached from here: Reed-Solomon ECC, mask penalty scoring and PNG scanline filters.
+[DisassemblyDiagnoser(maxDepth: 3, exportGithubMarkdown: true, filters: new[] { "*ReedSolomon*", "*QrMask*", "*PngRenderHelpers*" })]
+#endif
 [RankColumn]
 public class QrCodeBenchmarks
 {
@@ -11,6 +11,9 @@ namespace CodeGlyphX.Benchmarks;
 [SimpleJob(RuntimeMoniker.Net80)]
 #endif
 [MemoryDiagnoser]
+#if BENCH_DISASM
+[DisassemblyDiagnoser(maxDepth: 3, exportGithubMarkdown: true, filters: new[] { "*ReedSolomon*", "*QrMask*", "*PngRenderHelpers*" })]
+#endif
 [RankColumn]
 public class QrPipelineBenchmarks
 {
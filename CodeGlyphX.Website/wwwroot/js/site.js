@@ -148,27 +148,55 @@ globalThis.setTheme = setTheme;
         }
     }
 
+    const SUMMARY_ORDER = [
+        ['windows', 'quick'],
+        ['windows', 'full'],
+        ['linux', 'quick'],
+        ['linux', 'full'],
+        ['macos', 'quick'],
+        ['macos', 'full'],
+    ];
     let benchSummaryPromise = null;
+    function loadBenchmarkJson(url, cacheMode) {
+        return fetch(url, { cache: cacheMode || 'no-store' })
+            .then((res) => (res.ok ? res.json() : null))
+            .catch(() => null);
+    }
+
+    // The manifest is only trusted when it is at least as new as every entry in the index.
+    function isManifestCurrent(manifest, index) {
+        if (!manifest?.entries) return false;
+        return (index?.entries || []).every((entry) => {
+            const info = manifest.entries[String(entry.os || '').toLowerCase()]?.[String(entry.runMode || '').toLowerCase()];
+            return !!info && !(Date.parse(info.generatedUtc) < Date.parse(entry.generatedUtc));
+        });
+    }
+
+    function loadManifestSummary(manifest) {
+        for (const [os, mode] of SUMMARY_ORDER) {
+            const info = manifest.entries[os]?.[mode];
+            if (!info?.hasData || !info.summary) continue;
+            // Shards are content-hash named and never change, so the browser cache can keep them.
+            return loadBenchmarkJson('/data/' + info.summary, 'force-cache')
+                .then((entry) => (entry ? { [os]: { [mode]: entry } } : null));
+        }
+        return Promise.resolve(null);
+    }
+
     function loadBenchmarkSummary() {
         if (!benchSummaryPromise) {
-            benchSummaryPromise = fetch('/data/benchmark-summary.json', { cache: 'no-store' })
-                .then((res) => (res.ok ? res.json() : null))
-                .catch(() => null);
+            benchSummaryPromise = Promise.all([
+                loadBenchmarkJson('/data/benchmark-manifest.json'),
+                loadBenchmarkJson('/data/benchmark-index.json')
+            ]).then(([manifest, index]) => (isManifestCurrent(manifest, index) ? loadManifestSummary(manifest) : null))
+                .then((data) => (pickBenchmarkSummary(data) ? data : loadBenchmarkJson('/data/benchmark-summary.json')));
         }
         return benchSummaryPromise;
     }
 
     function pickBenchmarkSummary(data) {
         if (!data) return null;
-        const order = [
-            ['windows', 'quick'],
-            ['windows', 'full'],
-            ['linux', 'quick'],
-            ['linux', 'full'],
-            ['macos', 'quick'],
-            ['macos', 'full'],
-        ];
-        for (const [os, mode] of order) {
+        for (const [os, mode] of SUMMARY_ORDER) {
             const entry = data?.[os]?.[mode];
             if (entry?.summary?.length) return entry;
         }